@@ -0,0 +1,79 @@
+"""Compare retained bytes per asset for ``Asset`` versus ``CompactAsset``.
+
+Run from ``services/workers``::
+
+    PYTHONPATH=src python benchmarks/asset_memory.py --count 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import random
+import tracemalloc
+from typing import Callable, Dict, List
+
+from context_workers.compact import CompactAsset
+from context_workers.models import Asset
+
+SOURCES = ['instagram', 'tiktok', 'youtube', 'x']
+LANGUAGES = ['en', 'es', 'fr', 'pt', None]
+LABELS = ['sports', 'crowd', 'night', 'explicit']
+TAGS = ['worldcup', 'mercado', 'fans', 'stadium', 'metro', 'goal']
+
+
+def synthetic_lines(count: int, seed: int = 13) -> List[str]:
+    """NDJSON lines, so every record decodes into fresh strings as the streaming loader does."""
+
+    rng = random.Random(seed)
+    lines = []
+    for index in range(count):
+        lines.append(json.dumps({
+            'id': f'asset-{index}',
+            'source': rng.choice(SOURCES),
+            'url': f'https://cdn.example.com/{index}.jpg',
+            'caption': f'Highlight {index % 500}',
+            'language': rng.choice(LANGUAGES),
+            'moderation_labels': rng.sample(LABELS, rng.randint(0, 2)),
+            'is_flagged': rng.random() < 0.02,
+            'metrics': {
+                'views': rng.randint(0, 50_000),
+                'likes': rng.randint(0, 5_000),
+                'comments': rng.randint(0, 500),
+                'shares': rng.randint(0, 300),
+            },
+            'tags': rng.sample(TAGS, 2),
+            'extra': {'timestamp_score': round(rng.random(), 3)},
+        }))
+    return lines
+
+
+def retained_bytes(lines: List[str], factory: Callable[[Dict[str, object]], object]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    built = [factory(json.loads(line)) for line in lines]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del built
+    return after - before
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=100_000)
+    args = parser.parse_args()
+
+    lines = synthetic_lines(args.count)
+    results = {
+        'Asset': retained_bytes(lines, lambda record: Asset(**record)),
+        'CompactAsset': retained_bytes(lines, CompactAsset.from_record),
+    }
+    baseline = results['Asset']
+    for name, total in results.items():
+        print(f'{name:<13} {total / args.count:8.1f} bytes/asset  ({total / baseline:5.1%} of Asset)')
+
+
+if __name__ == '__main__':
+    main()
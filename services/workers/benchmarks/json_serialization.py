@@ -0,0 +1,68 @@
+"""Compare JSON backends when serializing and storing render artifacts.
+
+Times the four documents ``LocalRenderStorage.store`` writes (manifest, payload,
+storyboard, response) for each installed backend, indented and compact.
+Run from ``services/workers``::
+
+    PYTHONPATH=src python benchmarks/json_serialization.py --segments 30 --locales 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from context_workers import serialization
+from context_workers.serialization import JSON_BACKENDS, create_serializer
+from context_workers.storage import LocalRenderStorage, StorageConfig
+from context_workers.video_assembly import CreatomateRenderConfig, CreatomateRenderer
+from storyboard_serialization import synthetic_storyboard
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--segments', type=int, default=30)
+    parser.add_argument('--locales', type=int, default=8)
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    storyboard = synthetic_storyboard(args.segments, args.locales)
+    renderer = CreatomateRenderer(CreatomateRenderConfig(template_id='tmpl-bench'))
+    payload = renderer.build_render_payload(storyboard)
+    manifest = renderer.create_manifest(storyboard, payload)
+    response = {'id': 'render-bench', 'status': 'succeeded', 'url': 'https://cdn.example.com/render.mp4'}
+    documents = [manifest, payload, storyboard.to_dict(), response]
+
+    previous = serialization.get_serializer()
+    print(f'{"backend":<9} {"mode":<8} {"serialize":>12} {"store":>12} {"bytes":>10}')
+    try:
+        for name in JSON_BACKENDS:
+            try:
+                serializer = create_serializer(name)
+            except RuntimeError:
+                print(f'{name:<9} (not installed)')
+                continue
+            serialization.set_serializer(serializer)
+            for compact in (False, True):
+                started = time.perf_counter()
+                for _ in range(args.repeat):
+                    size = sum(len(serializer.dumps(document, compact=compact)) for document in documents)
+                serialize_ms = (time.perf_counter() - started) * 1000 / args.repeat
+
+                with tempfile.TemporaryDirectory() as root:
+                    storage = LocalRenderStorage(StorageConfig(output_dir=Path(root), compact_json=compact))
+                    started = time.perf_counter()
+                    for _ in range(args.repeat):
+                        storage.store(storyboard=storyboard, render_payload=payload, manifest=manifest, render_response=response)
+                    store_ms = (time.perf_counter() - started) * 1000 / args.repeat
+
+                mode = 'compact' if compact else 'indented'
+                print(f'{name:<9} {mode:<8} {serialize_ms:9.3f} ms {store_ms:9.3f} ms {size:10,}')
+    finally:
+        serialization.set_serializer(previous)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""Compare serial and parallel scene-labelling throughput.
+
+Run from ``services/workers``::
+
+    PYTHONPATH=src python benchmarks/labelling_throughput.py --count 200000 --workers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import Callable, List
+
+from context_workers.cli import DEFAULT_SCENE_KEYWORDS
+from context_workers.models import Asset
+from context_workers.scene_labelling import (
+    CompiledKeywordSceneLabeler,
+    KeywordSceneLabeler,
+    apply_scene_labels,
+    apply_scene_labels_parallel,
+)
+
+WORDS = [
+    'fans', 'flooding', 'mercado', 'match', 'ferry', 'dock', 'halftime', 'fireworks', 'tapas',
+    'brunch', 'metro', 'ride', 'stadium', 'crowd', 'sunset', 'cheering', 'skyline', 'drums',
+]
+
+
+def synthetic_assets(count: int, seed: int = 5) -> List[Asset]:
+    rng = random.Random(seed)
+    return [
+        Asset(
+            id=f'asset-{index}',
+            source='instagram',
+            url=f'https://cdn.example.com/{index}.jpg',
+            caption=' '.join(rng.choice(WORDS) for _ in range(rng.randint(6, 24))),
+            tags=rng.sample(['worldcup', 'mercado', 'fans', 'transit'], 2),
+        )
+        for index in range(count)
+    ]
+
+
+def timed(label: str, count: int, run: Callable[[], List[Asset]]) -> float:
+    started = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - started
+    print(f'{label:<36} {elapsed:7.3f}s  {count / elapsed:12,.0f} assets/s')
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=200_000)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--chunk-size', type=int, default=2048)
+    args = parser.parse_args()
+
+    assets = synthetic_assets(args.count)
+    for name, labeler in (
+        ('KeywordSceneLabeler', KeywordSceneLabeler(DEFAULT_SCENE_KEYWORDS)),
+        ('CompiledKeywordSceneLabeler', CompiledKeywordSceneLabeler(DEFAULT_SCENE_KEYWORDS)),
+    ):
+        print(name)
+        timed('  serial', args.count, lambda: apply_scene_labels(assets, labeler))
+        timed(
+            f'  {args.workers} processes',
+            args.count,
+            lambda: apply_scene_labels_parallel(assets, labeler, workers=args.workers, chunk_size=args.chunk_size),
+        )
+        timed(
+            f'  {args.workers} threads',
+            args.count,
+            lambda: apply_scene_labels_parallel(
+                assets, labeler, workers=args.workers, chunk_size=args.chunk_size, use_threads=True
+            ),
+        )
+
+
+if __name__ == '__main__':
+    main()
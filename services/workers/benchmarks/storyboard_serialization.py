@@ -0,0 +1,88 @@
+"""Compare repeated ``Storyboard.to_dict`` calls with the cached serialized view.
+
+One render serializes the storyboard for the manifest, the CLI output and storage.
+Run from ``services/workers``::
+
+    PYTHONPATH=src python benchmarks/storyboard_serialization.py --segments 30 --locales 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Callable
+
+from context_workers.accessibility import StaticAccessibilityGenerator
+from context_workers.extraction import build_highlight_narrative
+from context_workers.localization import generate_accessibility_assets, generate_voiceovers_and_subtitles
+from context_workers.models import Asset, ExtractionConfig
+from context_workers.translation import StaticTranslator
+from context_workers.video_assembly import CreatomateRenderConfig, CreatomateRenderer, PoiContext, Storyboard
+
+# Before the cached view: create_manifest (3), the CLI output (1) and storage (1).
+SERIALIZATIONS_PER_RENDER = 5
+LOCALES = ['en', 'es', 'fr', 'pt', 'de', 'it', 'ja', 'ar', 'ko', 'nl', 'zh', 'hi']
+
+
+def synthetic_storyboard(segments: int, locales: int) -> Storyboard:
+    """A fully localized storyboard with ``segments`` clips in ``locales`` locales."""
+
+    assets = [
+        Asset(
+            id=f'asset-{index}',
+            source='instagram',
+            url=f'https://cdn.example.com/{index}.mp4',
+            caption=f'Fans celebrate moment {index} along the Hudson waterfront before kickoff',
+            metrics={'likes': 100 + index, 'comments': 10, 'shares': 5, 'views': 5000},
+            tags=['fans', 'worldcup'],
+        )
+        for index in range(segments)
+    ]
+    narrative = build_highlight_narrative(assets, ExtractionConfig(frame_sample_size=segments))
+    renderer = CreatomateRenderer(CreatomateRenderConfig(template_id='tmpl-bench'))
+    storyboard = renderer.build_storyboard(narrative, assets, PoiContext(id='poi-bench', name='Bench POI'))
+    chosen = (LOCALES * (locales // len(LOCALES) + 1))[:locales]
+    generate_voiceovers_and_subtitles(storyboard, chosen, audio_prefix=None, translator=StaticTranslator())
+    generate_accessibility_assets(storyboard, chosen, generator=StaticAccessibilityGenerator())
+    return storyboard
+
+
+def render_outputs(storyboard: Storyboard, *, cached: bool) -> None:
+    for _ in range(SERIALIZATIONS_PER_RENDER):
+        if not cached:
+            storyboard.invalidate()
+        storyboard.to_dict()
+
+
+def timed(label: str, repeat: int, run: Callable[[], None]) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        run()
+    elapsed = (time.perf_counter() - started) / repeat
+    print(f'{label:<28} {elapsed * 1000:8.3f} ms/render')
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--segments', type=int, default=30)
+    parser.add_argument('--locales', type=int, default=8)
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+
+    storyboard = synthetic_storyboard(args.segments, args.locales)
+
+    def uncached() -> None:
+        render_outputs(storyboard, cached=False)
+
+    def cached() -> None:
+        storyboard.invalidate()
+        render_outputs(storyboard, cached=True)
+
+    baseline = timed('rebuild on every to_dict()', args.repeat, uncached)
+    shared = timed('cached serialized view', args.repeat, cached)
+    print(f'speedup: {baseline / shared:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
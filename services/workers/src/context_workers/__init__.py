@@ -1,6 +1,9 @@
 """ContextCity Content Intelligence Workers."""
 
-from .filtering import filter_assets, rank_assets
+from .asset_stream import iter_assets
+from .compact import CompactAsset, CompactMetrics
+from .filtering import filter_assets, rank_assets, select_top_assets, top_k_assets
+from .columnar import AssetTable, filter_assets_columnar, rank_assets_columnar, top_k_assets_columnar
 from .extraction import build_highlight_narrative
 from .models import (
     Asset,
@@ -13,35 +16,50 @@ from .models import (
     LocaleNarration,
     AccessibilityAssets,
 )
-from .preferences import PreferenceResult, detect_preferences
+from .preferences import PreferenceResult, PreferenceTracker, detect_preferences
+from .transport import AsyncHTTPTransport, HTTPTransport, TransportError, get_async_transport, get_transport
 from .scene_labelling import (
     SceneLabeler,
     KeywordSceneLabeler,
+    CompiledKeywordSceneLabeler,
+    LabelBatch,
     apply_scene_labels,
+    apply_scene_labels_parallel,
+    label_batch,
 )
 from .narrative import (
     ScriptGenerator,
+    AsyncScriptGenerator,
     StaticScriptGenerator,
     create_script_generator,
+    create_async_script_generator,
 )
 from .codexierge import CodexiergeGenerator
 from .summarization import (
     Summarizer,
     StaticSummarizer,
     ScreenAppSummarizer,
+    AsyncSummarizer,
     create_summarizer,
+    create_async_summarizer,
 )
 from .translation import (
     Translator,
     TranslationItem,
     StaticTranslator,
     GPTTranslator,
+    AsyncTranslator,
+    AsyncGPTTranslator,
     create_translator,
+    create_async_translator,
 )
+from .translation_cache import CachedTranslator, SQLiteTranslationCache
 from .tts import (
     TTSSynthesizer,
     TTSRequestItem,
+    AsyncTTSSynthesizer,
     create_tts_synthesizer,
+    create_async_tts_synthesizer,
 )
 from .accessibility import (
     AccessibilityGenerator,
@@ -49,7 +67,15 @@ from .accessibility import (
     AccessibilityFields,
     StaticAccessibilityGenerator,
     GPTAccessibilityGenerator,
+    AsyncAccessibilityGenerator,
     create_accessibility_generator,
+    create_async_accessibility_generator,
+)
+from .async_support import AsyncRunner, to_async, to_sync
+from .async_pipeline import (
+    AsyncPipelineProviders,
+    PipelineResult,
+    run_pipeline_async,
 )
 from .video_assembly import (
     CreatomateError,
@@ -59,6 +85,8 @@ from .video_assembly import (
     Storyboard,
     StoryboardSegment,
 )
+from .render_index import RenderIndex, RenderRecord
+from .render_jobs import RenderJob, RenderJobQueue, RenderWorkerPool
 from .storage import (
     StorageConfig,
     StorageResult,
@@ -69,8 +97,17 @@ from .storage import (
 )
 
 __all__ = [
+    'iter_assets',
+    'CompactAsset',
+    'CompactMetrics',
     'filter_assets',
     'rank_assets',
+    'select_top_assets',
+    'top_k_assets',
+    'AssetTable',
+    'filter_assets_columnar',
+    'rank_assets_columnar',
+    'top_k_assets_columnar',
     'build_highlight_narrative',
     'Asset',
     'AssetMetrics',
@@ -84,40 +121,74 @@ __all__ = [
     'PreferenceResult',
     'SceneLabeler',
     'KeywordSceneLabeler',
+    'CompiledKeywordSceneLabeler',
+    'LabelBatch',
     'apply_scene_labels',
+    'apply_scene_labels_parallel',
+    'label_batch',
     'ScriptGenerator',
+    'AsyncScriptGenerator',
     'StaticScriptGenerator',
     'create_script_generator',
+    'create_async_script_generator',
     'CodexiergeGenerator',
     'Summarizer',
     'StaticSummarizer',
     'ScreenAppSummarizer',
+    'AsyncSummarizer',
     'create_summarizer',
+    'create_async_summarizer',
     'Translator',
     'TranslationItem',
     'StaticTranslator',
     'GPTTranslator',
+    'AsyncTranslator',
+    'AsyncGPTTranslator',
     'create_translator',
+    'create_async_translator',
+    'CachedTranslator',
+    'SQLiteTranslationCache',
     'TTSSynthesizer',
     'TTSRequestItem',
+    'AsyncTTSSynthesizer',
     'create_tts_synthesizer',
+    'create_async_tts_synthesizer',
     'AccessibilityGenerator',
     'AccessibilityItem',
     'AccessibilityFields',
     'StaticAccessibilityGenerator',
     'GPTAccessibilityGenerator',
+    'AsyncAccessibilityGenerator',
     'create_accessibility_generator',
+    'create_async_accessibility_generator',
+    'AsyncRunner',
+    'to_async',
+    'to_sync',
+    'AsyncPipelineProviders',
+    'PipelineResult',
+    'run_pipeline_async',
     'CreatomateError',
     'CreatomateRenderConfig',
     'CreatomateRenderer',
     'PoiContext',
     'Storyboard',
     'StoryboardSegment',
+    'RenderIndex',
+    'RenderRecord',
+    'RenderJob',
+    'RenderJobQueue',
+    'RenderWorkerPool',
     'StorageConfig',
     'StorageResult',
     'LocalRenderStorage',
     'GCSRenderStorage',
     'CreatomateCopyError',
     'create_storage',
+    'PreferenceTracker',
     'detect_preferences',
+    'HTTPTransport',
+    'AsyncHTTPTransport',
+    'TransportError',
+    'get_transport',
+    'get_async_transport',
 ]
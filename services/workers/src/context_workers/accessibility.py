@@ -1,13 +1,19 @@
 from __future__ import annotations
 
-import json
 import logging
 import os
-import urllib.error
-import urllib.request
 from dataclasses import dataclass
 from typing import Dict, Iterable, List, Optional, Protocol
 
+from .transport import (
+    AsyncHTTPTransport,
+    HTTPTransport,
+    TransportError,
+    bearer_headers,
+    get_async_transport,
+    get_transport,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -72,8 +78,19 @@ class StaticAccessibilityGenerator:
         return assets
 
 
-class GPTAccessibilityGenerator:
-    """Calls a GPT-5 endpoint to author accessibility narration and cues."""
+class AsyncAccessibilityGenerator(Protocol):
+    """Async interface for accessibility asset generators."""
+
+    async def generate(
+        self,
+        items: Iterable[AccessibilityItem],
+        *,
+        target_locale: str,
+    ) -> Dict[str, AccessibilityFields]: ...
+
+
+class _GPTAccessibilityClient:
+    """Request building and response parsing shared by the sync and async GPT generators."""
 
     def __init__(
         self,
@@ -88,13 +105,8 @@ class GPTAccessibilityGenerator:
         self.timeout_seconds = timeout_seconds
         self.max_attempts = max(1, max_attempts)
 
-    def generate(
-        self,
-        items: Iterable[AccessibilityItem],
-        *,
-        target_locale: str,
-    ) -> Dict[str, AccessibilityFields]:
-        payload_items = [
+    def _payload_items(self, items: Iterable[AccessibilityItem]) -> List[Dict[str, object]]:
+        return [
             {
                 'id': item.id,
                 'clip_title': item.clip_title,
@@ -107,53 +119,11 @@ class GPTAccessibilityGenerator:
             }
             for item in items
         ]
-        if not payload_items:
-            return {}
-
-        attempt = 0
-        response_data: Optional[Dict[str, object]] = None
-        while attempt < self.max_attempts:
-            attempt += 1
-            try:
-                response_data = self._call_service(payload_items, target_locale)
-                break
-            except urllib.error.URLError as error:
-                logger.warning(
-                    'Accessibility request failed (attempt %s/%s): %s',
-                    attempt,
-                    self.max_attempts,
-                    error,
-                )
-
-        if not response_data:
-            return {}
-        return self._parse_response(response_data)
-
-    def _call_service(
-        self,
-        payload_items: List[Dict[str, object]],
-        target_locale: str,
-    ) -> Dict[str, object]:
-        request_payload = {
-            'target_locale': target_locale,
-            'items': payload_items,
-        }
-
-        request = urllib.request.Request(
-            self.endpoint,
-            data=json.dumps(request_payload).encode('utf-8'),
-            headers={
-                'Content-Type': 'application/json',
-                'Authorization': f'Bearer {self.api_key}',
-            },
-        )
-
-        with urllib.request.urlopen(request, timeout=self.timeout_seconds) as response:
-            raw = response.read().decode('utf-8')
-        return json.loads(raw)
 
     def _parse_response(self, payload: Dict[str, object]) -> Dict[str, AccessibilityFields]:
         results: Dict[str, AccessibilityFields] = {}
+        if not payload:
+            return results
         entries = payload.get('items')
         if not isinstance(entries, list):
             return results
@@ -179,6 +149,99 @@ class GPTAccessibilityGenerator:
         return results
 
 
+class GPTAccessibilityGenerator(_GPTAccessibilityClient):
+    """Calls a GPT-5 endpoint to author accessibility narration and cues."""
+
+    def __init__(
+        self,
+        endpoint: str,
+        api_key: str,
+        *,
+        timeout_seconds: float = 12.0,
+        max_attempts: int = 2,
+        transport: Optional[HTTPTransport] = None,
+    ) -> None:
+        super().__init__(endpoint, api_key, timeout_seconds=timeout_seconds, max_attempts=max_attempts)
+        self.transport = transport or get_transport()
+
+    def generate(
+        self,
+        items: Iterable[AccessibilityItem],
+        *,
+        target_locale: str,
+    ) -> Dict[str, AccessibilityFields]:
+        payload_items = self._payload_items(items)
+        if not payload_items:
+            return {}
+
+        try:
+            response_data = self._call_service(payload_items, target_locale)
+        except TransportError as error:
+            logger.warning('Accessibility request failed after %s attempts: %s', self.max_attempts, error)
+            return {}
+        return self._parse_response(response_data)
+
+    def _call_service(
+        self,
+        payload_items: List[Dict[str, object]],
+        target_locale: str,
+    ) -> Dict[str, object]:
+        request_payload = {
+            'target_locale': target_locale,
+            'items': payload_items,
+        }
+        return self.transport.post_json(
+            self.endpoint,
+            request_payload,
+            headers=bearer_headers(self.api_key),
+            timeout=self.timeout_seconds,
+            max_attempts=self.max_attempts,
+        )
+
+
+class AsyncGPTAccessibilityGenerator(_GPTAccessibilityClient):
+    """Async GPT-5 accessibility client; uses the running loop's shared transport unless one is given."""
+
+    def __init__(
+        self,
+        endpoint: str,
+        api_key: str,
+        *,
+        timeout_seconds: float = 12.0,
+        max_attempts: int = 2,
+        transport: Optional[AsyncHTTPTransport] = None,
+    ) -> None:
+        super().__init__(endpoint, api_key, timeout_seconds=timeout_seconds, max_attempts=max_attempts)
+        self._transport = transport
+
+    @property
+    def transport(self) -> AsyncHTTPTransport:
+        return self._transport or get_async_transport()
+
+    async def generate(
+        self,
+        items: Iterable[AccessibilityItem],
+        *,
+        target_locale: str,
+    ) -> Dict[str, AccessibilityFields]:
+        payload_items = self._payload_items(items)
+        if not payload_items:
+            return {}
+
+        try:
+            response_data = await self.transport.post_json(
+                self.endpoint,
+                {'target_locale': target_locale, 'items': payload_items},
+                headers=bearer_headers(self.api_key),
+                timeout=self.timeout_seconds,
+                max_attempts=self.max_attempts,
+            )
+        except TransportError as error:
+            logger.warning('Accessibility request failed after %s attempts: %s', self.max_attempts, error)
+            return {}
+        return self._parse_response(response_data)
+
+
 def _infer_haptic_cue(tags: Iterable[str]) -> str:
     tag_set = {tag.lower() for tag in tags}
     if {'celebration', 'fans', 'goal', 'stadium'} & tag_set:
@@ -217,11 +280,38 @@ def create_accessibility_generator(
     return StaticAccessibilityGenerator()
 
 
+def create_async_accessibility_generator(
+    provider: Optional[str] = None,
+    options: Optional[Dict[str, object]] = None,
+) -> AsyncAccessibilityGenerator:
+    """Async counterpart of :func:`create_accessibility_generator`.
+
+    GPT-backed generators get a native async client; anything else is wrapped so it runs
+    on the default executor.
+    """
+
+    generator = create_accessibility_generator(provider, options)
+    if isinstance(generator, GPTAccessibilityGenerator):
+        return AsyncGPTAccessibilityGenerator(
+            generator.endpoint,
+            generator.api_key,
+            timeout_seconds=generator.timeout_seconds,
+            max_attempts=generator.max_attempts,
+        )
+
+    from .async_support import to_async
+
+    return to_async(generator)
+
+
 __all__ = [
     'AccessibilityFields',
     'AccessibilityItem',
     'AccessibilityGenerator',
     'StaticAccessibilityGenerator',
     'GPTAccessibilityGenerator',
+    'AsyncAccessibilityGenerator',
+    'AsyncGPTAccessibilityGenerator',
     'create_accessibility_generator',
+    'create_async_accessibility_generator',
 ]
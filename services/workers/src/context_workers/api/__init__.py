@@ -2,9 +2,10 @@ from __future__ import annotations
 
 from fastapi import FastAPI
 
+from .preferences_service import preferences_lifespan
 from .preferences_service import router as preferences_router
 
-app = FastAPI(title="Codex Preference Service", version="0.1.0")
+app = FastAPI(title="Codex Preference Service", version="0.1.0", lifespan=preferences_lifespan)
 app.include_router(preferences_router)
 
 
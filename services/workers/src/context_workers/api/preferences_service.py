@@ -1,22 +1,40 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 import logging
 import os
-from typing import Any, Dict
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
-import httpx
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
-from ..preferences import PreferenceResult, _coerce_service_payload
+from .. import serialization
+from ..preferences import PreferenceResult, _coerce_service_payload, _detect_preferences_heuristic
+from ..transport import AsyncHTTPTransport, TransportError, bearer_headers, create_async_transport, get_async_transport
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_CACHE_SIZE = 1024
+DEFAULT_CACHE_TTL_SECONDS = 300.0
+DEFAULT_BATCH_CONCURRENCY = 16
+MAX_BATCH_SIZE = 10_000
+
 
 class PreferenceProfile(BaseModel):
     profile: Dict[str, Any]
 
 
+class PreferenceBatch(BaseModel):
+    profiles: List[Dict[str, Any]] = Field(..., max_length=MAX_BATCH_SIZE)
+
+
 class PreferenceResponse(BaseModel):
     primary_locale: str = Field(..., description="Primary language code inferred for the Codex user")
     secondary_locales: list[str] = Field(default_factory=list)
@@ -31,41 +49,274 @@ class PreferenceResponse(BaseModel):
         return cls(**result.__dict__)
 
 
+def profile_cache_key(profile: Dict[str, Any], endpoint: str = "") -> str:
+    """Canonical hash of a profile: key order and whitespace do not change the key."""
+
+    canonical = json.dumps(
+        {"endpoint": endpoint, "profile": profile},
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class PreferenceCache:
+    """In-memory TTL + LRU cache of upstream preference results."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_CACHE_SIZE,
+        ttl_seconds: float = DEFAULT_CACHE_TTL_SECONDS,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[float, PreferenceResult]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[PreferenceResult]:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= self.clock():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: str, result: PreferenceResult) -> None:
+        if self.max_entries <= 0 or self.ttl_seconds <= 0:
+            return
+        self._entries[key] = (self.clock() + self.ttl_seconds, result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class PreferenceResolver:
+    """Resolves profiles through the cache, coalescing concurrent identical upstream calls.
+
+    ``latency_budget`` (seconds) bounds how long a request waits for GPT before it is
+    answered by the local heuristic; the upstream call keeps running and fills the cache.
+    With ``fallback_on_error`` upstream failures (502s) also fall back to the heuristic.
+    ``batch_concurrency`` caps the upstream calls one ``resolve_batch`` keeps in flight,
+    including calls that outlived their item's latency budget.
+    """
+
+    def __init__(
+        self,
+        cache: Optional[PreferenceCache] = None,
+        *,
+        transport: Optional[AsyncHTTPTransport] = None,
+        latency_budget: Optional[float] = None,
+        fallback_on_error: bool = False,
+        batch_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> None:
+        self.cache = cache or PreferenceCache()
+        self.transport = transport
+        self.latency_budget = latency_budget
+        self.fallback_on_error = fallback_on_error
+        self.batch_concurrency = max(1, batch_concurrency)
+        self.upstream_calls = 0
+        self._inflight: Dict[str, "asyncio.Future[PreferenceResult]"] = {}
+
+    @classmethod
+    def from_env(cls, transport: Optional[AsyncHTTPTransport] = None) -> "PreferenceResolver":
+        budget = os.environ.get("CODEX_PREFERENCES_LATENCY_BUDGET")
+        return cls(
+            PreferenceCache(
+                max_entries=int(os.environ.get("CODEX_PREFERENCES_CACHE_SIZE", DEFAULT_CACHE_SIZE)),
+                ttl_seconds=float(os.environ.get("CODEX_PREFERENCES_CACHE_TTL", DEFAULT_CACHE_TTL_SECONDS)),
+            ),
+            transport=transport,
+            latency_budget=float(budget) if budget else None,
+            fallback_on_error=os.environ.get("CODEX_PREFERENCES_FALLBACK", "").lower() in {"1", "true", "yes"},
+            batch_concurrency=int(os.environ.get("CODEX_PREFERENCES_BATCH_CONCURRENCY", DEFAULT_BATCH_CONCURRENCY)),
+        )
+
+    async def resolve(
+        self, profile: Dict[str, Any], *, limiter: Optional[asyncio.Semaphore] = None
+    ) -> PreferenceResult:
+        """Answers from the cache, an in-flight call for the same profile, or a new upstream call.
+
+        A new upstream call holds ``limiter`` (when given) until it finishes, even after
+        this caller stopped waiting for it.
+        """
+
+        key = profile_cache_key(profile, os.environ.get("CODEX_PREFERENCES_ENDPOINT", ""))
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(key, profile, limiter))
+            self._inflight[key] = task
+            task.add_done_callback(partial(self._forget_inflight, key))
+
+        # Shield so one caller timing out or disconnecting does not cancel the shared call.
+        try:
+            if self.latency_budget is None:
+                return await asyncio.shield(task)
+            return await asyncio.wait_for(asyncio.shield(task), self.latency_budget)
+        except asyncio.TimeoutError:
+            logger.warning("GPT preference call exceeded %.2fs budget; answering with heuristic.", self.latency_budget)
+            return _detect_preferences_heuristic(profile)
+        except HTTPException as exc:
+            if exc.status_code == 502 and self.fallback_on_error:
+                logger.warning("GPT preference call failed (%s); answering with heuristic.", exc.detail)
+                return _detect_preferences_heuristic(profile)
+            raise
+
+    async def resolve_batch(
+        self, profiles: Sequence[Dict[str, Any]]
+    ) -> AsyncIterator[Tuple[int, Union[PreferenceResult, Exception]]]:
+        """Yields ``(index, result or exception)`` pairs in completion order.
+
+        At most ``batch_concurrency`` profiles are resolved at once; cached and duplicate
+        profiles go through ``resolve`` and so never add upstream calls. A failing profile
+        yields its exception instead of aborting the rest of the batch.
+        """
+
+        queue: "asyncio.Queue[Tuple[int, Union[PreferenceResult, Exception]]]" = asyncio.Queue()
+        pending = iter(range(len(profiles)))
+        # Workers move on when an item's budget expires, but its upstream call keeps running.
+        limiter = asyncio.Semaphore(self.batch_concurrency)
+
+        async def worker() -> None:
+            for index in pending:
+                try:
+                    outcome: Union[PreferenceResult, Exception] = await self.resolve(profiles[index], limiter=limiter)
+                except Exception as exc:  # noqa: BLE001 - reported per item
+                    outcome = exc
+                queue.put_nowait((index, outcome))
+
+        workers = [asyncio.ensure_future(worker()) for _ in range(min(self.batch_concurrency, len(profiles)))]
+        try:
+            for _ in range(len(profiles)):
+                yield await queue.get()
+        finally:
+            # Reached early when the consumer stops (e.g. the client disconnected).
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    def _forget_inflight(self, key: str, task: "asyncio.Future[PreferenceResult]") -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Every waiter may have fallen back already; retrieve the error so asyncio does
+        # not log "Task exception was never retrieved" for it.
+        if not task.cancelled():
+            task.exception()
+
+    async def _fetch(
+        self, key: str, profile: Dict[str, Any], limiter: Optional[asyncio.Semaphore] = None
+    ) -> PreferenceResult:
+        if limiter is not None:
+            async with limiter:
+                return await self._fetch(key, profile)
+        self.upstream_calls += 1
+        service_response = await _call_gpt_service({"profile": profile}, transport=self.transport)
+        result = _coerce_service_payload(service_response)
+        self.cache.set(key, result)
+        return result
+
+
+_resolver: Optional[PreferenceResolver] = None
+
+
+def get_preference_resolver() -> PreferenceResolver:
+    global _resolver
+    if _resolver is None:
+        _resolver = PreferenceResolver.from_env()
+    return _resolver
+
+
+def set_preference_resolver(resolver: Optional[PreferenceResolver]) -> Optional[PreferenceResolver]:
+    """Replaces the process-wide resolver (e.g. for tests); returns the previous one."""
+
+    global _resolver
+    previous = _resolver
+    _resolver = resolver
+    return previous
+
+
+@asynccontextmanager
+async def preferences_lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Owns one pooled upstream client and a fresh resolver for the app's lifetime."""
+
+    transport = create_async_transport()
+    previous = set_preference_resolver(PreferenceResolver.from_env(transport=transport))
+    try:
+        yield
+    finally:
+        set_preference_resolver(previous)
+        await transport.aclose()
+
+
 router = APIRouter()
 
 
-async def _call_gpt_service(payload: Dict[str, Any]) -> Dict[str, Any]:
+async def _call_gpt_service(
+    payload: Dict[str, Any], *, transport: Optional[AsyncHTTPTransport] = None
+) -> Dict[str, Any]:
     endpoint = os.environ.get("CODEX_PREFERENCES_ENDPOINT")
     api_key = os.environ.get("CODEX_PREFERENCES_API_KEY")
     if not endpoint or not api_key:
         raise HTTPException(status_code=500, detail="Preference service missing CODEX_PREFERENCES_* env vars")
 
     timeout = float(os.environ.get("CODEX_PREFERENCES_TIMEOUT", "6"))
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json",
-    }
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        try:
-            response = await client.post(endpoint, json=payload, headers=headers)
-        except httpx.HTTPError as exc:
+    transport = transport or get_async_transport()
+    try:
+        return await transport.post_json(endpoint, payload, headers=bearer_headers(api_key), timeout=timeout)
+    except TransportError as exc:
+        if exc.status is None:
             logger.error("GPT preference call failed: %s", exc)
             raise HTTPException(status_code=502, detail="Failed to reach GPT preference endpoint") from exc
+        if exc.status >= 400:
+            logger.error("GPT preference endpoint returned %s: %s", exc.status, exc.body)
+            raise HTTPException(status_code=502, detail="GPT preference endpoint returned an error") from exc
+        logger.error("GPT preference endpoint returned invalid JSON: %s", exc.body)
+        raise HTTPException(status_code=502, detail="Invalid JSON from GPT preference endpoint") from exc
 
-    if response.status_code >= 400:
-        logger.error("GPT preference endpoint returned %s: %s", response.status_code, response.text)
-        raise HTTPException(status_code=502, detail="GPT preference endpoint returned an error")
 
-    try:
-        return response.json()
-    except ValueError as exc:
-        logger.error("GPT preference endpoint returned invalid JSON: %s", response.text)
-        raise HTTPException(status_code=502, detail="Invalid JSON from GPT preference endpoint") from exc
+def _batch_line(index: int, outcome: Union[PreferenceResult, Exception]) -> str:
+    if isinstance(outcome, PreferenceResult):
+        item: Dict[str, Any] = {"index": index, "result": PreferenceResponse.from_result(outcome).model_dump()}
+    elif isinstance(outcome, HTTPException):
+        item = {"index": index, "error": {"status": outcome.status_code, "detail": outcome.detail}}
+    else:
+        logger.error("Preference batch item %s failed: %s", index, outcome)
+        item = {"index": index, "error": {"status": 500, "detail": "Failed to infer preferences"}}
+    return serialization.dumps_text(item, compact=True) + "\n"
+
+
+@router.post("/preferences:batch")
+async def infer_preferences_batch(body: PreferenceBatch) -> StreamingResponse:
+    """Streams one NDJSON line per profile, in completion order, tagged with its index."""
+
+    resolver = get_preference_resolver()
+
+    async def lines() -> AsyncIterator[str]:
+        async for index, outcome in resolver.resolve_batch(body.profiles):
+            yield _batch_line(index, outcome)
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
 
 
 @router.post("/preferences", response_model=PreferenceResponse)
 async def infer_preferences(body: PreferenceProfile) -> PreferenceResponse:
-    payload = {"profile": body.profile}
-    service_response = await _call_gpt_service(payload)
-    result = _coerce_service_payload(service_response)
+    result = await get_preference_resolver().resolve(body.profile)
     return PreferenceResponse.from_result(result)
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import codecs
+import gzip
+import itertools
+import json
+import mmap
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator
+
+from . import serialization
+from .compact import CompactAsset
+from .models import Asset
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+_GZIP_MAGIC = b'\x1f\x8b'
+_ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+
+@contextmanager
+def open_asset_source(path: Path, *, use_mmap: bool = False) -> Iterator[BinaryIO]:
+    """Opens ``path`` as a binary stream, transparently decompressing gzip or zstd.
+
+    Compression is detected from the magic bytes, not the suffix. With ``use_mmap`` the
+    file is memory-mapped so the OS pages it in on demand instead of copying through
+    Python read buffers.
+    """
+
+    with open(path, 'rb') as handle:
+        mapped = None
+        raw: Any = handle
+        if use_mmap and Path(path).stat().st_size:
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            raw = mapped
+        try:
+            magic = raw.read(4)
+            raw.seek(0)
+            if magic.startswith(_GZIP_MAGIC):
+                with gzip.GzipFile(fileobj=raw, mode='rb') as stream:
+                    yield stream
+            elif magic.startswith(_ZSTD_MAGIC):
+                try:
+                    import zstandard
+                except ImportError as exc:
+                    raise RuntimeError('zstandard must be installed to read zstd-compressed asset files') from exc
+                with zstandard.ZstdDecompressor().stream_reader(raw, closefd=False) as stream:
+                    yield stream
+            else:
+                yield raw
+        finally:
+            if mapped is not None:
+                mapped.close()
+
+
+def _iter_text(stream: BinaryIO, chunk_size: int) -> Iterator[str]:
+    decoder = codecs.getincrementaldecoder('utf-8-sig')()
+    while True:
+        block = stream.read(chunk_size)
+        if not block:
+            tail = decoder.decode(b'', final=True)
+            if tail:
+                yield tail
+            return
+        text = decoder.decode(block)
+        if text:
+            yield text
+
+
+def _iter_ndjson(first: str, chunks: Iterator[str]) -> Iterator[Dict[str, Any]]:
+    buffer = ''
+    for chunk in itertools.chain([first], chunks):
+        buffer += chunk
+        lines = buffer.split('\n')
+        buffer = lines.pop()
+        for line in lines:
+            if line.strip():
+                yield serialization.loads(line)
+    if buffer.strip():
+        yield serialization.loads(buffer)
+
+
+def _iter_json_array(first: str, chunks: Iterator[str]) -> Iterator[Dict[str, Any]]:
+    """Incrementally decodes the elements of a top-level JSON array."""
+
+    decoder = json.JSONDecoder()
+    buffer = first[first.index('[') + 1:]
+    position = 0
+    exhausted = False
+
+    while True:
+        while position < len(buffer) and buffer[position] in ' \t\r\n,':
+            position += 1
+        if position < len(buffer) and buffer[position] == ']':
+            return
+        try:
+            item, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError as error:
+            if exhausted:
+                raise ValueError(f'Malformed or unterminated JSON array in asset file: {error}') from error
+        else:
+            # A value ending exactly at the buffer edge may be truncated (e.g. a number).
+            if end < len(buffer) or exhausted:
+                yield item
+                position = end
+                continue
+
+        chunk = next(chunks, None)
+        if chunk is None:
+            exhausted = True
+            continue
+        buffer = buffer[position:] + chunk
+        position = 0
+
+
+def iter_asset_records(
+    path: Path,
+    *,
+    use_mmap: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Dict[str, Any]]:
+    """Yields raw asset dicts from a JSON array or NDJSON file without loading it whole."""
+
+    with open_asset_source(path, use_mmap=use_mmap) as stream:
+        chunks = _iter_text(stream, chunk_size)
+        first = ''
+        for chunk in chunks:
+            first += chunk
+            if first.strip():
+                break
+        if not first.strip():
+            return
+        if first.lstrip().startswith('['):
+            yield from _iter_json_array(first, chunks)
+        else:
+            yield from _iter_ndjson(first, chunks)
+
+
+def iter_assets(
+    path: Path,
+    *,
+    use_mmap: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    compact: bool = False,
+) -> Iterator[Asset | CompactAsset]:
+    """Lazily yields assets so the filter stage can consume them one by one.
+
+    With ``compact`` the records become :class:`CompactAsset` objects instead of ``Asset``.
+    """
+
+    factory = CompactAsset.from_record if compact else _asset_from_record
+    for record in iter_asset_records(path, use_mmap=use_mmap, chunk_size=chunk_size):
+        yield factory(record)
+
+
+def _asset_from_record(record: Dict[str, Any]) -> Asset:
+    return Asset(**record)
+
+
+__all__ = [
+    'iter_asset_records',
+    'iter_assets',
+    'open_asset_source',
+]
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
+
+from .accessibility import AsyncAccessibilityGenerator
+from .async_support import to_async
+from .extraction import build_highlight_narrative_async
+from .filtering import filter_assets, rank_assets
+from .localization import PreviousLocalization, localize_storyboard_async, parse_locale_list
+from .models import (
+    AccessibilityAssets,
+    Asset,
+    ExtractionConfig,
+    FilterDecision,
+    FilterRules,
+    HighlightNarrative,
+    LocaleNarration,
+)
+from .narrative import AsyncScriptGenerator
+from .scene_labelling import SceneLabeler, apply_scene_labels
+from .summarization import AsyncSummarizer
+from .translation import AsyncTranslator
+from .tts import AsyncTTSSynthesizer
+from .video_assembly import CreatomateRenderer, PoiContext, Storyboard
+
+
+@dataclass
+class AsyncPipelineProviders:
+    """Async provider set reused across POIs; mirrors the CLI's ``PipelineProviders``."""
+
+    summarizer: AsyncSummarizer
+    script_generator: AsyncScriptGenerator
+    translator: AsyncTranslator
+    tts_generator: Optional[AsyncTTSSynthesizer]
+    accessibility_generator: AsyncAccessibilityGenerator
+    labeler: SceneLabeler
+    renderer: CreatomateRenderer
+
+    @classmethod
+    def from_sync(cls, providers: Any, *, executor: Optional[Executor] = None) -> 'AsyncPipelineProviders':
+        """Wraps a synchronous provider set (e.g. the CLI's) so blocking calls use ``executor``."""
+
+        return cls(
+            summarizer=to_async(providers.summarizer, executor=executor),
+            script_generator=to_async(providers.script_generator, executor=executor),
+            translator=to_async(providers.translator, executor=executor),
+            tts_generator=to_async(providers.tts_generator, executor=executor),
+            accessibility_generator=to_async(providers.accessibility_generator, executor=executor),
+            labeler=providers.labeler,
+            renderer=providers.renderer,
+        )
+
+
+@dataclass
+class PipelineResult:
+    poi_id: str
+    narrative: HighlightNarrative
+    storyboard: Storyboard
+    decisions: List[FilterDecision]
+    narrations: Dict[str, LocaleNarration]
+    accessibility: Dict[str, AccessibilityAssets]
+
+
+async def run_pipeline_async(
+    assets: Iterable[Asset],
+    *,
+    providers: AsyncPipelineProviders,
+    poi: PoiContext,
+    locales: Optional[List[str]] = None,
+    frame_sample_size: int = 3,
+    audio_prefix: Optional[str] = None,
+    previous: Optional[PreviousLocalization] = None,
+) -> PipelineResult:
+    """Runs filter → rank → label → narrative → storyboard → localize for one POI.
+
+    Summary and script requests are awaited together, and every locale's translation,
+    TTS and accessibility requests overlap, so wall time tracks the slowest provider
+    chain instead of the sum of all calls. Filtering and labelling stay inline; they
+    are CPU-only and fast. ``previous`` limits provider calls to what changed since
+    that render.
+    """
+
+    survivors, decisions = filter_assets(assets, FilterRules())
+    ranked = rank_assets(survivors)
+    labelled_assets = apply_scene_labels(ranked, providers.labeler)
+
+    narrative = await build_highlight_narrative_async(
+        labelled_assets,
+        ExtractionConfig(frame_sample_size=frame_sample_size),
+        summarizer=providers.summarizer,
+        script_generator=providers.script_generator,
+    )
+
+    storyboard = providers.renderer.build_storyboard(narrative, labelled_assets, poi)
+    fallback_locale = poi.locale or narrative.language or 'en'
+    target_locales = parse_locale_list(','.join(locales or []), fallback=fallback_locale)
+
+    narrations, accessibility = await localize_storyboard_async(
+        storyboard,
+        target_locales,
+        audio_prefix=audio_prefix,
+        translator=providers.translator,
+        tts_generator=providers.tts_generator,
+        accessibility_generator=providers.accessibility_generator,
+        previous=previous,
+    )
+    return PipelineResult(
+        poi_id=poi.id,
+        narrative=narrative,
+        storyboard=storyboard,
+        decisions=decisions,
+        narrations=narrations,
+        accessibility=accessibility,
+    )
+
+
+__all__ = [
+    'AsyncPipelineProviders',
+    'PipelineResult',
+    'run_pipeline_async',
+]
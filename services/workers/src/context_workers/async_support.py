@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import threading
+from concurrent.futures import Executor
+from functools import partial
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+T = TypeVar('T')
+
+# Entry points defined by the provider protocols (translate/synthesize/generate/summarize).
+PROVIDER_METHODS = ('translate', 'synthesize', 'generate', 'summarize')
+
+
+def is_async_provider(provider: Any) -> bool:
+    """True when the provider's protocol method is a coroutine function."""
+
+    for name in PROVIDER_METHODS:
+        method = getattr(provider, name, None)
+        if method is not None:
+            return inspect.iscoroutinefunction(method)
+    return False
+
+
+class AsyncProviderAdapter:
+    """Exposes a synchronous provider through the async protocols.
+
+    Each call runs on ``executor`` (the loop's default executor when omitted) so blocking
+    HTTP or SQLite work never stalls the event loop. Non-callable attributes pass through.
+    """
+
+    def __init__(self, provider: Any, *, executor: Optional[Executor] = None) -> None:
+        self.provider = provider
+        self.executor = executor
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self.provider, name)
+        if not callable(attribute):
+            return attribute
+
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, partial(attribute, *args, **kwargs))
+
+        return call
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.provider!r})'
+
+
+class AsyncRunner:
+    """Runs coroutines to completion from synchronous code on a private background loop.
+
+    The loop lives on a daemon thread so calls work even when the caller's thread already
+    has a running loop (where ``asyncio.run`` would refuse). Safe to share across threads.
+    """
+
+    def __init__(self) -> None:
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name='codex-async-runner', daemon=True)
+                thread.start()
+                self._loop = loop
+                self._thread = thread
+            return self._loop
+
+    def run(self, coroutine: Awaitable[T], *, timeout: Optional[float] = None) -> T:
+        loop = self._ensure_loop()
+        future = asyncio.run_coroutine_threadsafe(coroutine, loop)
+        return future.result(timeout)
+
+    def close(self) -> None:
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = None
+            self._thread = None
+        if loop is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join()
+        loop.close()
+
+
+class SyncProviderAdapter:
+    """Exposes an async provider through the synchronous protocols via an :class:`AsyncRunner`."""
+
+    def __init__(self, provider: Any, *, runner: Optional[AsyncRunner] = None) -> None:
+        self.provider = provider
+        self.runner = runner or get_runner()
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self.provider, name)
+        if not inspect.iscoroutinefunction(attribute):
+            return attribute
+
+        def call(*args: Any, **kwargs: Any) -> Any:
+            return self.runner.run(attribute(*args, **kwargs))
+
+        return call
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.provider!r})'
+
+
+def to_async(provider: Any, *, executor: Optional[Executor] = None) -> Any:
+    """Returns an async provider, wrapping synchronous ones with :class:`AsyncProviderAdapter`."""
+
+    if provider is None or is_async_provider(provider):
+        return provider
+    if isinstance(provider, SyncProviderAdapter):
+        return provider.provider
+    return AsyncProviderAdapter(provider, executor=executor)
+
+
+def to_sync(provider: Any, *, runner: Optional[AsyncRunner] = None) -> Any:
+    """Returns a sync provider, wrapping async ones with :class:`SyncProviderAdapter`."""
+
+    if provider is None or not is_async_provider(provider):
+        return provider
+    if isinstance(provider, AsyncProviderAdapter):
+        return provider.provider
+    return SyncProviderAdapter(provider, runner=runner)
+
+
+async def run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Runs a blocking callable on the default executor."""
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, partial(func, *args, **kwargs))
+
+
+_default_runner: Optional[AsyncRunner] = None
+_runner_lock = threading.Lock()
+
+
+def get_runner() -> AsyncRunner:
+    """Returns the process-wide runner used by :class:`SyncProviderAdapter`."""
+
+    global _default_runner
+    with _runner_lock:
+        if _default_runner is None:
+            _default_runner = AsyncRunner()
+        return _default_runner
+
+
+__all__ = [
+    'AsyncProviderAdapter',
+    'AsyncRunner',
+    'SyncProviderAdapter',
+    'get_runner',
+    'is_async_provider',
+    'run_blocking',
+    'to_async',
+    'to_sync',
+]
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Tuple
+
+from . import serialization
+
+# Directory (or object prefix) under the storage root that holds content-addressed blobs.
+BLOB_DIRNAME = '.blobs'
+
+BLOB_REF_KEY = '$blob'
+BLOB_COMPRESSIONS = ('none', 'zstd')
+
+# Sub-documents smaller than this stay inline in the per-render document.
+DEFAULT_BLOB_MIN_BYTES = 2048
+# storyboard → narrative → translations → <locale> is three levels below the root.
+DEFAULT_BLOB_DEPTH = 3
+
+
+@dataclass
+class Blob:
+    """An encoded sub-document addressed by the sha256 of its canonical JSON."""
+
+    digest: str
+    compression: str
+    data: bytes
+
+    @property
+    def name(self) -> str:
+        return blob_name(self.digest, self.compression)
+
+    @property
+    def ref(self) -> Dict[str, str]:
+        return {BLOB_REF_KEY: self.digest, 'compression': self.compression}
+
+
+def blob_name(digest: str, compression: str) -> str:
+    """Relative path of a blob: fanned out by the first two hex digits of its digest."""
+
+    suffix = '.json.zst' if compression == 'zstd' else '.json'
+    return f'{digest[:2]}/{digest}{suffix}'
+
+
+def encode_blob(value: Any, compression: str = 'none') -> Blob:
+    return _encode_canonical(_canonical(value), compression)
+
+
+def _canonical(value: Any) -> bytes:
+    # The stdlib encoder keeps digests stable whichever JSON backend is installed.
+    return json.dumps(value, sort_keys=True, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def _encode_canonical(canonical: bytes, compression: str) -> Blob:
+    digest = hashlib.sha256(canonical).hexdigest()
+    if compression == 'zstd':
+        return Blob(digest, compression, _zstandard().ZstdCompressor().compress(canonical))
+    if compression != 'none':
+        raise ValueError(f'Unsupported blob compression: {compression}')
+    return Blob(digest, compression, canonical)
+
+
+def decode_blob(data: bytes, compression: str = 'none') -> Any:
+    if compression == 'zstd':
+        data = _zstandard().ZstdDecompressor().decompress(data)
+    return serialization.loads(data)
+
+
+def split_document(
+    document: Dict[str, Any],
+    *,
+    min_bytes: int = DEFAULT_BLOB_MIN_BYTES,
+    max_depth: int = DEFAULT_BLOB_DEPTH,
+    compression: str = 'none',
+) -> Tuple[Dict[str, Any], List[Blob]]:
+    """Moves sub-documents of at least ``min_bytes`` out of ``document`` into blobs.
+
+    Objects are split bottom-up to ``max_depth`` levels, so an unchanged locale is
+    shared even when a sibling locale changed. Returns the thin document, with each
+    moved value replaced by a ``{"$blob": digest, ...}`` reference, and the blobs.
+    """
+
+    blobs: List[Blob] = []
+
+    def split(value: Any, depth: int) -> Any:
+        if isinstance(value, dict) and depth < max_depth:
+            value = {key: split(child, depth + 1) for key, child in value.items()}
+        canonical = _canonical(value)
+        if len(canonical) < min_bytes:
+            return value
+        blob = _encode_canonical(canonical, compression)
+        blobs.append(blob)
+        return blob.ref
+
+    thin = {key: split(value, 1) for key, value in document.items()}
+    return thin, blobs
+
+
+def join_document(document: Any, load: Callable[[str], bytes]) -> Any:
+    """Inverse of :func:`split_document`; ``load`` reads a blob by :func:`blob_name`."""
+
+    if isinstance(document, dict):
+        if is_blob_ref(document):
+            compression = document.get('compression', 'none')
+            data = load(blob_name(document[BLOB_REF_KEY], compression))
+            return join_document(decode_blob(data, compression), load)
+        return {key: join_document(value, load) for key, value in document.items()}
+    if isinstance(document, list):
+        return [join_document(value, load) for value in document]
+    return document
+
+
+def is_blob_ref(value: Any) -> bool:
+    return isinstance(value, dict) and BLOB_REF_KEY in value and set(value) <= {BLOB_REF_KEY, 'compression'}
+
+
+def _zstandard():
+    try:
+        import zstandard
+    except ImportError as exc:
+        raise RuntimeError('zstandard must be installed to use zstd blob compression') from exc
+    return zstandard
+
+
+__all__ = [
+    'BLOB_COMPRESSIONS',
+    'BLOB_DIRNAME',
+    'Blob',
+    'blob_name',
+    'decode_blob',
+    'encode_blob',
+    'is_blob_ref',
+    'join_document',
+    'split_document',
+]
@@ -2,244 +2,74 @@ from __future__ import annotations
 
 import argparse
 import json
-from dataclasses import asdict
+import logging
+from dataclasses import asdict, dataclass
 import copy
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
-from .filtering import filter_assets, rank_assets
+from . import serialization
+from .asset_stream import iter_assets
+from .compact import CompactAsset
+from .filtering import filter_assets, rank_assets, select_top_assets
 from .extraction import build_highlight_narrative
-from .models import Asset, ExtractionConfig, FilterRules, LocaleNarration, AccessibilityAssets
-from .preferences import detect_preferences
-from .scene_labelling import KeywordSceneLabeler, apply_scene_labels
-from .summarization import create_summarizer
-from .narrative import create_script_generator
+from .models import Asset, ExtractionConfig, FilterRules
+from .preferences import PreferenceResult, detect_preferences
+from .scene_labelling import (
+    DEFAULT_LABEL_CHUNK_SIZE,
+    KeywordSceneLabeler,
+    SceneLabeler,
+    apply_scene_labels,
+    apply_scene_labels_parallel,
+)
+from .summarization import Summarizer, create_summarizer
+from .narrative import ScriptGenerator, create_script_generator
 from .video_assembly import CreatomateRenderConfig, CreatomateRenderer, PoiContext
-from .storage import StorageConfig, create_storage
-from .translation import TranslationItem, create_translator
-from .accessibility import (
-    AccessibilityItem,
-    AccessibilityGenerator,
-    StaticAccessibilityGenerator,
-    create_accessibility_generator,
+from .blob_store import BLOB_COMPRESSIONS, DEFAULT_BLOB_MIN_BYTES
+from .render_index import RenderRecord
+from .storage import (
+    DEFAULT_SWEEP_BATCH_SIZE,
+    DEFAULT_UPLOAD_CHUNK_SIZE,
+    GCSRenderStorage,
+    LocalRenderStorage,
+    StorageConfig,
+    StorageResult,
+    create_storage,
+)
+from .render_jobs import (
+    DEFAULT_MAX_POLLS,
+    DEFAULT_POLL_INTERVAL,
+    DEFAULT_RENDER_WORKERS,
+    DEFAULT_SUBMIT_LEASE,
+    RenderJobQueue,
+    RenderWorkerPool,
+)
+from .translation import Translator, create_translator
+from .accessibility import AccessibilityGenerator, create_accessibility_generator
+from .tts import TTSSynthesizer, create_tts_synthesizer
+from .localization import (
+    DEFAULT_LOCALIZATION_WORKERS,
+    PreviousLocalization,
+    STATIC_ACCESSIBILITY_FALLBACK,
+    collect_translation_items,
+    comma_separated_list,
+    generate_accessibility_assets,
+    generate_voiceovers_and_subtitles,
+    localize_text,
+    parse_locale_list,
 )
-from .tts import TTSRequestItem, TTSSynthesizer, create_tts_synthesizer
-
-
-def load_assets(path: Path) -> List[Asset]:
-    data = json.loads(path.read_text())
-    return [Asset(**item) for item in data]
-
-
-def comma_separated_list(value: str | None) -> List[str]:
-    if not value:
-        return []
-    return [item.strip() for item in value.split(',') if item.strip()]
-
-
-def parse_locale_list(value: str | None, fallback: str) -> List[str]:
-    locales = comma_separated_list(value)
-    if not locales:
-        return [fallback]
-    base_norm = fallback.split('-')[0]
-    if all(locale.split('-')[0] != base_norm for locale in locales):
-        locales = [fallback, *locales]
-    return locales
-
-
-def localize_text(text: str, locale: str, base_locale: str) -> str:
-    base = base_locale.split('-')[0]
-    target = locale.split('-')[0]
-    if target == base:
-        return text
-    return f"[{locale}] {text}"
-STATIC_ACCESSIBILITY_FALLBACK = StaticAccessibilityGenerator()
-
-
-def collect_translation_items(storyboard) -> List[TranslationItem]:
-    items: List[TranslationItem] = []
-
-    narrative = storyboard.narrative
-    if narrative.summary:
-        items.append(TranslationItem('narrative.summary', narrative.summary))
-
-    for index, rationale in enumerate(narrative.rationale):
-        items.append(TranslationItem(f'narrative.rationale.{index}', rationale))
-
-    if narrative.script:
-        for beat in narrative.script.beats:
-            items.append(TranslationItem(f'script.{beat.id}.title', beat.title))
-            items.append(TranslationItem(f'script.{beat.id}.content', beat.content))
-
-    for segment in storyboard.segments:
-        if segment.caption:
-            items.append(TranslationItem(f'segment.{segment.asset_id}.caption', segment.caption))
-        if segment.script_title:
-            items.append(TranslationItem(f'segment.{segment.asset_id}.title', segment.script_title))
-        if segment.script_content:
-            items.append(TranslationItem(f'segment.{segment.asset_id}.script', segment.script_content))
-        if segment.rationale:
-            items.append(TranslationItem(f'segment.{segment.asset_id}.rationale', segment.rationale))
-        if segment.frame and segment.frame.caption:
-            items.append(TranslationItem(f'frame.{segment.asset_id}.caption', segment.frame.caption))
-
-    return items
-
-
-def _ensure_translation_coverage(
-    items: List[TranslationItem],
-    translations: Dict[str, str],
-    locale: str,
-    base_locale: str,
-) -> Dict[str, str]:
-    results = dict(translations)
-    for item in items:
-        if not item.text:
-            continue
-        if not results.get(item.key):
-            results[item.key] = localize_text(item.text, locale, base_locale)
-    return results
-
-
-def generate_voiceovers_and_subtitles(
-    storyboard,
-    locales: List[str],
-    *,
-    audio_prefix: str | None,
-    translator,
-    tts_generator: Optional[TTSSynthesizer] = None,
-) -> Dict[str, LocaleNarration]:
-    base_locale = storyboard.narrative.language or 'en'
-    narrations: Dict[str, LocaleNarration] = {}
-
-    translation_items = collect_translation_items(storyboard)
-    base_translations = {item.key: item.text for item in translation_items}
-    storyboard.narrative.translations[base_locale] = base_translations.copy()
-
-    for locale in locales:
-        if not locale:
-            continue
-
-        subtitle_map: Dict[str, str] = {}
-        target_base = locale.split('-')[0]
-        if target_base == base_locale.split('-')[0]:
-            locale_translations = base_translations.copy()
-        else:
-            raw_translations = translator.translate(translation_items, locale, source_locale=base_locale)
-            locale_translations = _ensure_translation_coverage(translation_items, raw_translations, locale, base_locale)
-
-        storyboard.narrative.translations[locale] = locale_translations
-
-        for segment in storyboard.segments:
-            subtitle_candidates = [
-                locale_translations.get(f'segment.{segment.asset_id}.script'),
-                locale_translations.get(f'segment.{segment.asset_id}.caption'),
-                locale_translations.get(f'narrative.summary'),
-            ]
-            fallback_source = segment.script_content or segment.caption or storyboard.narrative.summary
-            localized = next((text for text in subtitle_candidates if text), localize_text(fallback_source, locale, base_locale))
-            segment.subtitles[locale] = localized
-            if segment.frame:
-                segment.frame.subtitles[locale] = localized
-            subtitle_map[segment.asset_id] = localized
-
-        audio_url = None
-        voice = None
-
-        if tts_generator:
-            tts_items = [
-                TTSRequestItem(id=segment.asset_id, text=subtitle_map.get(segment.asset_id, ''))
-                for segment in storyboard.segments
-            ]
-            synthesis = tts_generator.synthesize(
-                tts_items,
-                locale=locale,
-                base_locale=base_locale,
-                poi_id=storyboard.poi.id,
-            )
-            if synthesis:
-                audio_url = synthesis.audio_url or audio_url
-                voice = synthesis.voice or voice
-                for seg_id, seg_text in synthesis.segments.items():
-                    subtitle_map[seg_id] = seg_text
-                    for segment in storyboard.segments:
-                        if segment.asset_id == seg_id:
-                            segment.subtitles[locale] = seg_text
-                            if segment.frame:
-                                segment.frame.subtitles[locale] = seg_text
-
-        if not audio_url and audio_prefix:
-            prefix = audio_prefix.rstrip('/')
-            audio_url = f"{prefix}/{storyboard.poi.id}-{locale}.mp3"
-
-        narrations[locale] = LocaleNarration(
-            locale=locale,
-            audio_url=audio_url,
-            voice=voice,
-            subtitles=subtitle_map,
-        )
-
-    storyboard.narrative.narrations = narrations
-    return narrations
-
-
-def generate_accessibility_assets(
-    storyboard,
-    locales: List[str],
-    *,
-    generator: AccessibilityGenerator,
-) -> Dict[str, AccessibilityAssets]:
-    base_locale = storyboard.narrative.language or 'en'
-    accessibility_map: Dict[str, AccessibilityAssets] = {}
-
-    for locale in locales:
-        if not locale:
-            continue
-
-        translations = storyboard.narrative.translations.get(locale) or {}
-        items: List[AccessibilityItem] = []
-        for segment in storyboard.segments:
-            clip_title = translations.get(f'segment.{segment.asset_id}.title') or segment.script_title or segment.caption or 'Highlight'
-            clip_summary = (
-                translations.get(f'segment.{segment.asset_id}.script')
-                or translations.get('narrative.summary')
-                or segment.script_content
-                or storyboard.narrative.summary
-            )
-            caption = translations.get(f'segment.{segment.asset_id}.caption') or segment.caption or clip_summary
-            rationale = translations.get(f'segment.{segment.asset_id}.rationale') or segment.rationale or clip_summary
-            items.append(
-                AccessibilityItem(
-                    id=segment.asset_id,
-                    clip_title=clip_title,
-                    clip_summary=clip_summary,
-                    caption=caption,
-                    rationale=rationale,
-                    tags=list(segment.tags),
-                    locale=locale,
-                    base_locale=base_locale,
-                )
-            )
 
-        generated = generator.generate(items, target_locale=locale) or {}
-        fallback = STATIC_ACCESSIBILITY_FALLBACK.generate(items, target_locale=locale)
+logger = logging.getLogger(__name__)
 
-        bundle = AccessibilityAssets(locale=locale)
-        for item in items:
-            fields = generated.get(item.id) or fallback.get(item.id)
-            if not fields:
-                continue
-            bundle.captions[item.id] = fields.caption
-            bundle.audio_descriptions[item.id] = fields.audio_description
-            bundle.haptic_cues[item.id] = fields.haptic_cue
-            bundle.alt_text[item.id] = fields.alt_text
 
-        accessibility_map[locale] = bundle
+def load_assets(path: Path) -> List[Asset]:
+    return list(iter_assets(path))
 
-    storyboard.narrative.accessibility.update(accessibility_map)
-    return accessibility_map
 
+def open_input_assets(path: Path, args: argparse.Namespace) -> Iterator[Asset | CompactAsset]:
+    """Streams ``path`` the way the CLI flags ask: memory-mapped with ``--mmap-input``, compact with ``--top-k``."""
 
+    return iter_assets(path, use_mmap=args.mmap_input, compact=bool(args.top_k))
 
 
 def apply_local_media_overrides(storyboard, media_dir: Path | None) -> None:
@@ -276,7 +106,10 @@ def apply_local_media_overrides(storyboard, media_dir: Path | None) -> None:
                 segment.asset_url = f"static://{static_path}"
                 if segment.frame:
                     segment.frame.image_url = f"static://{static_path}"
+                storyboard.invalidate(segment)
                 break
+
+
 def build_remotion_props(
     storyboard,
     *,
@@ -334,11 +167,44 @@ def build_remotion_props(
     }
 
 
-def main(argv: List[str] | None = None) -> None:
+DEFAULT_SCENE_KEYWORDS: Dict[str, List[str]] = {
+    'celebration': ['celebrat', 'fans', 'party'],
+    'food-and-drink': ['tapa', 'brunch', 'cocktail', 'wine'],
+    'transit': ['metro', 'train', 'ferry', 'path'],
+}
+
+
+@dataclass
+class PipelineProviders:
+    """Provider instances built once per process and shared by every POI."""
+
+    summarizer: Summarizer
+    script_generator: ScriptGenerator
+    translator: Translator
+    tts_generator: Optional[TTSSynthesizer]
+    accessibility_generator: AccessibilityGenerator
+    labeler: SceneLabeler
+    renderer: CreatomateRenderer
+    storage: Optional[LocalRenderStorage | GCSRenderStorage] = None
+    render_pool: Optional[RenderWorkerPool] = None
+
+
+def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="ContextCity content intelligence toolkit")
-    parser.add_argument('command', choices=['demo', 'render'], help='Command to run')
-    parser.add_argument('--input', type=Path, required=True, help='Path to a JSON array of assets')
+    parser.add_argument('command', choices=['demo', 'render', 'batch', 'sweep'], help='Command to run')
+    parser.add_argument('--input', type=Path, help='Path to a JSON array or NDJSON file of assets, optionally gzip/zstd compressed (default asset file for batch entries)')
+    parser.add_argument('--manifest', type=Path, help='Batch manifest (JSON array or JSON lines) describing the POIs to render')
+    parser.add_argument(
+        '--mmap-input',
+        action='store_true',
+        help='Memory-map the asset file (JSON array or NDJSON, optionally gzip/zstd compressed) while streaming it',
+    )
     parser.add_argument('--frame-sample-size', type=int, default=3)
+    parser.add_argument(
+        '--top-k',
+        type=int,
+        help='Stream candidates and keep only the best K survivors (plus the decision log) instead of ranking every asset',
+    )
     parser.add_argument('--summarizer', default='static', help='Summarizer provider (static, screenapp)')
     parser.add_argument('--summarizer-endpoint', help='Optional summarization endpoint URL')
     parser.add_argument('--summarizer-api-key', help='Optional summarization API key')
@@ -350,6 +216,12 @@ def main(argv: List[str] | None = None) -> None:
     parser.add_argument('--translation-api-key', help='Optional translation API key')
     parser.add_argument('--translation-timeout', type=float, help='Override translation timeout in seconds')
     parser.add_argument('--translation-max-attempts', type=int, help='Maximum attempts for translation service calls')
+    parser.add_argument('--translation-chunk-items', type=int, help='Maximum items per translation request chunk')
+    parser.add_argument('--translation-chunk-chars', type=int, help='Maximum source characters per translation request chunk')
+    parser.add_argument('--translation-concurrency', type=int, help='Maximum translation chunks in flight per locale')
+    parser.add_argument('--translation-cache', help='SQLite file caching GPT translations across runs (keyed by locale pair + text hash)')
+    parser.add_argument('--translation-cache-ttl', type=float, help='Seconds before cached translations expire')
+    parser.add_argument('--translation-cache-max-entries', type=int, help='Maximum cached translations before least-recently-used eviction')
     parser.add_argument('--accessibility-generator', default='auto', choices=['auto', 'static', 'gpt'], help='Accessibility asset generator (auto env detection, static, gpt)')
     parser.add_argument('--accessibility-endpoint', help='Optional accessibility endpoint URL')
     parser.add_argument('--accessibility-api-key', help='Optional accessibility API key')
@@ -374,19 +246,37 @@ def main(argv: List[str] | None = None) -> None:
     parser.add_argument('--creatomate-metadata', help='JSON string appended to render metadata')
     parser.add_argument('--creatomate-api-key', help='Creatomate API key (required when --creatomate-execute is used)')
     parser.add_argument('--creatomate-execute', action='store_true', help='Send the payload to Creatomate instead of dry-run output')
+    parser.add_argument('--force-render', action='store_true', help='Submit executed renders even when an identical render (same payload fingerprint) is already stored')
+    parser.add_argument('--render-queue', help='SQLite file tracking Creatomate render jobs; with --creatomate-execute, renders are queued, polled to completion and stored when done')
+    parser.add_argument('--render-workers', type=int, default=DEFAULT_RENDER_WORKERS, help='Maximum concurrent Creatomate submissions from the render queue')
+    parser.add_argument('--render-rate', type=float, help='Maximum Creatomate submissions per second from the render queue')
+    parser.add_argument('--render-poll-interval', type=float, default=DEFAULT_POLL_INTERVAL, help='Seconds between status polls for queued renders')
+    parser.add_argument('--render-max-polls', type=int, default=DEFAULT_MAX_POLLS, help='Status polls after which a still-unfinished queued render is marked failed')
+    parser.add_argument('--render-submit-lease', type=float, default=DEFAULT_SUBMIT_LEASE, help='Seconds after which a job stuck in submitting (crashed worker) is requeued')
+    parser.add_argument('--render-timeout', type=float, default=900.0, help='Seconds to wait for queued renders before reporting them as still pending')
     parser.add_argument('--profile', type=Path, help='Optional Codex profile JSON used to infer language/accessibility preferences via GPT heuristics')
 
     # Storage arguments.
     parser.add_argument('--storage-provider', default='local', choices=['local', 'gcs', 'none'], help='Storage backend for render artifacts')
     parser.add_argument('--storage-output-dir', default='renders', help='Directory where render artifacts will be persisted when using local storage')
     parser.add_argument('--storage-base-url', help='Base URL used to fabricate signed URLs for local storage (e.g. https://storage.googleapis.com/bucket)')
-    parser.add_argument('--storage-retention-days', type=int, default=7, help='Retention window advertised alongside stored artifacts')
+    parser.add_argument('--storage-retention-days', type=int, default=7, help='Retention window for stored artifacts; the sweep command deletes local renders older than this')
+    parser.add_argument('--storage-sweep-batch-size', type=int, default=DEFAULT_SWEEP_BATCH_SIZE, help='Expired renders deleted per sweep batch')
+    parser.add_argument('--storage-sweep-max-batches', type=int, help='Stop the sweep after this many batches (default: until nothing is expired)')
+    parser.add_argument('--storage-reindex', action='store_true', help='Before sweeping, index local renders stored before the render index existed (walks the render tree once)')
     parser.add_argument('--storage-disable-signed-urls', action='store_true', help='Disable generation of signed URL placeholders')
     parser.add_argument('--storage-gcs-bucket', help='Target GCS bucket name (required when using --storage-provider gcs)')
     parser.add_argument('--storage-gcs-prefix', default='renders', help='Object prefix within the GCS bucket')
     parser.add_argument('--storage-gcs-credentials', help='Path to a service account JSON for GCS uploads')
     parser.add_argument('--storage-signed-url-ttl', type=int, default=3600, help='Signed URL lifetime in seconds')
+    parser.add_argument('--storage-signed-url-margin', type=int, default=300, help='Re-sign cached URLs once they are this many seconds from expiry')
     parser.add_argument('--storage-copy-video', action='store_true', help='Attempt to copy render video into storage when a download URL is available')
+    parser.add_argument('--storage-upload-workers', type=int, default=4, help='Artifacts uploaded concurrently to GCS')
+    parser.add_argument('--storage-upload-chunk-size', type=int, default=DEFAULT_UPLOAD_CHUNK_SIZE, help='Bytes per resumable-upload chunk when streaming the render video to GCS (multiple of 256 KiB)')
+    parser.add_argument('--storage-dedupe-blobs', action='store_true', help='Store large sub-documents (translations, accessibility bundles) once by content hash and reference them from thin per-render documents')
+    parser.add_argument('--storage-blob-compression', default='none', choices=list(BLOB_COMPRESSIONS), help='Compression for deduplicated blobs (zstd requires the zstd extra)')
+    parser.add_argument('--storage-blob-min-bytes', type=int, default=DEFAULT_BLOB_MIN_BYTES, help='Sub-documents smaller than this stay inline when deduplicating')
+    parser.add_argument('--compact-json', action='store_true', help='Write stored artifacts, Remotion props and CLI output as compact JSON (no indentation) for machine consumers')
     parser.add_argument('--remotion-props-output', type=Path, help='Write Remotion props JSON to this path')
     parser.add_argument('--remotion-media-dir', type=Path, help='Optional directory containing local media files that should replace remote asset URLs when generating Remotion props (matches by filename)')
     parser.add_argument('--voiceover-locales', help='Comma separated locales for narration + subtitles (default inferred from profile/narrative)')
@@ -398,26 +288,39 @@ def main(argv: List[str] | None = None) -> None:
     parser.add_argument('--tts-max-attempts', type=int, help='Max retry attempts for TTS requests')
     parser.add_argument('--tts-default-voice', help='Default voice identifier for TTS synthesis')
     parser.add_argument('--tts-voice-overrides', help='JSON mapping of locale to TTS voice id (e.g. {"fr": "dartagnan-fr"})')
+    parser.add_argument('--incremental-localization', action='store_true', help="Reuse translations, narration and accessibility assets from the POI's latest stored render; only new or changed keys reach the providers")
+    parser.add_argument('--localization-workers', type=int, default=DEFAULT_LOCALIZATION_WORKERS, help='Maximum number of locales translated and synthesized concurrently')
+    parser.add_argument('--label-workers', type=int, default=1, help='Scene-label assets across this many worker processes (1 labels serially)')
+    parser.add_argument('--label-chunk-size', type=int, default=DEFAULT_LABEL_CHUNK_SIZE, help='Assets per labelling task when --label-workers > 1')
+    parser.add_argument('--label-threads', action='store_true', help='Use threads instead of processes for parallel labelling (I/O-bound labellers)')
+    return parser
 
-    args = parser.parse_args(argv)
 
-    preferences = None
-    if args.profile:
-        profile_data = json.loads(args.profile.read_text())
-        preferences = detect_preferences(profile_data)
+def build_render_config(args: argparse.Namespace) -> CreatomateRenderConfig:
+    metadata = {'experience': 'codex_social_highlight'}
+    if args.creatomate_metadata:
+        metadata.update(json.loads(args.creatomate_metadata))
 
-    if args.storage_provider == 'gcs' and not args.storage_gcs_bucket:
-        parser.error('--storage-gcs-bucket is required when using --storage-provider gcs')
+    return CreatomateRenderConfig(
+        template_id=args.creatomate_template_id,
+        output_format=args.creatomate_output_format,
+        clip_duration=args.creatomate_clip_duration,
+        transition_ms=args.creatomate_transition_ms,
+        brand_color=args.creatomate_brand_color,
+        accent_color=args.creatomate_accent_color,
+        default_music_track=args.creatomate_default_music,
+        webhook_url=args.creatomate_webhook,
+        metadata=metadata,
+    )
 
-    assets = load_assets(args.input)
-    survivors, decisions = filter_assets(assets, FilterRules())
-    ranked = rank_assets(survivors)
-    labeler = KeywordSceneLabeler({
-        'celebration': ['celebrat', 'fans', 'party'],
-        'food-and-drink': ['tapa', 'brunch', 'cocktail', 'wine'],
-        'transit': ['metro', 'train', 'ferry', 'path'],
-    })
-    labelled_assets = apply_scene_labels(ranked, labeler)
+
+def build_providers(
+    args: argparse.Namespace,
+    parser: argparse.ArgumentParser,
+    *,
+    with_storage: bool,
+) -> PipelineProviders:
+    """Constructs every provider once so a batch run can reuse them across POIs."""
 
     summarizer = create_summarizer(args.summarizer, {
         'endpoint': args.summarizer_endpoint,
@@ -436,6 +339,18 @@ def main(argv: List[str] | None = None) -> None:
         translation_options['timeout'] = args.translation_timeout
     if args.translation_max_attempts is not None:
         translation_options['max_attempts'] = args.translation_max_attempts
+    if args.translation_chunk_items is not None:
+        translation_options['max_chunk_items'] = args.translation_chunk_items
+    if args.translation_chunk_chars is not None:
+        translation_options['max_chunk_chars'] = args.translation_chunk_chars
+    if args.translation_concurrency is not None:
+        translation_options['max_concurrency'] = args.translation_concurrency
+    if args.translation_cache:
+        translation_options['cache_path'] = args.translation_cache
+    if args.translation_cache_ttl is not None:
+        translation_options['cache_ttl'] = args.translation_cache_ttl
+    if args.translation_cache_max_entries is not None:
+        translation_options['cache_max_entries'] = args.translation_cache_max_entries
 
     translator = create_translator(args.translator, translation_options)
     tts_options: Dict[str, object] = {}
@@ -469,42 +384,135 @@ def main(argv: List[str] | None = None) -> None:
         args.accessibility_generator,
         accessibility_options,
     )
-    narrative = build_highlight_narrative(
-        labelled_assets,
-        ExtractionConfig(frame_sample_size=args.frame_sample_size),
+
+    storage = None
+    if with_storage and args.storage_provider != 'none':
+        storage = create_storage(StorageConfig(
+            provider=args.storage_provider,
+            output_dir=Path(args.storage_output_dir),
+            base_url=args.storage_base_url,
+            retention_days=args.storage_retention_days,
+            generate_signed_urls=not args.storage_disable_signed_urls,
+            gcs_bucket=args.storage_gcs_bucket,
+            gcs_prefix=args.storage_gcs_prefix,
+            gcs_credentials=args.storage_gcs_credentials,
+            signed_url_ttl=args.storage_signed_url_ttl,
+            signed_url_margin=args.storage_signed_url_margin,
+            copy_video_asset=args.storage_copy_video,
+            compact_json=args.compact_json,
+            upload_workers=args.storage_upload_workers,
+            upload_chunk_size=args.storage_upload_chunk_size,
+            dedupe_blobs=args.storage_dedupe_blobs,
+            blob_compression=args.storage_blob_compression,
+            blob_min_bytes=args.storage_blob_min_bytes,
+        ))
+
+    renderer = CreatomateRenderer(build_render_config(args), api_key=args.creatomate_api_key)
+    render_pool = None
+    if with_storage and args.render_queue and args.creatomate_execute:
+        render_pool = RenderWorkerPool(
+            RenderJobQueue(args.render_queue),
+            renderer,
+            storage=storage,
+            workers=args.render_workers,
+            rate=args.render_rate,
+            poll_interval=args.render_poll_interval,
+            submit_lease=args.render_submit_lease,
+            max_polls=args.render_max_polls,
+        )
+
+    return PipelineProviders(
         summarizer=summarizer,
         script_generator=script_generator,
+        translator=translator,
+        tts_generator=tts_generator,
+        accessibility_generator=accessibility_generator,
+        labeler=KeywordSceneLabeler(DEFAULT_SCENE_KEYWORDS),
+        renderer=renderer,
+        storage=storage,
+        render_pool=render_pool,
     )
 
-    inferred_locale = args.poi_locale or (preferences.primary_locale if preferences else narrative.language)
 
-    poi_context = PoiContext(
-        id=args.poi_id or narrative.asset_ids[0],
-        name=args.poi_name,
-        locale=inferred_locale,
-        distance=args.poi_distance,
-        hours=args.poi_hours,
-        tags=comma_separated_list(args.poi_tags),
+def poi_options_from_args(args: argparse.Namespace) -> Dict[str, Any]:
+    return {
+        'id': args.poi_id,
+        'name': args.poi_name,
+        'locale': args.poi_locale,
+        'distance': args.poi_distance,
+        'hours': args.poi_hours,
+        'tags': comma_separated_list(args.poi_tags),
+    }
+
+
+def load_previous_localization(
+    storage: LocalRenderStorage | GCSRenderStorage,
+    poi_id: str,
+    render: Optional[StorageResult] = None,
+) -> Optional[PreviousLocalization]:
+    """Localization of ``render`` (default: the POI's latest stored render), or None when there is nothing to reuse."""
+
+    latest = render or storage.latest_render(poi_id)
+    if latest is None:
+        return None
+    try:
+        return PreviousLocalization(storage.load_artifact(poi_id, latest.render_id, 'storyboard.json'))
+    except Exception as error:  # reuse is an optimization; a broken previous render must not fail this one
+        logger.warning('Ignoring previous render %s of %s for localization reuse: %s', latest.render_id, poi_id, error)
+        return None
+
+
+def run_pipeline(
+    command: str,
+    assets: Iterable[Asset],
+    *,
+    args: argparse.Namespace,
+    providers: PipelineProviders,
+    poi_options: Dict[str, Any],
+    preferences: Optional[PreferenceResult] = None,
+    remotion_props_output: Optional[Path] = None,
+    drain_render_queue: bool = True,
+) -> Dict[str, Any]:
+    """Runs filter → rank → label → narrative → storyboard → localize → store for one POI."""
+
+    if args.top_k:
+        top, decisions = select_top_assets(assets, args.top_k, FilterRules())
+        ranked = [asset.to_asset() if isinstance(asset, CompactAsset) else asset for asset in top]
+    else:
+        survivors, decisions = filter_assets(assets, FilterRules())
+        ranked = rank_assets(survivors)
+    if args.label_workers > 1:
+        labelled_assets = apply_scene_labels_parallel(
+            ranked,
+            providers.labeler,
+            workers=args.label_workers,
+            chunk_size=args.label_chunk_size,
+            use_threads=args.label_threads,
+        )
+    else:
+        labelled_assets = apply_scene_labels(ranked, providers.labeler)
+
+    narrative = build_highlight_narrative(
+        labelled_assets,
+        ExtractionConfig(frame_sample_size=args.frame_sample_size),
+        summarizer=providers.summarizer,
+        script_generator=providers.script_generator,
     )
 
-    metadata = {'experience': 'codex_social_highlight'}
-    if args.creatomate_metadata:
-        metadata.update(json.loads(args.creatomate_metadata))
+    inferred_locale = poi_options.get('locale') or (preferences.primary_locale if preferences else narrative.language)
 
-    render_config = CreatomateRenderConfig(
-        template_id=args.creatomate_template_id,
-        output_format=args.creatomate_output_format,
-        clip_duration=args.creatomate_clip_duration,
-        transition_ms=args.creatomate_transition_ms,
-        brand_color=args.creatomate_brand_color,
-        accent_color=args.creatomate_accent_color,
-        default_music_track=args.creatomate_default_music,
-        webhook_url=args.creatomate_webhook,
-        metadata=metadata,
+    poi_context = PoiContext(
+        id=poi_options.get('id') or narrative.asset_ids[0],
+        name=poi_options.get('name') or 'Demo POI',
+        locale=inferred_locale,
+        distance=poi_options.get('distance'),
+        hours=poi_options.get('hours'),
+        tags=list(poi_options.get('tags') or []),
     )
 
-    storyboard_renderer = CreatomateRenderer(render_config)
-    storyboard = storyboard_renderer.build_storyboard(narrative, labelled_assets, poi_context)
+    renderer = providers.renderer
+    render_config = renderer.config
+    storyboard = renderer.build_storyboard(narrative, labelled_assets, poi_context)
 
     fallback_locale = preferences.primary_locale if preferences else (narrative.language or 'en')
     voiceover_locales = parse_locale_list(
@@ -518,17 +526,39 @@ def main(argv: List[str] | None = None) -> None:
             if base not in seen:
                 voiceover_locales.append(base)
                 seen.add(base)
+
+    render_payload = None
+    fingerprint = None
+    reused = None
+    if command != 'demo':
+        # The payload does not depend on localization, so an identical stored render is
+        # found before any translation or TTS call is made.
+        render_payload = renderer.build_render_payload(storyboard)
+        # Only executed renders are indexed: a dry run must not mask a later real render.
+        fingerprint = renderer.fingerprint(render_payload, locales=voiceover_locales) if args.creatomate_execute else None
+        if fingerprint and providers.storage is not None and not args.force_render:
+            reused = providers.storage.lookup_fingerprint(storyboard.poi.id, fingerprint)
+
+    previous = None
+    if reused is not None:
+        # The reused render's storyboard already holds every translation and voiceover.
+        previous = load_previous_localization(providers.storage, poi_context.id, reused)
+    elif args.incremental_localization and providers.storage is not None:
+        previous = load_previous_localization(providers.storage, poi_context.id)
     generate_voiceovers_and_subtitles(
         storyboard,
         voiceover_locales,
         audio_prefix=args.voiceover_audio_prefix,
-        translator=translator,
-        tts_generator=tts_generator,
+        translator=providers.translator,
+        tts_generator=providers.tts_generator,
+        max_workers=args.localization_workers,
+        previous=previous,
     )
     generate_accessibility_assets(
         storyboard,
         voiceover_locales,
-        generator=accessibility_generator,
+        generator=providers.accessibility_generator,
+        previous=previous,
     )
 
     remotion_storyboard = copy.deepcopy(storyboard)
@@ -543,11 +573,11 @@ def main(argv: List[str] | None = None) -> None:
         accent_color=render_config.accent_color,
     )
 
-    if args.remotion_props_output:
-        args.remotion_props_output.parent.mkdir(parents=True, exist_ok=True)
-        args.remotion_props_output.write_text(json.dumps(remotion_props, indent=2))
+    if remotion_props_output:
+        remotion_props_output.parent.mkdir(parents=True, exist_ok=True)
+        remotion_props_output.write_bytes(serialization.dumps(remotion_props, compact=args.compact_json))
 
-    if args.command == 'demo':
+    if command == 'demo':
         output = {
             'narrative': asdict(narrative),
             'decisions': [asdict(decision) for decision in decisions],
@@ -555,36 +585,37 @@ def main(argv: List[str] | None = None) -> None:
         }
         if preferences:
             output['preferences'] = asdict(preferences)
-        print(json.dumps(output, indent=2))
-        return
+        return output
 
-    render_payload = storyboard_renderer.build_render_payload(storyboard)
-    manifest = storyboard_renderer.create_manifest(storyboard, render_payload)
-
-    renderer = CreatomateRenderer(render_config, api_key=args.creatomate_api_key)
-    render_response = renderer.render(render_payload, execute=args.creatomate_execute)
+    manifest = renderer.create_manifest(storyboard, render_payload)
 
+    render_job = None
     storage_result = None
-    if args.storage_provider != 'none':
-        storage_config = StorageConfig(
-            provider=args.storage_provider,
-            output_dir=Path(args.storage_output_dir),
-            base_url=args.storage_base_url,
-            retention_days=args.storage_retention_days,
-            generate_signed_urls=not args.storage_disable_signed_urls,
-            gcs_bucket=args.storage_gcs_bucket,
-            gcs_prefix=args.storage_gcs_prefix,
-            gcs_credentials=args.storage_gcs_credentials,
-            signed_url_ttl=args.storage_signed_url_ttl,
-            copy_video_asset=args.storage_copy_video,
-        )
-        storage = create_storage(storage_config)
-        storage_result = storage.store(
-            storyboard=storyboard,
-            render_payload=render_payload,
-            manifest=manifest,
-            render_response=render_response,
-        )
+    if reused is not None:
+        render_response = {
+            'status': 'reused',
+            'render_id': reused.render_id,
+            'fingerprint': fingerprint,
+            'video_url': reused.signed_video_url,
+        }
+        storage_result = asdict(reused)
+    elif providers.render_pool is not None:
+        # The pool submits, polls and stores; batch runs drain it once after all POIs.
+        render_job = providers.render_pool.enqueue(storyboard, render_payload, manifest, fingerprint=fingerprint)
+        if drain_render_queue:
+            finished = providers.render_pool.run_until_complete([render_job.id], timeout=args.render_timeout)
+            render_job = finished[0] if finished else render_job
+        render_response = render_job.response or {'status': render_job.state, 'job_id': render_job.id}
+    else:
+        render_response = renderer.render(render_payload, execute=args.creatomate_execute)
+        if providers.storage is not None:
+            storage_result = asdict(providers.storage.store(
+                storyboard=storyboard,
+                render_payload=render_payload,
+                manifest=manifest,
+                render_response=render_response,
+                fingerprint=fingerprint,
+            ))
 
     output = {
         'storyboard': storyboard.to_dict(),
@@ -595,12 +626,210 @@ def main(argv: List[str] | None = None) -> None:
         'decisions': [asdict(decision) for decision in decisions],
     }
 
+    if render_job is not None:
+        output['render_job'] = render_job.summary()
+        storage_result = render_job.storage
     if storage_result:
-        output['storage'] = asdict(storage_result)
+        output['storage'] = storage_result
     if preferences:
         output['preferences'] = asdict(preferences)
 
-    print(json.dumps(output, indent=2))
+    return output
+
+
+def load_batch_manifest(path: Path) -> List[Dict[str, Any]]:
+    """Reads POI entries from a JSON array or a JSON-lines file."""
+
+    text = path.read_text()
+    if text.lstrip().startswith('['):
+        entries = serialization.loads(text)
+    else:
+        entries = [serialization.loads(line) for line in text.splitlines() if line.strip()]
+    if not all(isinstance(entry, dict) for entry in entries):
+        raise ValueError(f'Batch manifest {path} must contain JSON objects')
+    return entries
+
+
+def select_assets(
+    assets: Iterable[Asset | CompactAsset],
+    asset_filter: Optional[Dict[str, Any]],
+) -> List[Asset | CompactAsset]:
+    """Narrows a shared asset pool to one POI using id/tag/source/language filters."""
+
+    if not asset_filter:
+        return list(assets)
+
+    def normalised(key: str) -> set[str]:
+        values = asset_filter.get(key) or []
+        if isinstance(values, str):
+            values = comma_separated_list(values)
+        return {str(value).lower() for value in values}
+
+    ids = {str(value) for value in asset_filter.get('ids') or []}
+    tags = normalised('tags')
+    sources = normalised('sources')
+    languages = normalised('languages')
+
+    selected: List[Asset | CompactAsset] = []
+    for asset in assets:
+        if ids and asset.id not in ids:
+            continue
+        if tags and not tags.intersection(tag.lower() for tag in asset.tags):
+            continue
+        if sources and asset.source.lower() not in sources:
+            continue
+        if languages and (asset.language or '').lower() not in languages:
+            continue
+        selected.append(asset)
+    return selected
+
+
+def run_batch(
+    args: argparse.Namespace,
+    providers: PipelineProviders,
+    *,
+    preferences: Optional[PreferenceResult] = None,
+) -> None:
+    """Renders every POI in the manifest, emitting one JSON line per POI."""
+
+    entries = load_batch_manifest(args.manifest)
+    manifest_dir = args.manifest.resolve().parent
+    asset_cache: Dict[Path, List[Asset | CompactAsset]] = {}
+    defaults = poi_options_from_args(args)
+    queued_jobs: List[str] = []
+    seen_ids: set[str] = set()
+
+    for index, entry in enumerate(entries):
+        poi_id = entry.get('id')
+        # Ids name the storage paths and fingerprint index, so they are never made up.
+        if not poi_id or poi_id in seen_ids:
+            error = 'Batch entry has no "id"' if not poi_id else f'Duplicate batch entry id "{poi_id}"'
+            print(serialization.dumps_text(
+                {'poi_id': poi_id or None, 'entry': index + 1, 'status': 'error', 'error': error},
+                compact=True,
+            ), flush=True)
+            continue
+        seen_ids.add(poi_id)
+        try:
+            input_value = entry.get('input') or entry.get('assets')
+            if input_value:
+                input_path = Path(input_value)
+                if not input_path.is_absolute():
+                    input_path = manifest_dir / input_path
+            elif args.input:
+                input_path = args.input
+            else:
+                raise ValueError('Batch entry has no "input" and --input was not provided')
+
+            input_path = input_path.resolve()
+            if input_path not in asset_cache:
+                asset_cache[input_path] = list(open_input_assets(input_path, args))
+
+            tags = entry.get('tags', defaults['tags'])
+            if isinstance(tags, str):
+                tags = comma_separated_list(tags)
+
+            poi_options = {
+                **defaults,
+                'id': poi_id,
+                'name': entry.get('name') or defaults['name'],
+                'locale': entry.get('locale') or defaults['locale'],
+                'distance': entry.get('distance') or defaults['distance'],
+                'hours': entry.get('hours') or defaults['hours'],
+                'tags': list(tags or []),
+            }
+            assets = select_assets(asset_cache[input_path], entry.get('asset_filter'))
+            output = run_pipeline(
+                'render',
+                assets,
+                args=args,
+                providers=providers,
+                poi_options=poi_options,
+                preferences=preferences,
+                drain_render_queue=False,
+            )
+            result = {'poi_id': poi_id, 'status': 'ok', **output}
+            if 'render_job' in output:
+                queued_jobs.append(output['render_job']['id'])
+        except Exception as exc:  # noqa: BLE001 - one bad POI must not abort the batch
+            result = {'poi_id': poi_id, 'status': 'error', 'error': str(exc)}
+        print(serialization.dumps_text(result, compact=True), flush=True)
+
+    if queued_jobs:
+        # One line per queued render once the pool has driven it to a final state.
+        for job in providers.render_pool.run_until_complete(queued_jobs, timeout=args.render_timeout):
+            print(serialization.dumps_text(
+                {'poi_id': job.poi_id, 'status': 'render', 'render_job': job.summary()},
+                compact=True,
+            ), flush=True)
+
+
+def run_sweep(args: argparse.Namespace, storage: LocalRenderStorage) -> Dict[str, Any]:
+    """Deletes expired local renders in bounded batches and reports what was removed."""
+
+    reindexed = storage.reindex() if args.storage_reindex else 0
+    removed: List[RenderRecord] = []
+    batches = 0
+    while args.storage_sweep_max_batches is None or batches < args.storage_sweep_max_batches:
+        batch = storage.sweep_expired(batch_size=args.storage_sweep_batch_size)
+        if not batch:
+            break
+        removed.extend(batch)
+        batches += 1
+    return {
+        'status': 'swept',
+        'reindexed': reindexed,
+        'batches': batches,
+        'removed': len(removed),
+        'freed_bytes': sum(record.total_bytes for record in removed),
+        'remaining': len(storage.index),
+    }
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.command == 'sweep':
+        if args.storage_provider != 'local':
+            parser.error('the sweep command only supports --storage-provider local')
+        storage = create_storage(StorageConfig(
+            provider='local',
+            output_dir=Path(args.storage_output_dir),
+            retention_days=args.storage_retention_days,
+        ))
+        print(serialization.dumps_text(run_sweep(args, storage), compact=args.compact_json))
+        return
+
+    if args.command == 'batch' and not args.manifest:
+        parser.error('--manifest is required for the batch command')
+    if args.command != 'batch' and not args.input:
+        parser.error('--input is required for the demo and render commands')
+
+    preferences = None
+    if args.profile:
+        profile_data = serialization.loads(args.profile.read_bytes())
+        preferences = detect_preferences(profile_data)
+
+    if args.storage_provider == 'gcs' and not args.storage_gcs_bucket:
+        parser.error('--storage-gcs-bucket is required when using --storage-provider gcs')
+
+    providers = build_providers(args, parser, with_storage=args.command != 'demo')
+
+    if args.command == 'batch':
+        run_batch(args, providers, preferences=preferences)
+        return
+
+    output = run_pipeline(
+        args.command,
+        open_input_assets(args.input, args),
+        args=args,
+        providers=providers,
+        poi_options=poi_options_from_args(args),
+        preferences=preferences,
+        remotion_props_output=args.remotion_props_output,
+    )
+    print(serialization.dumps_text(output, compact=args.compact_json))
 
 
 if __name__ == '__main__':
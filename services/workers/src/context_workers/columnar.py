@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .models import Asset, FilterDecision, FilterRules
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is an optional extra
+    np = None
+
+# Reason codes in evaluation order; index into FILTER_REASONS for the FilterDecision text.
+FILTER_REASONS: Tuple[str, ...] = (
+    'eligible',
+    'asset_marked_flagged',
+    'moderation_blocked',
+    'locale_not_supported',
+    'engagement_below_threshold',
+)
+_ELIGIBLE, _FLAGGED, _MODERATION, _LOCALE, _ENGAGEMENT = range(len(FILTER_REASONS))
+
+
+def _require_numpy():
+    if np is None:
+        raise RuntimeError('numpy must be installed to use the columnar asset path')
+    return np
+
+
+@dataclass
+class AssetTable:
+    """Column-oriented view of a batch of assets for vectorized filtering and ranking.
+
+    Moderation labels and languages are interned to integer ids (``-1`` is padding /
+    missing) so predicates become array comparisons. ``assets`` keeps the original
+    objects so survivors can be materialized by index.
+    """
+
+    assets: List[Asset]
+    views: 'np.ndarray'
+    likes: 'np.ndarray'
+    comments: 'np.ndarray'
+    shares: 'np.ndarray'
+    timestamp_score: 'np.ndarray'
+    is_flagged: 'np.ndarray'
+    language_ids: 'np.ndarray'
+    label_ids: 'np.ndarray'
+    label_vocabulary: Dict[str, int] = field(default_factory=dict)
+    language_vocabulary: Dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def from_assets(cls, assets: Iterable[Asset]) -> 'AssetTable':
+        numpy = _require_numpy()
+        assets = list(assets)
+        size = len(assets)
+
+        views = numpy.empty(size, dtype=numpy.int64)
+        likes = numpy.empty(size, dtype=numpy.int64)
+        comments = numpy.empty(size, dtype=numpy.int64)
+        shares = numpy.empty(size, dtype=numpy.int64)
+        timestamp_score = numpy.empty(size, dtype=numpy.float64)
+        is_flagged = numpy.empty(size, dtype=bool)
+        language_ids = numpy.empty(size, dtype=numpy.int32)
+
+        label_vocabulary: Dict[str, int] = {}
+        language_vocabulary: Dict[str, int] = {}
+        label_rows: List[List[int]] = []
+        width = 0
+
+        for index, asset in enumerate(assets):
+            metrics = asset.metrics
+            views[index] = metrics.views
+            likes[index] = metrics.likes
+            comments[index] = metrics.comments
+            shares[index] = metrics.shares
+            timestamp_score[index] = asset.timestamp_score
+            is_flagged[index] = bool(asset.is_flagged)
+            language_ids[index] = (
+                language_vocabulary.setdefault(asset.language, len(language_vocabulary))
+                if asset.language
+                else -1
+            )
+            row = [
+                label_vocabulary.setdefault(label.lower(), len(label_vocabulary))
+                for label in asset.moderation_labels
+            ]
+            label_rows.append(row)
+            width = max(width, len(row))
+
+        label_ids = numpy.full((size, width), -1, dtype=numpy.int32)
+        for index, row in enumerate(label_rows):
+            if row:
+                label_ids[index, : len(row)] = row
+
+        return cls(
+            assets=assets,
+            views=views,
+            likes=likes,
+            comments=comments,
+            shares=shares,
+            timestamp_score=timestamp_score,
+            is_flagged=is_flagged,
+            language_ids=language_ids,
+            label_ids=label_ids,
+            label_vocabulary=label_vocabulary,
+            language_vocabulary=language_vocabulary,
+        )
+
+    def __len__(self) -> int:
+        return len(self.assets)
+
+    @property
+    def engagement(self) -> 'np.ndarray':
+        return self.likes + self.comments + self.shares
+
+    def scores(self) -> 'np.ndarray':
+        """Ranking score, identical to ``filtering.asset_score`` element-wise."""
+
+        return self.engagement * 0.7 + self.timestamp_score * 0.3
+
+    def take(self, indices: Sequence[int]) -> List[Asset]:
+        return [self.assets[int(index)] for index in indices]
+
+
+def evaluate_filters(table: AssetTable, rules: Optional[FilterRules] = None) -> Tuple['np.ndarray', 'np.ndarray']:
+    """Returns per-asset reason codes (see ``FILTER_REASONS``) and decision scores.
+
+    Predicates apply in the scalar path's order, so the first failing rule wins.
+    """
+
+    numpy = _require_numpy()
+    if rules is None:
+        rules = FilterRules()
+
+    engagement = table.engagement
+    size = len(table)
+
+    banned_ids = [
+        table.label_vocabulary[label.lower()]
+        for label in rules.banned_labels
+        if label.lower() in table.label_vocabulary
+    ]
+    if banned_ids and table.label_ids.shape[1]:
+        moderated = numpy.isin(table.label_ids, banned_ids).any(axis=1)
+    else:
+        moderated = numpy.zeros(size, dtype=bool)
+
+    if rules.locale_whitelist:
+        allowed_ids = [
+            table.language_vocabulary[locale]
+            for locale in rules.locale_whitelist
+            if locale in table.language_vocabulary
+        ]
+        unsupported = (table.language_ids >= 0) & ~numpy.isin(table.language_ids, allowed_ids)
+    else:
+        unsupported = numpy.zeros(size, dtype=bool)
+
+    codes = numpy.select(
+        [table.is_flagged, moderated, unsupported, engagement < rules.min_engagement],
+        [_FLAGGED, _MODERATION, _LOCALE, _ENGAGEMENT],
+        default=_ELIGIBLE,
+    ).astype(numpy.int8)
+    scores = numpy.where((codes == _FLAGGED) | (codes == _MODERATION), 0.0, engagement.astype(numpy.float64))
+    return codes, scores
+
+
+def filter_table(
+    table: AssetTable,
+    rules: Optional[FilterRules] = None,
+) -> Tuple['np.ndarray', List[FilterDecision]]:
+    """Vectorized ``filter_assets``: returns surviving row indices and per-asset decisions."""
+
+    numpy = _require_numpy()
+    codes, scores = evaluate_filters(table, rules)
+    decisions = [
+        FilterDecision(
+            asset_id=asset.id,
+            passed=code == _ELIGIBLE,
+            reasons=[FILTER_REASONS[code]],
+            score=score,
+        )
+        for asset, code, score in zip(table.assets, codes.tolist(), scores.tolist())
+    ]
+    return numpy.flatnonzero(codes == _ELIGIBLE), decisions
+
+
+def rank_indices(table: AssetTable, indices: Optional['np.ndarray'] = None) -> 'np.ndarray':
+    """Row indices ordered by descending score; ties keep input order like ``sorted``."""
+
+    numpy = _require_numpy()
+    if indices is None:
+        indices = numpy.arange(len(table))
+    scores = table.scores()[indices]
+    return indices[numpy.argsort(-scores, kind='stable')]
+
+
+def top_k_indices(table: AssetTable, k: int, indices: Optional['np.ndarray'] = None) -> 'np.ndarray':
+    """Best ``k`` row indices via ``argpartition``; equals ``rank_indices(...)[:k]``.
+
+    Only the ``k`` selected rows are sorted. Ties at the cut-off keep the earliest rows,
+    matching the stable full ranking.
+    """
+
+    numpy = _require_numpy()
+    if indices is None:
+        indices = numpy.arange(len(table))
+    if k <= 0 or not len(indices):
+        return indices[:0]
+    if k >= len(indices):
+        return rank_indices(table, indices)
+
+    scores = table.scores()[indices]
+    partition = numpy.argpartition(-scores, k - 1)[:k]
+    threshold = scores[partition].min()
+    above = numpy.flatnonzero(scores > threshold)
+    tied = numpy.flatnonzero(scores == threshold)[: k - len(above)]
+    chosen = numpy.sort(numpy.concatenate([above, tied]))
+    return indices[chosen[numpy.argsort(-scores[chosen], kind='stable')]]
+
+
+def filter_assets_columnar(
+    assets: Iterable[Asset],
+    rules: Optional[FilterRules] = None,
+) -> Tuple[List[Asset], List[FilterDecision]]:
+    """Drop-in equivalent of ``filtering.filter_assets`` evaluated over an :class:`AssetTable`."""
+
+    table = assets if isinstance(assets, AssetTable) else AssetTable.from_assets(assets)
+    survivors, decisions = filter_table(table, rules)
+    return table.take(survivors), decisions
+
+
+def rank_assets_columnar(assets: Iterable[Asset]) -> List[Asset]:
+    """Drop-in equivalent of ``filtering.rank_assets`` using a vectorized stable argsort."""
+
+    table = assets if isinstance(assets, AssetTable) else AssetTable.from_assets(assets)
+    return table.take(rank_indices(table))
+
+
+def top_k_assets_columnar(assets: Iterable[Asset], k: int) -> List[Asset]:
+    """Columnar equivalent of ``filtering.top_k_assets``."""
+
+    table = assets if isinstance(assets, AssetTable) else AssetTable.from_assets(assets)
+    return table.take(top_k_indices(table, k))
+
+
+__all__ = [
+    'AssetTable',
+    'FILTER_REASONS',
+    'evaluate_filters',
+    'filter_assets_columnar',
+    'filter_table',
+    'rank_assets_columnar',
+    'rank_indices',
+    'top_k_assets_columnar',
+    'top_k_indices',
+]
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import sys
+from types import MappingProxyType
+from typing import Any, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from . import serialization
+from .models import Asset, AssetMetrics
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if value else value
+
+
+def _intern_all(values: Iterable[str]) -> Tuple[str, ...]:
+    return tuple(sys.intern(value) for value in values)
+
+
+class CompactMetrics:
+    """Slotted, read-mostly counterpart of :class:`AssetMetrics`."""
+
+    __slots__ = ('views', 'likes', 'comments', 'shares')
+
+    def __init__(self, views: int = 0, likes: int = 0, comments: int = 0, shares: int = 0) -> None:
+        self.views = views
+        self.likes = likes
+        self.comments = comments
+        self.shares = shares
+
+    @property
+    def engagement(self) -> int:
+        return self.likes + self.comments + self.shares
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (CompactMetrics, AssetMetrics)):
+            return NotImplemented
+        return (self.views, self.likes, self.comments, self.shares) == (
+            other.views,
+            other.likes,
+            other.comments,
+            other.shares,
+        )
+
+    def __repr__(self) -> str:
+        return f'CompactMetrics(views={self.views}, likes={self.likes}, comments={self.comments}, shares={self.shares})'
+
+
+class CompactAsset:
+    """Memory-compact asset for large feeds; duck-types :class:`Asset` for filtering, ranking and labelling.
+
+    ``source``, ``language``, labels and tags are interned so repeated values share one
+    string, and list fields are tuples (``scenes`` may be reassigned by the labeller).
+    ``extra`` keeps the mapping it was built from without copying it, and reads back
+    as a read-only view; assign a new mapping to change it. ``timestamp_score``, the
+    one ``extra`` key ranking needs, gets its own slot computed once at construction.
+    """
+
+    __slots__ = (
+        'id',
+        'source',
+        'url',
+        'caption',
+        'language',
+        'moderation_labels',
+        'is_flagged',
+        'metrics',
+        'tags',
+        'scenes',
+        'timestamp_score',
+        '_extra',
+    )
+
+    def __init__(
+        self,
+        id: str,
+        source: str,
+        url: str,
+        caption: Optional[str] = None,
+        language: Optional[str] = None,
+        moderation_labels: Iterable[str] = (),
+        is_flagged: bool = False,
+        metrics: CompactMetrics | Mapping[str, Any] | AssetMetrics | None = None,
+        tags: Iterable[str] = (),
+        scenes: Iterable[str] = (),
+        extra: Mapping[str, Any] | str | None = None,
+    ) -> None:
+        self.id = id
+        self.source = _intern(source)
+        self.url = url
+        self.caption = caption
+        self.language = _intern(language)
+        self.moderation_labels = _intern_all(moderation_labels)
+        self.is_flagged = bool(is_flagged)
+        self.metrics = _compact_metrics(metrics)
+        self.tags = _intern_all(tags)
+        self.scenes = _intern_all(scenes)
+        if isinstance(extra, str):
+            extra = serialization.loads(extra) if extra else None
+        self._extra = extra or None
+        self.timestamp_score = _timestamp_score(extra)
+
+    @property
+    def extra(self) -> Mapping[str, Any]:
+        """Read-only, so it cannot drift from the ``timestamp_score`` slot."""
+
+        return MappingProxyType(self._extra if self._extra is not None else {})
+
+    @extra.setter
+    def extra(self, value: Mapping[str, Any]) -> None:
+        self._extra = dict(value) or None
+        self.timestamp_score = _timestamp_score(value)
+
+    @classmethod
+    def from_record(cls, record: Mapping[str, Any]) -> 'CompactAsset':
+        """Builds a compact asset straight from a decoded JSON record, skipping ``Asset``."""
+
+        return cls(**record)
+
+    @classmethod
+    def from_asset(cls, asset: Asset) -> 'CompactAsset':
+        return cls(
+            id=asset.id,
+            source=asset.source,
+            url=asset.url,
+            caption=asset.caption,
+            language=asset.language,
+            moderation_labels=asset.moderation_labels,
+            is_flagged=asset.is_flagged,
+            metrics=asset.metrics,
+            tags=asset.tags,
+            scenes=asset.scenes,
+            extra=dict(asset.extra),
+        )
+
+    def to_asset(self) -> Asset:
+        metrics = self.metrics
+        return Asset(
+            id=self.id,
+            source=self.source,
+            url=self.url,
+            caption=self.caption,
+            language=self.language,
+            moderation_labels=list(self.moderation_labels),
+            is_flagged=self.is_flagged,
+            metrics=AssetMetrics(
+                views=metrics.views,
+                likes=metrics.likes,
+                comments=metrics.comments,
+                shares=metrics.shares,
+            ),
+            tags=list(self.tags),
+            scenes=list(self.scenes),
+            extra=dict(self.extra),
+        )
+
+    def __repr__(self) -> str:
+        return f'CompactAsset(id={self.id!r}, source={self.source!r}, url={self.url!r})'
+
+
+def _timestamp_score(extra: Optional[Mapping[str, Any]]) -> float:
+    return float(extra.get('timestamp_score', 0)) if extra else 0.0
+
+
+def _compact_metrics(metrics: CompactMetrics | Mapping[str, Any] | AssetMetrics | None) -> CompactMetrics:
+    if metrics is None:
+        return CompactMetrics()
+    if isinstance(metrics, CompactMetrics):
+        return metrics
+    if isinstance(metrics, AssetMetrics):
+        return CompactMetrics(metrics.views, metrics.likes, metrics.comments, metrics.shares)
+    return CompactMetrics(**metrics)
+
+
+def compact_assets(assets: Iterable[Asset]) -> Iterator[CompactAsset]:
+    for asset in assets:
+        yield CompactAsset.from_asset(asset)
+
+
+def expand_assets(assets: Iterable[CompactAsset]) -> List[Asset]:
+    return [asset.to_asset() for asset in assets]
+
+
+__all__ = [
+    'CompactAsset',
+    'CompactMetrics',
+    'compact_assets',
+    'expand_assets',
+]
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-from typing import Iterable, List, Optional
+import asyncio
+from typing import Iterable, List, Optional, Tuple
 
-from .models import Asset, ExtractionConfig, HighlightFrame, HighlightNarrative
-from .narrative import ScriptGenerator, StaticScriptGenerator
+from .async_support import to_async
+from .models import Asset, ExtractionConfig, HighlightFrame, HighlightNarrative, NarrativeScript
+from .narrative import AsyncScriptGenerator, ScriptGenerator, StaticScriptGenerator
 from .codexierge import CodexiergeGenerator
-from .summarization import Summarizer, StaticSummarizer
+from .summarization import AsyncSummarizer, Summarizer, StaticSummarizer
 
 
 def build_highlight_narrative(
@@ -16,13 +18,57 @@ def build_highlight_narrative(
 ) -> HighlightNarrative:
     """Compose a highlight narrative from ranked assets."""
 
+    config, assets = _prepare(assets, config)
+
+    if summarizer is None:
+        summarizer = StaticSummarizer()
+    if script_generator is None:
+        script_generator = StaticScriptGenerator()
+
+    captions = [asset.caption or asset.source.title() for asset in assets]
+    summary = summarizer.summarize(captions, locale=assets[0].language)
+    script = script_generator.generate(assets[: config.frame_sample_size], locale=assets[0].language)
+    return _assemble(assets, config, summary, script, summarizer)
+
+
+async def build_highlight_narrative_async(
+    assets: Iterable[Asset],
+    config: Optional[ExtractionConfig] = None,
+    summarizer: Optional[AsyncSummarizer] = None,
+    script_generator: Optional[AsyncScriptGenerator] = None,
+) -> HighlightNarrative:
+    """Async variant of :func:`build_highlight_narrative`; summary and script requests run concurrently."""
+
+    config, assets = _prepare(assets, config)
+
+    summarizer = to_async(summarizer or StaticSummarizer())
+    script_generator = to_async(script_generator or StaticScriptGenerator())
+
+    captions = [asset.caption or asset.source.title() for asset in assets]
+    summary, script = await asyncio.gather(
+        summarizer.summarize(captions, locale=assets[0].language),
+        script_generator.generate(assets[: config.frame_sample_size], locale=assets[0].language),
+    )
+    return _assemble(assets, config, summary, script, getattr(summarizer, 'provider', summarizer))
+
+
+def _prepare(assets: Iterable[Asset], config: Optional[ExtractionConfig]) -> Tuple[ExtractionConfig, List[Asset]]:
     if config is None:
         config = ExtractionConfig()
 
     assets = list(assets)
     if not assets:
         raise ValueError('At least one asset is required to assemble a highlight narrative.')
+    return config, assets
+
 
+def _assemble(
+    assets: List[Asset],
+    config: ExtractionConfig,
+    summary: str,
+    script: NarrativeScript,
+    summarizer: object,
+) -> HighlightNarrative:
     frames: List[HighlightFrame] = []
     rationale: List[str] = []
 
@@ -30,18 +76,9 @@ def build_highlight_narrative(
         frames.append(HighlightFrame(image_url=asset.url, caption=asset.caption))
         rationale.append(_rationale_from_asset(asset))
 
-    if summarizer is None:
-        summarizer = StaticSummarizer()
-
-    captions = [asset.caption or asset.source.title() for asset in assets]
-    summary = summarizer.summarize(captions, locale=assets[0].language)
     if not summary:
         summary = _compose_summary(assets)
 
-    if script_generator is None:
-        script_generator = StaticScriptGenerator()
-    script = script_generator.generate(assets[: config.frame_sample_size], locale=assets[0].language)
-
     codexierge = CodexiergeGenerator().generate(assets[: config.frame_sample_size])
 
     provenance = {
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Iterable, List, Tuple
+import heapq
+from typing import Iterable, Iterator, List, Tuple
 
 from .models import Asset, FilterDecision, FilterRules
 
@@ -19,12 +20,21 @@ def filter_assets(assets: Iterable[Asset], rules: FilterRules | None = None) ->
     Returns surviving assets alongside per-asset decisions.
     """
 
+    decisions: List[FilterDecision] = []
+    survivors = list(iter_filtered(assets, rules, decisions))
+    return survivors, decisions
+
+
+def iter_filtered(
+    assets: Iterable[Asset],
+    rules: FilterRules | None = None,
+    decisions: List[FilterDecision] | None = None,
+) -> Iterator[Asset]:
+    """Lazily yields surviving assets, appending every decision to ``decisions`` if given."""
+
     if rules is None:
         rules = FilterRules()
 
-    survivors: List[Asset] = []
-    decisions: List[FilterDecision] = []
-
     banned = {label.lower() for label in rules.banned_labels}
 
     for asset in assets:
@@ -48,30 +58,56 @@ def filter_assets(assets: Iterable[Asset], rules: FilterRules | None = None) ->
             passed, reason, score = _passed(score, "eligible")
             reasons.append(reason)
 
-        decisions.append(
-            FilterDecision(
-                asset_id=asset.id,
-                passed=passed,
-                reasons=reasons,
-                score=float(score),
+        if decisions is not None:
+            decisions.append(
+                FilterDecision(
+                    asset_id=asset.id,
+                    passed=passed,
+                    reasons=reasons,
+                    score=float(score),
+                )
             )
-        )
 
         if passed:
-            survivors.append(asset)
+            yield asset
 
-    return survivors, decisions
+
+def asset_score(asset: Asset) -> float:
+    """Engagement + recency score used for ranking.
+
+    Recency is approximated by a timestamp stored in `extra['timestamp_score']` where higher is newer;
+    it is read through ``asset.timestamp_score`` so :class:`CompactAsset` never decodes ``extra``.
+    """
+
+    return asset.metrics.engagement * 0.7 + asset.timestamp_score * 0.3
 
 
 def rank_assets(assets: Iterable[Asset]) -> List[Asset]:
-    """Order assets by simple engagement + recency heuristics.
+    """Order assets by simple engagement + recency heuristics."""
+
+    return sorted(list(assets), key=asset_score, reverse=True)
+
 
-    Recency is approximated by a timestamp stored in `extra['timestamp_score']` where higher is newer.
+def top_k_assets(assets: Iterable[Asset], k: int) -> List[Asset]:
+    """Best ``k`` assets by ``asset_score`` without sorting the whole input.
+
+    Streams ``assets`` through a size-``k`` heap, so memory is O(k); the result equals
+    ``rank_assets(assets)[:k]``, ties included.
     """
 
-    def asset_score(asset: Asset) -> float:
-        engagement = asset.metrics.engagement
-        timestamp_score = float(asset.extra.get('timestamp_score', 0))
-        return engagement * 0.7 + timestamp_score * 0.3
+    if k <= 0:
+        return []
+    return heapq.nlargest(k, assets, key=asset_score)
 
-    return sorted(list(assets), key=asset_score, reverse=True)
+
+def select_top_assets(
+    assets: Iterable[Asset],
+    k: int,
+    rules: FilterRules | None = None,
+) -> Tuple[List[Asset], List[FilterDecision]]:
+    """Streaming ``filter_assets`` + ``rank_assets(...)[:k]`` that retains only the top ``k``
+    survivors alongside the full decision log."""
+
+    decisions: List[FilterDecision] = []
+    top = top_k_assets(iter_filtered(assets, rules, decisions), k)
+    return top, decisions
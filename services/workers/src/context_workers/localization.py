@@ -0,0 +1,610 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from types import SimpleNamespace
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .accessibility import (
+    AccessibilityFields,
+    AccessibilityGenerator,
+    AccessibilityItem,
+    AsyncAccessibilityGenerator,
+    StaticAccessibilityGenerator,
+)
+from .models import AccessibilityAssets, LocaleNarration
+from .translation import AsyncTranslator, TranslationItem, Translator
+from .tts import AsyncTTSSynthesizer, TTSRequestItem, TTSSynthesis, TTSSynthesizer
+
+STATIC_ACCESSIBILITY_FALLBACK = StaticAccessibilityGenerator()
+DEFAULT_LOCALIZATION_WORKERS = 4
+
+
+def comma_separated_list(value: str | None) -> List[str]:
+    if not value:
+        return []
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+
+def parse_locale_list(value: str | None, fallback: str) -> List[str]:
+    locales = comma_separated_list(value)
+    if not locales:
+        return [fallback]
+    base_norm = fallback.split('-')[0]
+    if all(locale.split('-')[0] != base_norm for locale in locales):
+        locales = [fallback, *locales]
+    return locales
+
+
+def localize_text(text: str, locale: str, base_locale: str) -> str:
+    base = base_locale.split('-')[0]
+    target = locale.split('-')[0]
+    if target == base:
+        return text
+    return f"[{locale}] {text}"
+
+
+def collect_translation_items(storyboard) -> List[TranslationItem]:
+    items: List[TranslationItem] = []
+
+    narrative = storyboard.narrative
+    if narrative.summary:
+        items.append(TranslationItem('narrative.summary', narrative.summary))
+
+    for index, rationale in enumerate(narrative.rationale):
+        items.append(TranslationItem(f'narrative.rationale.{index}', rationale))
+
+    if narrative.script:
+        for beat in narrative.script.beats:
+            items.append(TranslationItem(f'script.{beat.id}.title', beat.title))
+            items.append(TranslationItem(f'script.{beat.id}.content', beat.content))
+
+    for segment in storyboard.segments:
+        if segment.caption:
+            items.append(TranslationItem(f'segment.{segment.asset_id}.caption', segment.caption))
+        if segment.script_title:
+            items.append(TranslationItem(f'segment.{segment.asset_id}.title', segment.script_title))
+        if segment.script_content:
+            items.append(TranslationItem(f'segment.{segment.asset_id}.script', segment.script_content))
+        if segment.rationale:
+            items.append(TranslationItem(f'segment.{segment.asset_id}.rationale', segment.rationale))
+        if segment.frame and segment.frame.caption:
+            items.append(TranslationItem(f'frame.{segment.asset_id}.caption', segment.frame.caption))
+
+    return items
+
+
+def _ensure_translation_coverage(
+    items: List[TranslationItem],
+    translations: Dict[str, str],
+    locale: str,
+    base_locale: str,
+) -> Dict[str, str]:
+    results = dict(translations)
+    for item in items:
+        if not item.text:
+            continue
+        if not results.get(item.key):
+            results[item.key] = localize_text(item.text, locale, base_locale)
+    return results
+
+
+def _is_base_locale(locale: str, base_locale: str) -> bool:
+    return locale.split('-')[0] == base_locale.split('-')[0]
+
+
+class PreviousLocalization:
+    """Localized output of an earlier render of the same POI, for diff-aware re-localization.
+
+    Built from that render's stored ``storyboard.json``. A translation is reused while its
+    source text is unchanged, a narration while the locale's subtitles are unchanged, and
+    a segment's accessibility fields while their inputs are unchanged. Fallback
+    translations (``[locale] text``) are never reused, so failed keys are retried.
+    """
+
+    def __init__(self, storyboard: Dict[str, Any]) -> None:
+        narrative = storyboard.get('narrative') or {}
+        self.base_locale = narrative.get('language') or 'en'
+        self.translations: Dict[str, Dict[str, str]] = narrative.get('translations') or {}
+        self.narrations: Dict[str, Dict[str, Any]] = narrative.get('narrations') or {}
+        self.accessibility: Dict[str, Dict[str, Dict[str, str]]] = narrative.get('accessibility') or {}
+        # Enough of a storyboard for _accessibility_items to rebuild the previous inputs.
+        self._storyboard = SimpleNamespace(
+            narrative=SimpleNamespace(summary=narrative.get('summary') or '', translations=self.translations),
+            segments=[SimpleNamespace(**segment) for segment in storyboard.get('segments') or []],
+        )
+
+    def split_translations(
+        self,
+        items: List[TranslationItem],
+        locale: str,
+        base_locale: str,
+    ) -> Tuple[Dict[str, str], List[TranslationItem]]:
+        """Reusable translations by key, and the items that still need translating."""
+
+        if base_locale != self.base_locale:
+            return {}, list(items)
+        sources = self.translations.get(base_locale) or {}
+        translated = self.translations.get(locale) or {}
+        reused: Dict[str, str] = {}
+        changed: List[TranslationItem] = []
+        for item in items:
+            value = translated.get(item.key)
+            if value and sources.get(item.key) == item.text and value != localize_text(item.text, locale, base_locale):
+                reused[item.key] = value
+            else:
+                changed.append(item)
+        return reused, changed
+
+    def synthesis(self, locale: str, subtitles: Dict[str, str]) -> Optional[TTSSynthesis]:
+        """The previous narration for ``locale`` if it spoke exactly these subtitles."""
+
+        narration = self.narrations.get(locale)
+        if not narration or not narration.get('audio_url') or narration.get('subtitles') != subtitles:
+            return None
+        return TTSSynthesis(
+            locale=locale,
+            audio_url=narration['audio_url'],
+            voice=narration.get('voice'),
+            segments=dict(subtitles),
+        )
+
+    def split_accessibility(
+        self,
+        items: List[AccessibilityItem],
+        locale: str,
+        base_locale: str,
+    ) -> Tuple[Dict[str, AccessibilityFields], List[AccessibilityItem]]:
+        """Reusable accessibility fields by segment id, and the items that still need generating."""
+
+        bundle = self.accessibility.get(locale)
+        if not bundle or base_locale != self.base_locale:
+            return {}, list(items)
+        previous_items = {item.id: item for item in _accessibility_items(self._storyboard, locale, base_locale)}
+        # Static fallbacks stand in for failed generations; like fallback translations they are retried.
+        fallback = STATIC_ACCESSIBILITY_FALLBACK.generate(items, target_locale=locale)
+        reused: Dict[str, AccessibilityFields] = {}
+        changed: List[AccessibilityItem] = []
+        for item in items:
+            values = [bundle.get(name, {}).get(item.id) for name in ('captions', 'audio_descriptions', 'haptic_cues', 'alt_text')]
+            fields = AccessibilityFields(*values) if all(value is not None for value in values) else None
+            if fields is not None and previous_items.get(item.id) == item and fields != fallback.get(item.id):
+                reused[item.id] = fields
+            else:
+                changed.append(item)
+        return reused, changed
+
+
+@dataclass
+class _LocaleLocalization:
+    """Per-locale output computed off the main thread before merging into the storyboard."""
+
+    locale: str
+    translations: Dict[str, str]
+    subtitles: Dict[str, str]
+    audio_url: Optional[str] = None
+    voice: Optional[str] = None
+    timings: Dict[str, float] = field(default_factory=dict)
+    reuse: Dict[str, Any] = field(default_factory=dict)
+
+
+def _subtitle_map(storyboard, translations: Dict[str, str], locale: str, base_locale: str) -> Dict[str, str]:
+    subtitle_map: Dict[str, str] = {}
+    for segment in storyboard.segments:
+        subtitle_candidates = [
+            translations.get(f'segment.{segment.asset_id}.script'),
+            translations.get(f'segment.{segment.asset_id}.caption'),
+            translations.get(f'narrative.summary'),
+        ]
+        fallback_source = segment.script_content or segment.caption or storyboard.narrative.summary
+        subtitle_map[segment.asset_id] = next(
+            (text for text in subtitle_candidates if text),
+            localize_text(fallback_source, locale, base_locale),
+        )
+    return subtitle_map
+
+
+def _tts_items(storyboard, subtitle_map: Dict[str, str]) -> List[TTSRequestItem]:
+    return [
+        TTSRequestItem(id=segment.asset_id, text=subtitle_map.get(segment.asset_id, ''))
+        for segment in storyboard.segments
+    ]
+
+
+def _finish_locale(
+    storyboard,
+    locale: str,
+    translations: Dict[str, str],
+    subtitle_map: Dict[str, str],
+    synthesis: Optional[TTSSynthesis],
+    *,
+    audio_prefix: str | None,
+    started: float,
+    translated: float,
+    reuse: Optional[Dict[str, Any]] = None,
+) -> _LocaleLocalization:
+    synthesized = time.perf_counter()
+    audio_url = None
+    voice = None
+    if synthesis:
+        audio_url = synthesis.audio_url or audio_url
+        voice = synthesis.voice or voice
+        subtitle_map.update(synthesis.segments)
+
+    if not audio_url and audio_prefix:
+        prefix = audio_prefix.rstrip('/')
+        audio_url = f"{prefix}/{storyboard.poi.id}-{locale}.mp3"
+
+    return _LocaleLocalization(
+        locale=locale,
+        translations=translations,
+        subtitles=subtitle_map,
+        audio_url=audio_url,
+        voice=voice,
+        timings={
+            'translation_ms': round((translated - started) * 1000, 3),
+            'tts_ms': round((synthesized - translated) * 1000, 3),
+            'total_ms': round((synthesized - started) * 1000, 3),
+        },
+        reuse=reuse or {},
+    )
+
+
+def _translate_locale(
+    translation_items: List[TranslationItem],
+    locale: str,
+    base_locale: str,
+    previous: Optional[PreviousLocalization],
+) -> Tuple[List[TranslationItem], Dict[str, str], Dict[str, Any]]:
+    """Items the translator still has to see, translations reused from ``previous`` and stats."""
+
+    if previous is None:
+        return translation_items, {}, {}
+    reused, changed = previous.split_translations(translation_items, locale, base_locale)
+    return changed, reused, {'translations_reused': len(reused), 'translations_requested': len(changed)}
+
+
+def _merge_translations(
+    translation_items: List[TranslationItem],
+    reused: Dict[str, str],
+    raw_translations: Dict[str, str],
+    locale: str,
+    base_locale: str,
+) -> Dict[str, str]:
+    if not reused:
+        return _ensure_translation_coverage(translation_items, raw_translations, locale, base_locale)
+    merged = {**reused, **raw_translations}
+    # Keep the key order of a full run so the stored document does not churn.
+    ordered = {item.key: merged.pop(item.key) for item in translation_items if item.key in merged}
+    ordered.update(merged)
+    return _ensure_translation_coverage(translation_items, ordered, locale, base_locale)
+
+
+def _localize_locale(
+    storyboard,
+    locale: str,
+    *,
+    base_locale: str,
+    translation_items: List[TranslationItem],
+    base_translations: Dict[str, str],
+    audio_prefix: str | None,
+    translator: Translator,
+    tts_generator: Optional[TTSSynthesizer],
+    previous: Optional[PreviousLocalization] = None,
+) -> _LocaleLocalization:
+    """Translates then synthesizes one locale without touching the storyboard."""
+
+    started = time.perf_counter()
+    reuse: Dict[str, Any] = {}
+    if _is_base_locale(locale, base_locale):
+        locale_translations = base_translations.copy()
+    else:
+        pending, reused, reuse = _translate_locale(translation_items, locale, base_locale, previous)
+        raw_translations = translator.translate(pending, locale, source_locale=base_locale) if pending else {}
+        locale_translations = _merge_translations(translation_items, reused, raw_translations, locale, base_locale)
+    translated = time.perf_counter()
+
+    subtitle_map = _subtitle_map(storyboard, locale_translations, locale, base_locale)
+    synthesis = None
+    if tts_generator:
+        synthesis = previous.synthesis(locale, subtitle_map) if previous else None
+        if previous is not None:
+            reuse['tts'] = 'synthesized' if synthesis is None else 'reused'
+        if synthesis is None:
+            synthesis = tts_generator.synthesize(
+                _tts_items(storyboard, subtitle_map),
+                locale=locale,
+                base_locale=base_locale,
+                poi_id=storyboard.poi.id,
+            )
+    return _finish_locale(
+        storyboard,
+        locale,
+        locale_translations,
+        subtitle_map,
+        synthesis,
+        audio_prefix=audio_prefix,
+        started=started,
+        translated=translated,
+        reuse=reuse,
+    )
+
+
+def _prepare_localization(storyboard, locales: Iterable[str]):
+    base_locale = storyboard.narrative.language or 'en'
+    translation_items = collect_translation_items(storyboard)
+    base_translations = {item.key: item.text for item in translation_items}
+    storyboard.narrative.translations[base_locale] = base_translations.copy()
+    storyboard.invalidate('narrative')
+    pending = list(dict.fromkeys(locale for locale in locales if locale))
+    return base_locale, translation_items, base_translations, pending
+
+
+def _merge_localizations(storyboard, results: List[_LocaleLocalization]) -> Dict[str, LocaleNarration]:
+    """Applies per-locale results to the storyboard in the order given."""
+
+    narrations: Dict[str, LocaleNarration] = {}
+    segments_by_id = {segment.asset_id: segment for segment in storyboard.segments}
+    timings: Dict[str, Dict[str, float]] = {}
+    reuse: Dict[str, Dict[str, Any]] = {}
+    for result in results:
+        locale = result.locale
+        storyboard.narrative.translations[locale] = result.translations
+        for seg_id, text in result.subtitles.items():
+            segment = segments_by_id.get(seg_id)
+            if segment is None:
+                continue
+            segment.subtitles[locale] = text
+            if segment.frame:
+                segment.frame.subtitles[locale] = text
+            storyboard.invalidate(segment)
+
+        narrations[locale] = LocaleNarration(
+            locale=locale,
+            audio_url=result.audio_url,
+            voice=result.voice,
+            subtitles=result.subtitles,
+        )
+        timings[locale] = result.timings
+        if result.reuse:
+            reuse[locale] = result.reuse
+
+    storyboard.narrative.narrations = narrations
+    storyboard.narrative.provenance['localization_timings'] = timings
+    if reuse:
+        storyboard.narrative.provenance['localization_reuse'] = reuse
+    storyboard.invalidate('narrative')
+    return narrations
+
+
+def generate_voiceovers_and_subtitles(
+    storyboard,
+    locales: List[str],
+    *,
+    audio_prefix: str | None,
+    translator: Translator,
+    tts_generator: Optional[TTSSynthesizer] = None,
+    max_workers: int = DEFAULT_LOCALIZATION_WORKERS,
+    previous: Optional[PreviousLocalization] = None,
+) -> Dict[str, LocaleNarration]:
+    """Localizes subtitles and narration for every locale.
+
+    Each locale runs translation followed immediately by TTS on a bounded thread pool,
+    so one locale's synthesis overlaps other locales' translation. Results are merged
+    back in ``locales`` order, and per-locale timings land in
+    ``narrative.provenance['localization_timings']``. With ``previous``, only new or
+    changed keys are translated and unchanged narrations are not re-synthesized; the
+    counts land in ``narrative.provenance['localization_reuse']``.
+    """
+
+    base_locale, translation_items, base_translations, pending = _prepare_localization(storyboard, locales)
+    task = partial(
+        _localize_locale,
+        storyboard,
+        base_locale=base_locale,
+        translation_items=translation_items,
+        base_translations=base_translations,
+        audio_prefix=audio_prefix,
+        translator=translator,
+        tts_generator=tts_generator,
+        previous=previous,
+    )
+
+    workers = max(1, min(max_workers, len(pending)))
+    if workers == 1:
+        results = [task(locale) for locale in pending]
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='codex-localize') as executor:
+            results = list(executor.map(task, pending))
+
+    return _merge_localizations(storyboard, results)
+
+
+def _accessibility_items(
+    storyboard,
+    locale: str,
+    base_locale: str,
+    translations: Optional[Dict[str, str]] = None,
+) -> List[AccessibilityItem]:
+    if translations is None:
+        translations = storyboard.narrative.translations.get(locale) or {}
+    items: List[AccessibilityItem] = []
+    for segment in storyboard.segments:
+        clip_title = translations.get(f'segment.{segment.asset_id}.title') or segment.script_title or segment.caption or 'Highlight'
+        clip_summary = (
+            translations.get(f'segment.{segment.asset_id}.script')
+            or translations.get('narrative.summary')
+            or segment.script_content
+            or storyboard.narrative.summary
+        )
+        caption = translations.get(f'segment.{segment.asset_id}.caption') or segment.caption or clip_summary
+        rationale = translations.get(f'segment.{segment.asset_id}.rationale') or segment.rationale or clip_summary
+        items.append(
+            AccessibilityItem(
+                id=segment.asset_id,
+                clip_title=clip_title,
+                clip_summary=clip_summary,
+                caption=caption,
+                rationale=rationale,
+                tags=list(segment.tags),
+                locale=locale,
+                base_locale=base_locale,
+            )
+        )
+    return items
+
+
+def _accessibility_bundle(
+    locale: str,
+    items: List[AccessibilityItem],
+    generated: Dict[str, AccessibilityFields],
+) -> AccessibilityAssets:
+    fallback = STATIC_ACCESSIBILITY_FALLBACK.generate(items, target_locale=locale)
+
+    bundle = AccessibilityAssets(locale=locale)
+    for item in items:
+        fields = generated.get(item.id) or fallback.get(item.id)
+        if not fields:
+            continue
+        bundle.captions[item.id] = fields.caption
+        bundle.audio_descriptions[item.id] = fields.audio_description
+        bundle.haptic_cues[item.id] = fields.haptic_cue
+        bundle.alt_text[item.id] = fields.alt_text
+    return bundle
+
+
+def _record_accessibility_reuse(storyboard, reuse: Dict[str, Dict[str, int]]) -> None:
+    if not reuse:
+        return
+    recorded = storyboard.narrative.provenance.setdefault('localization_reuse', {})
+    for locale, counts in reuse.items():
+        recorded.setdefault(locale, {}).update(counts)
+
+
+def generate_accessibility_assets(
+    storyboard,
+    locales: List[str],
+    *,
+    generator: AccessibilityGenerator,
+    previous: Optional[PreviousLocalization] = None,
+) -> Dict[str, AccessibilityAssets]:
+    """Builds accessibility bundles per locale; with ``previous``, unchanged segments are reused."""
+
+    base_locale = storyboard.narrative.language or 'en'
+    accessibility_map: Dict[str, AccessibilityAssets] = {}
+    reuse: Dict[str, Dict[str, int]] = {}
+
+    for locale in locales:
+        if not locale:
+            continue
+
+        items = _accessibility_items(storyboard, locale, base_locale)
+        reused, pending = previous.split_accessibility(items, locale, base_locale) if previous else ({}, items)
+        generated = (generator.generate(pending, target_locale=locale) or {}) if pending else {}
+        accessibility_map[locale] = _accessibility_bundle(locale, items, {**reused, **generated})
+        if previous is not None:
+            reuse[locale] = {'accessibility_reused': len(reused), 'accessibility_requested': len(pending)}
+
+    storyboard.narrative.accessibility.update(accessibility_map)
+    _record_accessibility_reuse(storyboard, reuse)
+    storyboard.invalidate('narrative')
+    return accessibility_map
+
+
+async def _completed(value):
+    return value
+
+
+async def localize_storyboard_async(
+    storyboard,
+    locales: List[str],
+    *,
+    audio_prefix: str | None,
+    translator: AsyncTranslator,
+    accessibility_generator: AsyncAccessibilityGenerator,
+    tts_generator: Optional[AsyncTTSSynthesizer] = None,
+    previous: Optional[PreviousLocalization] = None,
+) -> Tuple[Dict[str, LocaleNarration], Dict[str, AccessibilityAssets]]:
+    """Async equivalent of voiceovers followed by accessibility assets for every locale.
+
+    All locales run concurrently; within a locale, TTS and accessibility generation are
+    awaited together as soon as its translation lands. ``tts_ms`` in the recorded timings
+    therefore covers both requests. ``previous`` enables the same reuse as the sync path.
+    """
+
+    base_locale, translation_items, base_translations, pending = _prepare_localization(storyboard, locales)
+
+    async def localize(locale: str) -> Tuple[_LocaleLocalization, AccessibilityAssets]:
+        started = time.perf_counter()
+        reuse: Dict[str, Any] = {}
+        if _is_base_locale(locale, base_locale):
+            locale_translations = base_translations.copy()
+        else:
+            items, reused, reuse = _translate_locale(translation_items, locale, base_locale, previous)
+            raw_translations = await translator.translate(items, locale, source_locale=base_locale) if items else {}
+            locale_translations = _merge_translations(translation_items, reused, raw_translations, locale, base_locale)
+        translated = time.perf_counter()
+
+        subtitle_map = _subtitle_map(storyboard, locale_translations, locale, base_locale)
+        accessibility_items = _accessibility_items(storyboard, locale, base_locale, locale_translations)
+        reused_fields, accessibility_pending = (
+            previous.split_accessibility(accessibility_items, locale, base_locale)
+            if previous
+            else ({}, accessibility_items)
+        )
+        reused_synthesis = previous.synthesis(locale, subtitle_map) if previous and tts_generator else None
+        if tts_generator and reused_synthesis is None:
+            synthesis_call = tts_generator.synthesize(
+                _tts_items(storyboard, subtitle_map),
+                locale=locale,
+                base_locale=base_locale,
+                poi_id=storyboard.poi.id,
+            )
+        else:
+            synthesis_call = _completed(reused_synthesis)
+        if tts_generator and previous is not None:
+            reuse['tts'] = 'synthesized' if reused_synthesis is None else 'reused'
+        if accessibility_pending:
+            accessibility_call = accessibility_generator.generate(accessibility_pending, target_locale=locale)
+        else:
+            accessibility_call = _completed({})
+        synthesis, generated = await asyncio.gather(synthesis_call, accessibility_call)
+        if previous is not None:
+            reuse['accessibility_reused'] = len(reused_fields)
+            reuse['accessibility_requested'] = len(accessibility_pending)
+        localized = _finish_locale(
+            storyboard,
+            locale,
+            locale_translations,
+            subtitle_map,
+            synthesis,
+            audio_prefix=audio_prefix,
+            started=started,
+            translated=translated,
+            reuse=reuse,
+        )
+        bundle = _accessibility_bundle(locale, accessibility_items, {**reused_fields, **(generated or {})})
+        return localized, bundle
+
+    results = await asyncio.gather(*(localize(locale) for locale in pending))
+    narrations = _merge_localizations(storyboard, [localized for localized, _ in results])
+    accessibility_map = {bundle.locale: bundle for _, bundle in results}
+    storyboard.narrative.accessibility.update(accessibility_map)
+    storyboard.invalidate('narrative')
+    return narrations, accessibility_map
+
+
+__all__ = [
+    'DEFAULT_LOCALIZATION_WORKERS',
+    'PreviousLocalization',
+    'collect_translation_items',
+    'comma_separated_list',
+    'generate_accessibility_assets',
+    'generate_voiceovers_and_subtitles',
+    'localize_storyboard_async',
+    'localize_text',
+    'parse_locale_list',
+]
@@ -34,6 +34,12 @@ class Asset:
         if isinstance(self.metrics, dict):
             self.metrics = AssetMetrics(**self.metrics)
 
+    @property
+    def timestamp_score(self) -> float:
+        """Recency hint from ``extra['timestamp_score']`` (higher is newer; 0 when absent)."""
+
+        return float(self.extra.get('timestamp_score', 0))
+
 
 @dataclass
 class FilterDecision:
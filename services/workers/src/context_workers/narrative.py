@@ -1,12 +1,17 @@
 from __future__ import annotations
 
-import json
-import urllib.error
-import urllib.request
 from dataclasses import dataclass
 from typing import Dict, Iterable, List, Optional, Protocol
 
 from .models import Asset, NarrativeScript, ScriptBeat
+from .transport import (
+    AsyncHTTPTransport,
+    HTTPTransport,
+    TransportError,
+    bearer_headers,
+    get_async_transport,
+    get_transport,
+)
 
 
 class ScriptGenerator(Protocol):
@@ -15,6 +20,12 @@ class ScriptGenerator(Protocol):
     def generate(self, assets: Iterable[Asset], locale: Optional[str] = None) -> NarrativeScript: ...
 
 
+class AsyncScriptGenerator(Protocol):
+    """Async interface for narrative script generators."""
+
+    async def generate(self, assets: Iterable[Asset], locale: Optional[str] = None) -> NarrativeScript: ...
+
+
 @dataclass
 class StaticScriptGenerator:
     """Offline three-beat script builder for demos."""
@@ -58,46 +69,76 @@ class GPTScriptGenerator:
     endpoint: str
     api_key: str
     timeout_seconds: float = 8.0
+    transport: Optional[HTTPTransport] = None
 
     def generate(self, assets: Iterable[Asset], locale: Optional[str] = None) -> NarrativeScript:
-        payload: Dict[str, object] = {
-            'locale': locale or 'en',
-            'prompts': [self._asset_prompt(asset) for asset in assets],
-        }
-        req = urllib.request.Request(
-            self.endpoint,
-            data=json.dumps(payload).encode('utf-8'),
-            headers={
-                'Content-Type': 'application/json',
-                'Authorization': f'Bearer {self.api_key}',
-            },
-        )
+        payload = _script_payload(assets, locale)
+        transport = self.transport or get_transport()
         try:
-            with urllib.request.urlopen(req, timeout=self.timeout_seconds) as response:
-                data = json.loads(response.read().decode('utf-8'))
-        except urllib.error.URLError as error:
+            data = transport.post_json(
+                self.endpoint,
+                payload,
+                headers=bearer_headers(self.api_key),
+                timeout=self.timeout_seconds,
+            )
+        except TransportError as error:
             raise RuntimeError(f'GPT script request failed: {error}')
+        return _script_from_response(data, payload['locale'])
 
-        beats_data = data.get('beats') or []
-        script_beats = [
-            ScriptBeat(id=beat.get('id', f'beat-{idx}'), title=beat.get('title', f'Beat {idx}'), content=beat.get('content', ''))
-            for idx, beat in enumerate(beats_data, start=1)
-        ]
-        if not script_beats:
-            raise RuntimeError('GPT script response did not include beats')
-
-        provenance = data.get('provenance', {})
-        provenance.setdefault('generator', 'gpt')
-
-        return NarrativeScript(beats=script_beats, locale=payload['locale'], provenance=provenance)
-
-    def _asset_prompt(self, asset: Asset) -> Dict[str, object]:
-        return {
-            'id': asset.id,
-            'caption': asset.caption,
-            'scenes': asset.scenes,
-            'tags': asset.tags,
-        }
+
+@dataclass
+class AsyncGPTScriptGenerator:
+    """Async variant of :class:`GPTScriptGenerator`."""
+
+    endpoint: str
+    api_key: str
+    timeout_seconds: float = 8.0
+    transport: Optional[AsyncHTTPTransport] = None
+
+    async def generate(self, assets: Iterable[Asset], locale: Optional[str] = None) -> NarrativeScript:
+        payload = _script_payload(assets, locale)
+        transport = self.transport or get_async_transport()
+        try:
+            data = await transport.post_json(
+                self.endpoint,
+                payload,
+                headers=bearer_headers(self.api_key),
+                timeout=self.timeout_seconds,
+            )
+        except TransportError as error:
+            raise RuntimeError(f'GPT script request failed: {error}')
+        return _script_from_response(data, payload['locale'])
+
+
+def _script_payload(assets: Iterable[Asset], locale: Optional[str]) -> Dict[str, object]:
+    return {
+        'locale': locale or 'en',
+        'prompts': [_asset_prompt(asset) for asset in assets],
+    }
+
+
+def _asset_prompt(asset: Asset) -> Dict[str, object]:
+    return {
+        'id': asset.id,
+        'caption': asset.caption,
+        'scenes': asset.scenes,
+        'tags': asset.tags,
+    }
+
+
+def _script_from_response(data: Dict[str, object], locale: str) -> NarrativeScript:
+    beats_data = data.get('beats') or []
+    script_beats = [
+        ScriptBeat(id=beat.get('id', f'beat-{idx}'), title=beat.get('title', f'Beat {idx}'), content=beat.get('content', ''))
+        for idx, beat in enumerate(beats_data, start=1)
+    ]
+    if not script_beats:
+        raise RuntimeError('GPT script response did not include beats')
+
+    provenance = data.get('provenance', {})
+    provenance.setdefault('generator', 'gpt')
+
+    return NarrativeScript(beats=script_beats, locale=locale, provenance=provenance)
 
 
 def create_script_generator(provider: str | None, options: Optional[Dict[str, object]] = None) -> ScriptGenerator:
@@ -116,3 +157,22 @@ def create_script_generator(provider: str | None, options: Optional[Dict[str, ob
         return GPTScriptGenerator(endpoint=str(endpoint), api_key=str(api_key))
 
     raise ValueError(f'Unsupported script generator: {provider}')
+
+
+def create_async_script_generator(
+    provider: str | None,
+    options: Optional[Dict[str, object]] = None,
+) -> AsyncScriptGenerator:
+    """Async counterpart of :func:`create_script_generator`."""
+
+    generator = create_script_generator(provider, options)
+    if isinstance(generator, GPTScriptGenerator):
+        return AsyncGPTScriptGenerator(
+            endpoint=generator.endpoint,
+            api_key=generator.api_key,
+            timeout_seconds=generator.timeout_seconds,
+        )
+
+    from .async_support import to_async
+
+    return to_async(generator)
@@ -1,14 +1,14 @@
 from __future__ import annotations
 
-import json
 import logging
 import os
 import re
-import urllib.error
-import urllib.request
+from bisect import bisect_right
 from collections import Counter
 from dataclasses import dataclass, field
-from typing import Any, Dict, Iterable, List
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Pattern, Sequence, Set, Tuple
+
+from .transport import TransportError, bearer_headers, get_transport
 
 LANGUAGE_KEYWORDS = {
     'es': [
@@ -72,7 +72,7 @@ class PreferenceResult:
 TextIterable = Iterable[str]
 
 
-def _gather_text(profile: Dict[str, Any]) -> List[str]:
+def _static_texts(profile: Dict[str, Any]) -> List[str]:
     texts: List[str] = []
 
     settings = profile.get('settings') or {}
@@ -88,19 +88,133 @@ def _gather_text(profile: Dict[str, Any]) -> List[str]:
             elif isinstance(value, (list, tuple)):
                 texts.extend(str(item) for item in value)
 
-    conversation = profile.get('conversation_history') or []
-    for entry in conversation:
-        if isinstance(entry, str):
-            texts.append(entry)
-        elif isinstance(entry, dict):
-            content = entry.get('content')
-            if isinstance(content, str):
-                texts.append(content)
-
     return [text.lower() for text in texts]
 
 
-def _score_locales(texts: TextIterable, profile: Dict[str, Any]) -> Counter[str]:
+def _conversation_text(entry: Any) -> str | None:
+    if isinstance(entry, str):
+        return entry.lower()
+    if isinstance(entry, dict):
+        content = entry.get('content')
+        if isinstance(content, str):
+            return content.lower()
+    return None
+
+
+def _gather_text(profile: Dict[str, Any]) -> List[str]:
+    texts = _static_texts(profile)
+    for entry in profile.get('conversation_history') or []:
+        text = _conversation_text(entry)
+        if text is not None:
+            texts.append(text)
+    return texts
+
+
+ACCESSIBILITY_KEYS = ('captions', 'audio_description', 'haptics', 'reduced_motion')
+
+_TEXT_SEPARATOR = '\n'
+
+
+class _JoinedTexts:
+    """All texts of a profile joined once so each pattern scans them in a single call."""
+
+    def __init__(self, texts: Sequence[str]) -> None:
+        self.texts = texts
+        self.blob = _TEXT_SEPARATOR.join(texts)
+        self.starts: List[int] = []
+        position = 0
+        for text in texts:
+            self.starts.append(position)
+            position += len(text) + len(_TEXT_SEPARATOR)
+
+    def matching_texts(self, pattern: Pattern[str], *, first_only: bool = False) -> Tuple[int, int]:
+        """Returns how many texts ``pattern`` matches and the index of the first one.
+
+        The scan resumes at the next text after each hit, so a text is never searched twice.
+        """
+
+        hits = 0
+        first = -1
+        position = 0
+        count = len(self.texts)
+        while True:
+            match = pattern.search(self.blob, position)
+            if match is None:
+                return hits, first
+            index = bisect_right(self.starts, match.start()) - 1
+            text_end = self.starts[index] + len(self.texts[index])
+            # A match spilling over the separator is confirmed against the text on its own.
+            if match.end() <= text_end or pattern.search(self.texts[index]):
+                hits += 1
+                if first < 0:
+                    first = index
+                if first_only:
+                    return hits, first
+            if index + 1 >= count:
+                return hits, first
+            position = self.starts[index + 1]
+
+
+class PreferenceMatcher:
+    """Locale and accessibility keyword tables, compiled once and reused for every profile.
+
+    ``scan`` returns per-locale match counts (the number of (text, pattern) pairs that
+    match, as the heuristic has always counted them) and the accessibility flags.
+    """
+
+    def __init__(
+        self,
+        language_keywords: Mapping[str, Sequence[str]] = LANGUAGE_KEYWORDS,
+        accessibility_patterns: Mapping[str, Sequence[str]] = ACCESSIBILITY_PATTERNS,
+    ) -> None:
+        self.locale_patterns: List[Tuple[str, Pattern[str]]] = [
+            (locale, re.compile(pattern))
+            for locale, patterns in language_keywords.items()
+            for pattern in patterns
+        ]
+        self._locale_order = {locale: position for position, locale in enumerate(language_keywords)}
+        self.accessibility_patterns: Dict[str, List[Pattern[str]]] = {
+            key: [re.compile(pattern) for pattern in patterns]
+            for key, patterns in accessibility_patterns.items()
+        }
+
+    def scan(self, texts: Sequence[str]) -> Tuple[Counter[str], Dict[str, bool]]:
+        joined = _JoinedTexts(texts)
+        return self._locale_counts(joined), self._accessibility_flags(joined)
+
+    def locale_counts(self, texts: Sequence[str]) -> Counter[str]:
+        return self._locale_counts(_JoinedTexts(texts))
+
+    def accessibility_flags(self, texts: Sequence[str]) -> Dict[str, bool]:
+        return self._accessibility_flags(_JoinedTexts(texts))
+
+    def _locale_counts(self, joined: _JoinedTexts) -> Counter[str]:
+        totals: Dict[str, int] = {}
+        first_seen: Dict[str, int] = {}
+        if not joined.texts:
+            return Counter()
+        for locale, pattern in self.locale_patterns:
+            hits, first = joined.matching_texts(pattern)
+            if hits:
+                totals[locale] = totals.get(locale, 0) + hits
+                first_seen[locale] = min(first_seen.get(locale, first), first)
+        # Keep the insertion order a per-text scan would produce so ties rank identically.
+        ordered = sorted(totals, key=lambda locale: (first_seen[locale], self._locale_order[locale]))
+        return Counter({locale: totals[locale] for locale in ordered})
+
+    def _accessibility_flags(self, joined: _JoinedTexts) -> Dict[str, bool]:
+        flags = {key: False for key in ACCESSIBILITY_KEYS}
+        if not joined.texts:
+            return flags
+        for key, patterns in self.accessibility_patterns.items():
+            flags[key] = any(joined.matching_texts(pattern, first_only=True)[0] for pattern in patterns)
+        return flags
+
+
+_DEFAULT_MATCHER = PreferenceMatcher()
+
+
+def _declared_locale_scores(profile: Dict[str, Any]) -> Counter[str]:
     scores: Counter[str] = Counter()
 
     declared = profile.get('preferred_locale') or profile.get('settings', {}).get('preferred_locale')
@@ -112,38 +226,23 @@ def _score_locales(texts: TextIterable, profile: Dict[str, Any]) -> Counter[str]
             value = signal.get('value')
             if isinstance(value, str):
                 scores[value.split('-')[0]] += 4
+    return scores
 
-    for text in texts:
-        for locale, patterns in LANGUAGE_KEYWORDS.items():
-            matches = sum(1 for pattern in patterns if re.search(pattern, text))
-            if matches:
-                scores[locale] += matches
 
+def _combine_locale_scores(declared: Counter[str], matches: Counter[str]) -> Counter[str]:
+    scores = declared + matches
     if not scores:
         scores['en'] = 1
     return scores
 
 
+def _score_locales(texts: TextIterable, profile: Dict[str, Any]) -> Counter[str]:
+    matches = _DEFAULT_MATCHER.locale_counts(list(texts))
+    return _combine_locale_scores(_declared_locale_scores(profile), matches)
+
+
 def _detect_accessibility(texts: TextIterable) -> Dict[str, bool]:
-    result = {
-        'captions': False,
-        'audio_description': False,
-        'haptics': False,
-        'reduced_motion': False,
-    }
-
-    for text in texts:
-        for key, patterns in ACCESSIBILITY_PATTERNS.items():
-            if any(re.search(pattern, text) for pattern in patterns):
-                if key == 'captions':
-                    result['captions'] = True
-                elif key == 'audio_description':
-                    result['audio_description'] = True
-                elif key == 'haptics':
-                    result['haptics'] = True
-                elif key == 'reduced_motion':
-                    result['reduced_motion'] = True
-    return result
+    return _DEFAULT_MATCHER.accessibility_flags(list(texts))
 
 
 def detect_preferences(profile: Dict[str, Any]) -> PreferenceResult:
@@ -165,13 +264,21 @@ def detect_preferences(profile: Dict[str, Any]) -> PreferenceResult:
 
 def _detect_preferences_heuristic(profile: Dict[str, Any]) -> PreferenceResult:
     texts = _gather_text(profile)
-    locale_scores = _score_locales(texts, profile)
+    locale_matches, accessibility = _DEFAULT_MATCHER.scan(texts)
+    return _build_heuristic_result(profile, _declared_locale_scores(profile), locale_matches, accessibility)
+
+
+def _build_heuristic_result(
+    profile: Dict[str, Any],
+    declared: Counter[str],
+    locale_matches: Counter[str],
+    accessibility: Dict[str, bool],
+) -> PreferenceResult:
+    locale_scores = _combine_locale_scores(declared, locale_matches)
     ranked = [locale for locale, _ in locale_scores.most_common()]
     primary = ranked[0]
     secondary = [loc for loc in ranked[1:]]
 
-    accessibility = _detect_accessibility(texts)
-
     notes: List[str] = []
     if profile.get('notes'):
         notes.extend(str(n) for n in profile['notes'])
@@ -196,36 +303,157 @@ def _detect_preferences_heuristic(profile: Dict[str, Any]) -> PreferenceResult:
     )
 
 
+_MIN_DECAYED_SCORE = 1e-6
+
+
+@dataclass
+class PreferenceTracker:
+    """Keeps running heuristic preference scores for one chat session.
+
+    ``update`` scans only the conversation turns added since the previous call, so
+    each turn costs O(new text) instead of re-scanning the whole history. ``window``
+    keeps only the last N turns, and ``decay`` multiplies earlier turns' locale scores
+    by the factor on every new turn. With neither, results match the local heuristic
+    in ``detect_preferences``. Accessibility needs stay set once seen unless a window
+    is configured. ``to_dict``/``from_dict`` round-trip the state so it can be stored
+    next to the session.
+    """
+
+    window: Optional[int] = None
+    decay: Optional[float] = None
+    turns_seen: int = 0
+    locale_scores: Dict[str, float] = field(default_factory=dict)
+    accessibility: List[str] = field(default_factory=list)
+    recent: List[Dict[str, Any]] = field(default_factory=list)
+    matcher: Optional[PreferenceMatcher] = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.window is not None and self.window < 1:
+            raise ValueError('window must be at least 1 turn')
+        if self.decay is not None and not 0 < self.decay <= 1:
+            raise ValueError('decay must be in (0, 1]')
+
+    def update(self, profile: Dict[str, Any]) -> PreferenceResult:
+        """Folds in turns appended to ``conversation_history`` since the last update.
+
+        A history shorter than what was already seen is treated as a new session.
+        """
+
+        history = profile.get('conversation_history') or []
+        if len(history) < self.turns_seen:
+            self.reset()
+        for entry in history[self.turns_seen:]:
+            self._fold_turn(_conversation_text(entry))
+        self.turns_seen = len(history)
+
+        static_matches, static_flags = self._get_matcher().scan(_static_texts(profile))
+        matches: Counter[str] = Counter(static_matches)
+        for locale, score in self._conversation_scores().items():
+            matches[locale] += score
+        accessibility = {key: static_flags[key] or key in self._conversation_needs() for key in ACCESSIBILITY_KEYS}
+        return _build_heuristic_result(profile, _declared_locale_scores(profile), matches, accessibility)
+
+    def reset(self) -> None:
+        self.turns_seen = 0
+        self.locale_scores = {}
+        self.accessibility = []
+        self.recent = []
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'window': self.window,
+            'decay': self.decay,
+            'turns_seen': self.turns_seen,
+            'locale_scores': dict(self.locale_scores),
+            'accessibility': list(self.accessibility),
+            'recent': [dict(turn) for turn in self.recent],
+        }
+
+    @classmethod
+    def from_dict(cls, payload: Dict[str, Any], matcher: Optional[PreferenceMatcher] = None) -> 'PreferenceTracker':
+        return cls(
+            window=payload.get('window'),
+            decay=payload.get('decay'),
+            turns_seen=int(payload.get('turns_seen') or 0),
+            locale_scores={str(k): float(v) for k, v in (payload.get('locale_scores') or {}).items()},
+            accessibility=[str(key) for key in payload.get('accessibility') or []],
+            recent=[dict(turn) for turn in payload.get('recent') or []],
+            matcher=matcher,
+        )
+
+    def _get_matcher(self) -> PreferenceMatcher:
+        return self.matcher or _DEFAULT_MATCHER
+
+    def _fold_turn(self, text: str | None) -> None:
+        if text is None:
+            counts: Counter[str] = Counter()
+            needs: List[str] = []
+        else:
+            counts, flags = self._get_matcher().scan([text])
+            needs = [key for key in ACCESSIBILITY_KEYS if flags[key]]
+
+        if self.window is not None:
+            turn: Dict[str, Any] = {}
+            if counts:
+                turn['locales'] = dict(counts)
+            if needs:
+                turn['accessibility'] = needs
+            self.recent.append(turn)
+            del self.recent[:-self.window]
+            return
+
+        if self.decay is not None and self.decay < 1:
+            self.locale_scores = {
+                locale: score * self.decay
+                for locale, score in self.locale_scores.items()
+                if score * self.decay >= _MIN_DECAYED_SCORE
+            }
+        for locale, count in counts.items():
+            self.locale_scores[locale] = self.locale_scores.get(locale, 0) + count
+        for key in needs:
+            if key not in self.accessibility:
+                self.accessibility.append(key)
+
+    def _conversation_scores(self) -> Dict[str, float]:
+        if self.window is None:
+            return self.locale_scores
+        scores: Dict[str, float] = {}
+        decay = self.decay if self.decay is not None else 1.0
+        newest = len(self.recent) - 1
+        for age, turn in enumerate(self.recent):
+            weight = decay ** (newest - age)
+            for locale, count in (turn.get('locales') or {}).items():
+                scores[locale] = scores.get(locale, 0) + count * weight
+        return scores
+
+    def _conversation_needs(self) -> Set[str]:
+        if self.window is None:
+            return set(self.accessibility)
+        return {key for turn in self.recent for key in turn.get('accessibility') or []}
+
+
 def _call_preference_service(profile: Dict[str, Any]) -> Dict[str, Any] | None:
     endpoint = os.environ.get('CODEX_PREFERENCES_ENDPOINT')
     api_key = os.environ.get('CODEX_PREFERENCES_API_KEY')
     if not endpoint or not api_key:
         return None
 
-    payload = json.dumps({'profile': profile}).encode('utf-8')
-    request = urllib.request.Request(
-        endpoint,
-        data=payload,
-        headers={
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {api_key}',
-        },
-    )
     timeout = float(os.environ.get('CODEX_PREFERENCES_TIMEOUT', '6'))
 
     try:
-        with urllib.request.urlopen(request, timeout=timeout) as response:
-            raw = response.read().decode('utf-8')
-    except urllib.error.URLError as error:
+        data = get_transport().post_json(
+            endpoint,
+            {'profile': profile},
+            headers=bearer_headers(api_key),
+            timeout=timeout,
+        )
+    except TransportError as error:
         logger.warning('Preference service request failed (%s); falling back to heuristic.', error)
         return None
 
-    try:
-        data = json.loads(raw)
-    except json.JSONDecodeError:
-        logger.warning('Preference service returned invalid JSON; falling back to heuristic.')
+    if not isinstance(data, dict):
+        logger.warning('Preference service returned an unexpected payload; falling back to heuristic.')
         return None
-
     return data
 
 
@@ -266,6 +494,8 @@ def _coerce_service_payload(payload: Dict[str, Any]) -> PreferenceResult:
 
 
 __all__ = [
+    'PreferenceMatcher',
     'PreferenceResult',
+    'PreferenceTracker',
     'detect_preferences',
 ]
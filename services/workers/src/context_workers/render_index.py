@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from . import serialization
+
+_SCHEMA = (
+    '''
+    CREATE TABLE IF NOT EXISTS renders (
+        poi_id TEXT NOT NULL,
+        render_id TEXT NOT NULL,
+        created_at REAL NOT NULL,
+        fingerprint TEXT,
+        locales TEXT NOT NULL,
+        sizes TEXT NOT NULL,
+        total_bytes INTEGER NOT NULL,
+        result TEXT NOT NULL,
+        PRIMARY KEY (poi_id, render_id)
+    )
+    ''',
+    'CREATE INDEX IF NOT EXISTS renders_poi_created_at ON renders (poi_id, created_at)',
+    'CREATE INDEX IF NOT EXISTS renders_created_at ON renders (created_at)',
+    'CREATE INDEX IF NOT EXISTS renders_poi_fingerprint ON renders (poi_id, fingerprint)',
+    '''
+    CREATE TABLE IF NOT EXISTS render_blobs (
+        poi_id TEXT NOT NULL,
+        render_id TEXT NOT NULL,
+        name TEXT NOT NULL,
+        PRIMARY KEY (poi_id, render_id, name)
+    )
+    ''',
+    'CREATE INDEX IF NOT EXISTS render_blobs_name ON render_blobs (name)',
+)
+
+
+@dataclass
+class RenderRecord:
+    """One stored render as tracked by the :class:`RenderIndex`."""
+
+    poi_id: str
+    render_id: str
+    created_at: float
+    fingerprint: Optional[str] = None
+    locales: List[str] = field(default_factory=list)
+    sizes: Dict[str, int] = field(default_factory=dict)
+    result: Dict[str, Any] = field(default_factory=dict)
+    # Content-addressed blobs the render's documents reference (not read back by queries).
+    blobs: List[str] = field(default_factory=list)
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(self.sizes.values())
+
+
+class RenderIndex:
+    """SQLite index of stored renders per POI, so lookups and retention avoid directory walks.
+
+    Rows are keyed by (poi_id, render_id); storing a render again replaces its row.
+    Pass ``':memory:'`` for a process-local index.
+    """
+
+    def __init__(self, path: str | Path = ':memory:', *, clock: Callable[[], float] = time.time) -> None:
+        self.path = str(path)
+        self.clock = clock
+        self._lock = threading.Lock()
+
+        if self.path != ':memory:':
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        for statement in _SCHEMA:
+            self._conn.execute(statement)
+
+    def record(self, record: RenderRecord) -> RenderRecord:
+        row = (
+            record.poi_id,
+            record.render_id,
+            record.created_at,
+            record.fingerprint,
+            serialization.dumps_text(record.locales, compact=True),
+            serialization.dumps_text(record.sizes, compact=True),
+            record.total_bytes,
+            serialization.dumps_text(record.result, compact=True),
+        )
+        key = (record.poi_id, record.render_id)
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                self._conn.execute('INSERT OR REPLACE INTO renders VALUES (?, ?, ?, ?, ?, ?, ?, ?)', row)
+                self._conn.execute('DELETE FROM render_blobs WHERE poi_id = ? AND render_id = ?', key)
+                self._conn.executemany(
+                    'INSERT INTO render_blobs VALUES (?, ?, ?)',
+                    [(*key, name) for name in record.blobs],
+                )
+                self._conn.execute('COMMIT')
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+        return record
+
+    def get(self, poi_id: str, render_id: str) -> Optional[RenderRecord]:
+        return self._fetch_one('SELECT * FROM renders WHERE poi_id = ? AND render_id = ?', (poi_id, render_id))
+
+    def latest(self, poi_id: str) -> Optional[RenderRecord]:
+        """The most recently stored render for ``poi_id`` (an index seek, not a scan)."""
+
+        return self._fetch_one(
+            'SELECT * FROM renders WHERE poi_id = ? ORDER BY created_at DESC LIMIT 1',
+            (poi_id,),
+        )
+
+    def find_fingerprint(self, poi_id: str, fingerprint: str) -> Optional[RenderRecord]:
+        """The newest render of ``poi_id`` stored with ``fingerprint``."""
+
+        return self._fetch_one(
+            'SELECT * FROM renders WHERE poi_id = ? AND fingerprint = ? ORDER BY created_at DESC LIMIT 1',
+            (poi_id, fingerprint),
+        )
+
+    def renders(self, poi_id: str, *, limit: Optional[int] = None) -> List[RenderRecord]:
+        """Renders for ``poi_id``, newest first."""
+
+        return self._fetch_all(
+            'SELECT * FROM renders WHERE poi_id = ? ORDER BY created_at DESC LIMIT ?',
+            (poi_id, -1 if limit is None else limit),
+        )
+
+    def expired(self, before: float, *, limit: int) -> List[RenderRecord]:
+        """Up to ``limit`` of the oldest renders created before ``before``."""
+
+        return self._fetch_all(
+            'SELECT * FROM renders WHERE created_at < ? ORDER BY created_at LIMIT ?',
+            (before, limit),
+        )
+
+    def remove(self, records: List[RenderRecord]) -> List[str]:
+        """Drops ``records``; returns the blobs no remaining render references."""
+
+        keys = [(record.poi_id, record.render_id) for record in records]
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                names = {
+                    row['name']
+                    for key in keys
+                    for row in self._conn.execute(
+                        'SELECT name FROM render_blobs WHERE poi_id = ? AND render_id = ?', key
+                    )
+                }
+                self._conn.executemany('DELETE FROM renders WHERE poi_id = ? AND render_id = ?', keys)
+                self._conn.executemany('DELETE FROM render_blobs WHERE poi_id = ? AND render_id = ?', keys)
+                orphaned = sorted(
+                    name
+                    for name in names
+                    if self._conn.execute('SELECT 1 FROM render_blobs WHERE name = ? LIMIT 1', (name,)).fetchone() is None
+                )
+                self._conn.execute('COMMIT')
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+        return orphaned
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM renders').fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _fetch_one(self, query: str, params: tuple) -> Optional[RenderRecord]:
+        with self._lock:
+            row = self._conn.execute(query, params).fetchone()
+        return _row_to_record(row) if row is not None else None
+
+    def _fetch_all(self, query: str, params: tuple) -> List[RenderRecord]:
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [_row_to_record(row) for row in rows]
+
+
+def _row_to_record(row: sqlite3.Row) -> RenderRecord:
+    return RenderRecord(
+        poi_id=row['poi_id'],
+        render_id=row['render_id'],
+        created_at=row['created_at'],
+        fingerprint=row['fingerprint'],
+        locales=serialization.loads(row['locales']),
+        sizes=serialization.loads(row['sizes']),
+        result=serialization.loads(row['result']),
+    )
+
+
+__all__ = ['RenderIndex', 'RenderRecord']
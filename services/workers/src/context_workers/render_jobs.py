@@ -0,0 +1,507 @@
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from . import serialization
+from .video_assembly import CreatomateError, CreatomateRenderer, PoiContext, Storyboard
+
+logger = logging.getLogger(__name__)
+
+JOB_QUEUED = 'queued'
+JOB_SUBMITTING = 'submitting'
+JOB_RENDERING = 'rendering'
+JOB_SUCCEEDED = 'succeeded'
+JOB_FAILED = 'failed'
+
+TERMINAL_STATES = frozenset({JOB_SUCCEEDED, JOB_FAILED})
+
+# Creatomate reports planned/waiting/transcribing/rendering while a job is in progress.
+CREATOMATE_TERMINAL_STATUSES = {'succeeded': JOB_SUCCEEDED, 'failed': JOB_FAILED}
+
+DEFAULT_RENDER_WORKERS = 4
+DEFAULT_POLL_INTERVAL = 5.0
+# A job still ``submitting`` this long after it was claimed belongs to a dead worker.
+DEFAULT_SUBMIT_LEASE = 300.0
+# 30 minutes at the default poll interval; Creatomate renders finish well within that.
+DEFAULT_MAX_POLLS = 360
+
+_SCHEMA = (
+    '''
+    CREATE TABLE IF NOT EXISTS render_jobs (
+        id TEXT PRIMARY KEY,
+        poi_id TEXT NOT NULL,
+        state TEXT NOT NULL,
+        render_id TEXT,
+        payload TEXT NOT NULL,
+        manifest TEXT NOT NULL,
+        storyboard TEXT NOT NULL,
+        fingerprint TEXT,
+        response TEXT,
+        storage TEXT,
+        error TEXT,
+        polls INTEGER NOT NULL DEFAULT 0,
+        created_at REAL NOT NULL,
+        updated_at REAL NOT NULL,
+        next_poll_at REAL
+    )
+    ''',
+    'CREATE INDEX IF NOT EXISTS render_jobs_state ON render_jobs (state, created_at)',
+    'CREATE INDEX IF NOT EXISTS render_jobs_render_id ON render_jobs (render_id)',
+)
+
+_JSON_COLUMNS = ('payload', 'manifest', 'storyboard', 'response', 'storage')
+
+
+@dataclass
+class RenderJob:
+    """One Creatomate render tracked from enqueue to stored artifacts."""
+
+    id: str
+    poi_id: str
+    state: str
+    payload: Dict[str, Any]
+    manifest: Dict[str, Any]
+    storyboard: Dict[str, Any]
+    # Dedup key handed to storage on success; see ``CreatomateRenderer.fingerprint``.
+    fingerprint: Optional[str] = None
+    render_id: Optional[str] = None
+    response: Optional[Dict[str, Any]] = None
+    storage: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    polls: int = 0
+    created_at: float = 0.0
+    updated_at: float = 0.0
+    next_poll_at: Optional[float] = None
+
+    @property
+    def done(self) -> bool:
+        return self.state in TERMINAL_STATES
+
+    def summary(self) -> Dict[str, Any]:
+        """The job without its (large) payload, manifest and storyboard documents."""
+
+        return {
+            key: value
+            for key, value in asdict(self).items()
+            if key not in {'payload', 'manifest', 'storyboard'}
+        }
+
+
+class StoryboardSnapshot:
+    """Read-only stand-in for a :class:`Storyboard` rebuilt from its serialized form.
+
+    Storage backends only need the POI, the segment count and ``to_dict()``, so a job
+    picked up after a restart can still be stored without re-running the pipeline.
+    """
+
+    def __init__(self, data: Dict[str, Any]) -> None:
+        self._data = data
+        self.poi = PoiContext(**data['poi'])
+        self.segments = list(data.get('segments') or [])
+
+    def to_dict(self) -> Dict[str, Any]:
+        return self._data
+
+
+class RenderJobQueue:
+    """Durable SQLite-backed queue of render jobs and their state transitions.
+
+    Jobs move ``queued → submitting → rendering → succeeded | failed``. Pass
+    ``':memory:'`` for a process-local queue.
+    """
+
+    def __init__(self, path: str | Path = ':memory:', *, clock: Callable[[], float] = time.time) -> None:
+        self.path = str(path)
+        self.clock = clock
+        self._lock = threading.Lock()
+
+        if self.path != ':memory:':
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        for statement in _SCHEMA:
+            self._conn.execute(statement)
+
+    def enqueue(
+        self,
+        storyboard: Storyboard,
+        render_payload: Dict[str, Any],
+        manifest: Dict[str, Any],
+        *,
+        fingerprint: Optional[str] = None,
+    ) -> RenderJob:
+        now = self.clock()
+        job = RenderJob(
+            id=f'job-{uuid.uuid4().hex[:12]}',
+            poi_id=storyboard.poi.id,
+            state=JOB_QUEUED,
+            payload=render_payload,
+            manifest=manifest,
+            storyboard=storyboard.to_dict(),
+            fingerprint=fingerprint,
+            created_at=now,
+            updated_at=now,
+        )
+        row = asdict(job)
+        for column in _JSON_COLUMNS:
+            row[column] = _dumps(row[column])
+        columns = ', '.join(row)
+        placeholders = ', '.join(f':{column}' for column in row)
+        with self._lock:
+            self._conn.execute(f'INSERT INTO render_jobs ({columns}) VALUES ({placeholders})', row)
+        return job
+
+    def claim(self, limit: int) -> List[RenderJob]:
+        """Atomically moves up to ``limit`` of the oldest queued jobs to ``submitting``."""
+
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                rows = self._conn.execute(
+                    'SELECT * FROM render_jobs WHERE state = ? ORDER BY created_at LIMIT ?',
+                    (JOB_QUEUED, limit),
+                ).fetchall()
+                now = self.clock()
+                self._conn.executemany(
+                    'UPDATE render_jobs SET state = ?, updated_at = ? WHERE id = ?',
+                    [(JOB_SUBMITTING, now, row['id']) for row in rows],
+                )
+                self._conn.execute('COMMIT')
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+        jobs = [_row_to_job(row) for row in rows]
+        for job in jobs:
+            job.state = JOB_SUBMITTING
+        return jobs
+
+    def update(self, job: RenderJob, **changes: Any) -> RenderJob:
+        """Applies ``changes`` to the job and persists them."""
+
+        changes['updated_at'] = self.clock()
+        for name, value in changes.items():
+            setattr(job, name, value)
+        assignments = ', '.join(f'{name} = :{name}' for name in changes)
+        params = {name: _dumps(value) if name in _JSON_COLUMNS else value for name, value in changes.items()}
+        params['id'] = job.id
+        with self._lock:
+            self._conn.execute(f'UPDATE render_jobs SET {assignments} WHERE id = :id', params)
+        return job
+
+    def get(self, job_id: str) -> Optional[RenderJob]:
+        return self._fetch_one('SELECT * FROM render_jobs WHERE id = ?', (job_id,))
+
+    def find_by_render_id(self, render_id: str) -> Optional[RenderJob]:
+        return self._fetch_one('SELECT * FROM render_jobs WHERE render_id = ?', (render_id,))
+
+    def jobs(self, state: Optional[str] = None) -> List[RenderJob]:
+        if state is None:
+            return self._fetch_all('SELECT * FROM render_jobs ORDER BY created_at', ())
+        return self._fetch_all('SELECT * FROM render_jobs WHERE state = ? ORDER BY created_at', (state,))
+
+    def due_for_poll(self, limit: int) -> List[RenderJob]:
+        return self._fetch_all(
+            'SELECT * FROM render_jobs WHERE state = ? AND (next_poll_at IS NULL OR next_poll_at <= ?) '
+            'ORDER BY next_poll_at LIMIT ?',
+            (JOB_RENDERING, self.clock(), limit),
+        )
+
+    def get_many(self, job_ids: Iterable[str]) -> List[RenderJob]:
+        """The jobs with these ids, in the order given (unknown ids are skipped)."""
+
+        jobs = [self.get(job_id) for job_id in job_ids]
+        return [job for job in jobs if job is not None]
+
+    def pending_count(self, job_ids: Optional[Iterable[str]] = None) -> int:
+        """Jobs not yet in a terminal state, optionally only among ``job_ids``."""
+
+        if job_ids is not None:
+            return sum(1 for job in self.get_many(job_ids) if not job.done)
+        placeholders = ', '.join('?' for _ in TERMINAL_STATES)
+        with self._lock:
+            (count,) = self._conn.execute(
+                f'SELECT COUNT(*) FROM render_jobs WHERE state NOT IN ({placeholders})',
+                tuple(TERMINAL_STATES),
+            ).fetchone()
+        return int(count)
+
+    def recover_interrupted(self, older_than: Optional[float] = None) -> int:
+        """Requeues jobs left in ``submitting`` by a crashed worker.
+
+        With ``older_than`` only jobs claimed at least that many seconds ago are
+        requeued, so a live worker's claims are left alone. Creatomate may already
+        have accepted such a job, so recovery can submit it twice.
+        """
+
+        cutoff = self.clock() - (older_than or 0.0)
+        with self._lock:
+            cursor = self._conn.execute(
+                'UPDATE render_jobs SET state = ?, updated_at = ? WHERE state = ? AND updated_at <= ?',
+                (JOB_QUEUED, self.clock(), JOB_SUBMITTING, cutoff),
+            )
+        return max(cursor.rowcount, 0)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _fetch_one(self, query: str, params: tuple) -> Optional[RenderJob]:
+        with self._lock:
+            row = self._conn.execute(query, params).fetchone()
+        return _row_to_job(row) if row is not None else None
+
+    def _fetch_all(self, query: str, params: tuple) -> List[RenderJob]:
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [_row_to_job(row) for row in rows]
+
+
+class RateLimiter:
+    """Spaces calls at least ``1 / rate`` seconds apart across threads."""
+
+    def __init__(
+        self,
+        rate: Optional[float],
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.interval = 1.0 / rate if rate and rate > 0 else 0.0
+        self.clock = clock
+        self.sleep = sleep
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if not self.interval:
+            return
+        with self._lock:
+            now = self.clock()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            self.sleep(slot - now)
+
+
+class RenderWorkerPool:
+    """Submits queued jobs to Creatomate and drives them to a terminal state.
+
+    At most ``workers`` submissions run at once and ``rate`` caps submissions per second.
+    Rendering jobs advance through ``poll`` or ``ingest_webhook``; succeeded jobs are
+    handed to ``storage`` and the resulting ``StorageResult`` is kept on the job. Jobs
+    stuck in ``submitting`` for ``submit_lease`` seconds are requeued, and renders
+    still unfinished after ``max_polls`` polls (or unknown to Creatomate) fail.
+    Nothing in this package serves a webhook route; the hosting service calls
+    ``ingest_webhook`` with the callback body.
+    """
+
+    def __init__(
+        self,
+        queue: RenderJobQueue,
+        renderer: CreatomateRenderer,
+        *,
+        storage: Any = None,
+        workers: int = DEFAULT_RENDER_WORKERS,
+        rate: Optional[float] = None,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        submit_lease: float = DEFAULT_SUBMIT_LEASE,
+        max_polls: int = DEFAULT_MAX_POLLS,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.queue = queue
+        self.renderer = renderer
+        self.storage = storage
+        self.workers = max(1, workers)
+        self.poll_interval = poll_interval
+        self.submit_lease = submit_lease
+        self.max_polls = max(1, max_polls)
+        self.sleep = sleep
+        self.limiter = RateLimiter(rate, sleep=sleep)
+
+    def enqueue(
+        self,
+        storyboard: Storyboard,
+        render_payload: Dict[str, Any],
+        manifest: Dict[str, Any],
+        *,
+        fingerprint: Optional[str] = None,
+    ) -> RenderJob:
+        return self.queue.enqueue(storyboard, render_payload, manifest, fingerprint=fingerprint)
+
+    def submit_pending(self) -> List[RenderJob]:
+        """Submits every queued job on the worker pool and returns them."""
+
+        submitted: List[RenderJob] = []
+        while True:
+            batch = self.queue.claim(self.workers * 4)
+            if not batch:
+                return submitted
+            if len(batch) == 1 or self.workers == 1:
+                submitted.extend(self._submit(job) for job in batch)
+                continue
+            with ThreadPoolExecutor(max_workers=min(self.workers, len(batch)), thread_name_prefix='codex-render') as executor:
+                submitted.extend(executor.map(self._submit, batch))
+
+    def poll(self) -> List[RenderJob]:
+        """Polls rendering jobs whose next poll time has passed."""
+
+        updated: List[RenderJob] = []
+        for job in self.queue.due_for_poll(self.workers * 4):
+            try:
+                response = self.renderer.fetch_render(job.render_id or '')
+            except CreatomateError as exc:
+                logger.warning('Polling render %s failed: %s', job.render_id, exc)
+                if exc.status == 404:
+                    self.queue.update(job, state=JOB_FAILED, error=f'render unknown to Creatomate: {exc}', next_poll_at=None)
+                elif job.polls + 1 >= self.max_polls:
+                    self.queue.update(job, state=JOB_FAILED, error=f'gave up after {self.max_polls} polls: {exc}', next_poll_at=None)
+                else:
+                    self.queue.update(job, polls=job.polls + 1, next_poll_at=self.queue.clock() + self.poll_interval)
+            else:
+                self._apply_response(job, response, polled=True)
+            updated.append(job)
+        return updated
+
+    def ingest_webhook(self, body: Dict[str, Any]) -> Optional[RenderJob]:
+        """Applies a Creatomate webhook callback; returns the job it refers to, if any."""
+
+        render_id = body.get('id')
+        job = self.queue.find_by_render_id(render_id) if isinstance(render_id, str) else None
+        if job is None:
+            logger.warning('Ignoring webhook for unknown render %s', render_id)
+            return None
+        if not job.done:
+            self._apply_response(job, body)
+        return job
+
+    def run_until_complete(
+        self,
+        job_ids: Optional[Iterable[str]] = None,
+        *,
+        timeout: Optional[float] = None,
+    ) -> List[RenderJob]:
+        """Submits and polls until the jobs are done or ``timeout`` seconds pass.
+
+        With ``job_ids`` it waits for those jobs and returns them in that order;
+        otherwise it waits for the whole queue and returns the jobs this call
+        submitted or polled. Other pending jobs are advanced either way.
+        """
+
+        wanted = list(job_ids) if job_ids is not None else None
+        touched: Set[str] = set()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            self.queue.recover_interrupted(older_than=self.submit_lease)
+            touched.update(job.id for job in self.submit_pending())
+            touched.update(job.id for job in self.poll())
+            pending = self.queue.pending_count(wanted)
+            if not pending:
+                break
+            if deadline is not None and time.monotonic() >= deadline:
+                logger.warning('Render queue still has %s pending jobs after %.0fs', pending, timeout)
+                break
+            self.sleep(self.poll_interval)
+        if wanted is not None:
+            return self.queue.get_many(wanted)
+        return self.queue.get_many(sorted(touched))
+
+    def _submit(self, job: RenderJob) -> RenderJob:
+        self.limiter.acquire()
+        try:
+            response = self.renderer.render(job.payload, execute=True)
+        except CreatomateError as exc:
+            logger.error('Creatomate rejected job %s: %s', job.id, exc)
+            return self.queue.update(job, state=JOB_FAILED, error=str(exc))
+        except Exception as exc:  # noqa: BLE001 - never leave a claimed job in ``submitting``
+            logger.exception('Submitting job %s failed', job.id)
+            return self.queue.update(job, state=JOB_FAILED, error=f'submission failed: {exc}')
+        # v1 of the API answers with a list of renders, v2 with a single render.
+        if isinstance(response, list):
+            response = response[0] if response else {}
+        render_id = response.get('id') if isinstance(response, dict) else None
+        if not isinstance(render_id, str) or not render_id:
+            return self.queue.update(job, state=JOB_FAILED, response=response, error='Creatomate response has no render id')
+        self.queue.update(job, render_id=render_id)
+        return self._apply_response(job, response)
+
+    def _apply_response(self, job: RenderJob, response: Dict[str, Any], *, polled: bool = False) -> RenderJob:
+        """Moves ``job`` to the state ``response`` reports.
+
+        Only ``polled`` responses count against ``max_polls``; a submission answer or a
+        webhook delivery records the response and leaves the poll schedule alone.
+        """
+
+        status = str(response.get('status', '')).lower()
+        state = CREATOMATE_TERMINAL_STATUSES.get(status, JOB_RENDERING)
+        if state == JOB_RENDERING and not polled:
+            changes: Dict[str, Any] = {}
+            if job.next_poll_at is None:
+                changes['next_poll_at'] = self.queue.clock() + self.poll_interval
+            return self.queue.update(job, state=JOB_RENDERING, response=response, **changes)
+        if state == JOB_RENDERING and job.polls + 1 >= self.max_polls:
+            error = f'render still {status or "pending"} after {self.max_polls} polls'
+            return self.queue.update(job, state=JOB_FAILED, response=response, error=error, next_poll_at=None)
+        if state == JOB_RENDERING:
+            return self.queue.update(
+                job,
+                state=JOB_RENDERING,
+                response=response,
+                polls=job.polls + 1,
+                next_poll_at=self.queue.clock() + self.poll_interval,
+            )
+        if state == JOB_FAILED:
+            error = response.get('error_message') or 'Creatomate render failed'
+            return self.queue.update(job, state=JOB_FAILED, response=response, error=error)
+        return self._complete(job, response)
+
+    def _complete(self, job: RenderJob, response: Dict[str, Any]) -> RenderJob:
+        stored = None
+        if self.storage is not None:
+            try:
+                result = self.storage.store(
+                    storyboard=StoryboardSnapshot(job.storyboard),
+                    render_payload=job.payload,
+                    manifest=job.manifest,
+                    render_response=response,
+                    fingerprint=job.fingerprint or self.renderer.fingerprint(job.payload),
+                )
+            except Exception as exc:  # noqa: BLE001 - the render itself succeeded
+                logger.error('Storing render %s failed: %s', job.render_id, exc)
+                return self.queue.update(job, state=JOB_FAILED, response=response, error=f'storage failed: {exc}')
+            stored = asdict(result)
+        return self.queue.update(job, state=JOB_SUCCEEDED, response=response, storage=stored, next_poll_at=None)
+
+
+def _dumps(value: Any) -> Optional[str]:
+    return None if value is None else serialization.dumps_text(value, compact=True)
+
+
+def _row_to_job(row: sqlite3.Row) -> RenderJob:
+    data = dict(row)
+    for column in _JSON_COLUMNS:
+        if data[column] is not None:
+            data[column] = serialization.loads(data[column])
+    return RenderJob(**data)
+
+
+__all__ = [
+    'JOB_QUEUED',
+    'JOB_SUBMITTING',
+    'JOB_RENDERING',
+    'JOB_SUCCEEDED',
+    'JOB_FAILED',
+    'RateLimiter',
+    'RenderJob',
+    'RenderJobQueue',
+    'RenderWorkerPool',
+    'StoryboardSnapshot',
+]
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import os
 import re
+from array import array
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Protocol
+from typing import Dict, FrozenSet, Iterable, List, Optional, Pattern, Protocol, Set, Tuple
 
 from .models import Asset
 
@@ -45,14 +48,110 @@ class KeywordSceneLabeler:
         return matches
 
 
+@dataclass
+class CompiledKeywordSceneLabeler:
+    """``KeywordSceneLabeler`` with the keyword map compiled once into a single scanner.
+
+    All keywords are folded into one trie-shaped regex, so each caption is scanned once
+    and the cost grows with caption length rather than keyword count. At each hit the
+    regex yields the longest keyword starting there; every keyword also carries the
+    labels of its shorter prefix keywords, so that hit accounts for all keywords
+    starting at that position. Tags are matched through an exact lookup table. Output
+    is identical to ``KeywordSceneLabeler``.
+    """
+
+    keyword_map: Dict[str, List[str]]
+    default_label: str = "general"
+
+    def __post_init__(self) -> None:
+        keyword_labels: Dict[str, Set[str]] = {}
+        always: Set[str] = set()
+        for label, keywords in self.keyword_map.items():
+            for keyword in keywords:
+                lowered = keyword.lower()
+                if not lowered:
+                    always.add(label)
+                    continue
+                keyword_labels.setdefault(lowered, set()).add(label)
+
+        self._always = frozenset(always)
+        self._tag_labels: Dict[str, FrozenSet[str]] = {
+            keyword: frozenset(labels) for keyword, labels in keyword_labels.items()
+        }
+        self._hit_labels: Dict[str, FrozenSet[str]] = {}
+        for keyword in keyword_labels:
+            labels: Set[str] = set()
+            for end in range(1, len(keyword) + 1):
+                labels.update(keyword_labels.get(keyword[:end], ()))
+            self._hit_labels[keyword] = frozenset(labels)
+        self._all_labels = frozenset(always).union(*self._tag_labels.values())
+
+        self._scanner: Optional[Pattern[str]] = (
+            re.compile(_trie_pattern(keyword_labels)) if keyword_labels else None
+        )
+
+    def label(self, asset: Asset) -> List[str]:
+        caption = (asset.caption or "").lower()
+        matches: Set[str] = set(self._always)
+
+        for tag in asset.tags:
+            matches.update(self._tag_labels.get(tag.lower(), ()))
+
+        scanner = self._scanner
+        if scanner is not None and caption and len(matches) < len(self._all_labels):
+            hit = scanner.search(caption)
+            while hit is not None:
+                matches.update(self._hit_labels[hit.group()])
+                if len(matches) == len(self._all_labels):
+                    break
+                # Resume one character later so overlapping keywords are still seen.
+                hit = scanner.search(caption, hit.start() + 1)
+
+        if matches:
+            return sorted(matches)
+
+        if caption:
+            thematic = _derive_thematic_label(caption)
+            if thematic:
+                return [thematic]
+
+        return [self.default_label]
+
+
+def _trie_pattern(keywords: Iterable[str]) -> str:
+    """Regex matching any keyword, with shared prefixes factored out.
+
+    Optional groups are greedy, so a match is always the longest keyword at its start.
+    """
+
+    trie: Dict[str, dict] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return f'(?:{body})?' if '' in node else body
+
+    return build(trie)
+
+
+_THEMATIC_PATTERNS = (
+    ('celebration', re.compile(r'celebrat|cheer|party')),
+    ('food-and-drink', re.compile(r'tapa|brunch|cocktail|wine')),
+    ('transit', re.compile(r'metro|train|ferry|path')),
+)
+
+
 def _derive_thematic_label(caption: str) -> str | None:
-    patterns = {
-        'celebration': r'celebrat|cheer|party',
-        'food-and-drink': r'tapa|brunch|cocktail|wine',
-        'transit': r'metro|train|ferry|path',
-    }
-    for label, pattern in patterns.items():
-        if re.search(pattern, caption):
+    # Checked in priority order, not by position, so the first matching theme wins.
+    for label, pattern in _THEMATIC_PATTERNS:
+        if pattern.search(caption):
             return label
     return None
 
@@ -63,3 +162,92 @@ def apply_scene_labels(assets: Iterable[Asset], labeler: SceneLabeler) -> List[A
         asset.scenes = labeler.label(asset)
         labelled.append(asset)
     return labelled
+
+
+DEFAULT_LABEL_CHUNK_SIZE = 256
+
+
+@dataclass
+class LabelBatch:
+    """Labels for a run of assets as compact id arrays.
+
+    Asset ``i`` has labels ``vocabulary[j]`` for ``j`` in ``ids[offsets[i]:offsets[i + 1]]``,
+    which pickles as a few flat buffers instead of one list of strings per asset.
+    """
+
+    vocabulary: Tuple[str, ...]
+    offsets: array
+    ids: array
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def labels_at(self, index: int) -> List[str]:
+        vocabulary = self.vocabulary
+        return [vocabulary[label_id] for label_id in self.ids[self.offsets[index]:self.offsets[index + 1]]]
+
+
+def label_batch(assets: Iterable[Asset], labeler: SceneLabeler) -> LabelBatch:
+    """Labels ``assets`` without mutating them and packs the result into a :class:`LabelBatch`."""
+
+    vocabulary: Dict[str, int] = {}
+    offsets = array('I', [0])
+    ids = array('I')
+    for asset in assets:
+        for label in labeler.label(asset):
+            ids.append(vocabulary.setdefault(label, len(vocabulary)))
+        offsets.append(len(ids))
+    return LabelBatch(vocabulary=tuple(vocabulary), offsets=offsets, ids=ids)
+
+
+_worker_labeler: Optional[SceneLabeler] = None
+
+
+def _init_label_worker(labeler: SceneLabeler) -> None:
+    global _worker_labeler
+    _worker_labeler = labeler
+
+
+def _label_chunk_in_worker(chunk: List[Asset]) -> LabelBatch:
+    return label_batch(chunk, _worker_labeler)
+
+
+def apply_scene_labels_parallel(
+    assets: Iterable[Asset],
+    labeler: SceneLabeler,
+    *,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_LABEL_CHUNK_SIZE,
+    use_threads: bool = False,
+) -> List[Asset]:
+    """Parallel ``apply_scene_labels``: shards assets into chunks across a worker pool.
+
+    Processes suit CPU-bound labellers; pass ``use_threads`` for I/O-bound ones or labellers
+    that cannot be pickled. The labeller is shipped once per process, each chunk returns a
+    :class:`LabelBatch`, and labels are written back in input order.
+    """
+
+    assets = list(assets)
+    chunk_size = max(1, chunk_size)
+    chunks = [assets[start:start + chunk_size] for start in range(0, len(assets), chunk_size)]
+    if not chunks:
+        return assets
+
+    workers = min(workers or os.cpu_count() or 1, len(chunks))
+    if workers <= 1:
+        batches = [label_batch(chunk, labeler) for chunk in chunks]
+    elif use_threads:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='codex-label') as executor:
+            batches = list(executor.map(lambda chunk: label_batch(chunk, labeler), chunks))
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_label_worker,
+            initargs=(labeler,),
+        ) as executor:
+            batches = list(executor.map(_label_chunk_in_worker, chunks))
+
+    for chunk, batch in zip(chunks, batches):
+        for index, asset in enumerate(chunk):
+            asset.scenes = batch.labels_at(index)
+    return assets
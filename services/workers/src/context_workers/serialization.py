@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional extra
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - msgspec is an optional extra
+    msgspec = None
+
+# Preference order when CODEX_JSON_BACKEND is unset or "auto".
+JSON_BACKENDS = ('orjson', 'msgspec', 'json')
+
+
+class JSONSerializer:
+    """Encodes and decodes JSON documents with one backend.
+
+    ``dumps`` returns UTF-8 bytes: indented (two spaces) for files people read, or
+    ``compact`` (no whitespace) for machine consumers and request bodies. Decoding
+    errors are always raised as ``ValueError``.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        encode: Callable[[Any, bool], bytes],
+        decode: Callable[[bytes | str], Any],
+        decode_error: type[Exception] = ValueError,
+    ) -> None:
+        self.name = name
+        self._encode = encode
+        self._decode = decode
+        self._decode_error = decode_error
+
+    def dumps(self, obj: Any, *, compact: bool = False) -> bytes:
+        return self._encode(obj, compact)
+
+    def dumps_text(self, obj: Any, *, compact: bool = False) -> str:
+        return self._encode(obj, compact).decode('utf-8')
+
+    def loads(self, data: bytes | str) -> Any:
+        try:
+            return self._decode(data)
+        except self._decode_error as error:
+            if isinstance(error, ValueError):
+                raise
+            raise ValueError(str(error)) from error
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.name!r})'
+
+
+_msgspec_encoder = msgspec.json.Encoder() if msgspec is not None else None
+
+
+def _stdlib_encode(obj: Any, compact: bool) -> bytes:
+    if compact:
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _orjson_encode(obj: Any, compact: bool) -> bytes:
+    option = orjson.OPT_NON_STR_KEYS
+    if not compact:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(obj, option=option)
+
+
+def _msgspec_encode(obj: Any, compact: bool) -> bytes:
+    encoded = _msgspec_encoder.encode(obj)
+    return encoded if compact else msgspec.json.format(encoded, indent=2)
+
+
+def create_serializer(name: str) -> JSONSerializer:
+    """Builds the serializer for ``name`` (``orjson``, ``msgspec`` or ``json``)."""
+
+    if name == 'json':
+        return JSONSerializer('json', _stdlib_encode, json.loads)
+    if name == 'orjson':
+        if orjson is None:
+            raise RuntimeError('orjson must be installed to use the orjson JSON backend')
+        return JSONSerializer('orjson', _orjson_encode, orjson.loads)
+    if name == 'msgspec':
+        if msgspec is None:
+            raise RuntimeError('msgspec must be installed to use the msgspec JSON backend')
+        return JSONSerializer('msgspec', _msgspec_encode, msgspec.json.decode, msgspec.DecodeError)
+    raise ValueError(f'Unsupported JSON backend: {name}')
+
+
+def _default_serializer() -> JSONSerializer:
+    requested = os.environ.get('CODEX_JSON_BACKEND', 'auto').strip().lower() or 'auto'
+    if requested != 'auto':
+        return create_serializer(requested)
+    for name in JSON_BACKENDS:
+        try:
+            return create_serializer(name)
+        except RuntimeError:
+            continue
+    return create_serializer('json')  # pragma: no cover - json is always available
+
+
+_serializer: Optional[JSONSerializer] = None
+_serializer_lock = threading.Lock()
+
+
+def get_serializer() -> JSONSerializer:
+    """Process-wide serializer: ``CODEX_JSON_BACKEND`` or the fastest installed backend."""
+
+    global _serializer
+    if _serializer is None:
+        with _serializer_lock:
+            if _serializer is None:
+                _serializer = _default_serializer()
+    return _serializer
+
+
+def set_serializer(serializer: Optional[JSONSerializer | str]) -> Optional[JSONSerializer]:
+    """Replaces the process-wide serializer (a backend name is accepted); returns the previous one."""
+
+    global _serializer
+    with _serializer_lock:
+        previous = _serializer
+        _serializer = create_serializer(serializer) if isinstance(serializer, str) else serializer
+    return previous
+
+
+def dumps(obj: Any, *, compact: bool = False) -> bytes:
+    return get_serializer().dumps(obj, compact=compact)
+
+
+def dumps_text(obj: Any, *, compact: bool = False) -> str:
+    return get_serializer().dumps_text(obj, compact=compact)
+
+
+def loads(data: bytes | str) -> Any:
+    return get_serializer().loads(data)
+
+
+__all__ = [
+    'JSON_BACKENDS',
+    'JSONSerializer',
+    'create_serializer',
+    'dumps',
+    'dumps_text',
+    'get_serializer',
+    'loads',
+    'set_serializer',
+]
@@ -1,15 +1,41 @@
 from __future__ import annotations
 
-import json
+import logging
+import os
+import shutil
+import threading
+import time
 import uuid
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from datetime import timedelta
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, Optional
-from urllib import error, request
+from typing import Any, BinaryIO, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib import request
 
+from . import serialization
+from .blob_store import BLOB_DIRNAME, DEFAULT_BLOB_MIN_BYTES, Blob, join_document, split_document
+from .render_index import RenderIndex, RenderRecord
 from .video_assembly import Storyboard
 
+logger = logging.getLogger(__name__)
+
+# Directory (or object prefix) under the storage root that holds lookup indexes.
+INDEX_DIRNAME = '.index'
+
+# Resumable upload chunks must be a multiple of 256 KiB.
+DEFAULT_UPLOAD_CHUNK_SIZE = 32 * 256 * 1024
+
+DEFAULT_SWEEP_BATCH_SIZE = 100
+
+# Every file a render directory can hold, in the order batch signing returns them.
+RENDER_ARTIFACTS = ('manifest.json', 'render_payload.json', 'storyboard.json', 'render_response.json', 'render.mp4')
+
+# Documents whose large sub-documents move to the blob store when ``dedupe_blobs`` is on.
+DEDUPLICATED_ARTIFACTS = ('manifest.json', 'render_payload.json', 'storyboard.json')
+
 
 @dataclass
 class StorageConfig:
@@ -24,7 +50,15 @@ class StorageConfig:
     gcs_prefix: str = 'renders'
     gcs_credentials: Optional[str] = None
     signed_url_ttl: int = 3600
+    signed_url_margin: int = 300
+    signed_url_cache_size: int = 4096
     copy_video_asset: bool = False
+    compact_json: bool = False
+    upload_workers: int = 4
+    upload_chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE
+    dedupe_blobs: bool = False
+    blob_compression: str = 'none'
+    blob_min_bytes: int = DEFAULT_BLOB_MIN_BYTES
 
 
 @dataclass
@@ -42,14 +76,132 @@ class StorageResult:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+class SignedURLCache:
+    """Thread-safe LRU cache of signed URLs keyed by (object, method, ttl).
+
+    A URL is reused until ``margin`` seconds before it expires, so clients always get
+    at least that much lifetime. Failed signings are not cached.
+    """
+
+    def __init__(
+        self,
+        *,
+        margin: float = 300,
+        max_entries: int = 4096,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.margin = margin
+        self.max_entries = max_entries
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[Tuple[str, str, int], Tuple[float, str]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[str, str, int]) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] - self.margin <= self.clock():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: Tuple[str, str, int], url: str, *, signed_at: float) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (signed_at + key[2], url)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_sign(self, key: Tuple[str, str, int], sign: Callable[[], Optional[str]]) -> Optional[str]:
+        url = self.get(key)
+        if url is not None:
+            return url
+        # Measured before signing so the recorded expiry is never later than the real one.
+        signed_at = self.clock()
+        url = sign()
+        if url:
+            self.put(key, url, signed_at=signed_at)
+        return url
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _signed_url_cache(config: StorageConfig) -> SignedURLCache:
+    return SignedURLCache(margin=config.signed_url_margin, max_entries=config.signed_url_cache_size)
+
+
+def _split_artifacts(
+    config: StorageConfig,
+    documents: Dict[str, Dict[str, Any]],
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Blob]]:
+    """Thin per-render documents plus the blobs they reference, keyed by blob name."""
+
+    if not config.dedupe_blobs:
+        return documents, {}
+    thin = dict(documents)
+    blobs: Dict[str, Blob] = {}
+    for filename in DEDUPLICATED_ARTIFACTS:
+        thin[filename], split = split_document(
+            documents[filename],
+            min_bytes=config.blob_min_bytes,
+            compression=config.blob_compression,
+        )
+        blobs.update((blob.name, blob) for blob in split)
+    return thin, blobs
+
+
+def _render_succeeded(render_response: Dict[str, Any]) -> bool:
+    # Only finished renders are worth reusing; a planned or failed one must not mask a retry.
+    return str(render_response.get('status', '')).lower() == 'succeeded'
+
+
+def _render_locales(storyboard: Dict[str, Any]) -> List[str]:
+    narrative = storyboard.get('narrative') or {}
+    locales = set(narrative.get('narrations') or {}) | set(narrative.get('accessibility') or {})
+    if not locales and narrative.get('language'):
+        locales.add(narrative['language'])
+    return sorted(locales)
+
+
 class LocalRenderStorage:
-    """Persists render artifacts to the local filesystem and fabricates signed URL placeholders."""
+    """Persists render artifacts to the local filesystem and fabricates signed URL placeholders.
+
+    Every stored render is recorded in a SQLite :class:`RenderIndex` under
+    ``output_dir/.index/``, which answers latest-render queries and drives the
+    retention sweeper without walking the render tree. With ``dedupe_blobs`` the
+    large sub-documents are written once under ``output_dir/.blobs/`` by content hash.
+    """
 
     def __init__(self, config: StorageConfig) -> None:
         if config.provider != 'local':
             raise ValueError(f'Unsupported provider for LocalRenderStorage: {config.provider}')
         self.config = config
         self.output_dir = Path(config.output_dir)
+        self.signed_urls = _signed_url_cache(config)
+        self._index_path = self.output_dir / INDEX_DIRNAME / 'renders.sqlite'
+        self._index: Optional[RenderIndex] = None
+
+    @property
+    def index(self) -> RenderIndex:
+        """The render index, opened (and created) on first use."""
+
+        if self._index is None:
+            self._index = RenderIndex(self._index_path)
+        return self._index
+
+    def _existing_index(self) -> Optional[RenderIndex]:
+        # Lookups must not create an index in a directory that never stored a render.
+        if self._index is None and not self._index_path.exists():
+            return None
+        return self.index
 
     def store(
         self,
@@ -58,8 +210,10 @@ class LocalRenderStorage:
         render_payload: Dict[str, Any],
         manifest: Dict[str, Any],
         render_response: Dict[str, Any],
+        fingerprint: Optional[str] = None,
     ) -> StorageResult:
-        render_id = self._resolve_render_id(render_response)
+        render_id = _resolve_render_id(render_response, fingerprint)
+        indexed_fingerprint = fingerprint if _render_succeeded(render_response) else None
         render_dir = self.output_dir / storyboard.poi.id / render_id
         render_dir.mkdir(parents=True, exist_ok=True)
 
@@ -68,10 +222,20 @@ class LocalRenderStorage:
         storyboard_path = render_dir / 'storyboard.json'
         response_path = render_dir / 'render_response.json'
 
-        manifest_path.write_text(json.dumps(manifest, indent=2))
-        payload_path.write_text(json.dumps(render_payload, indent=2))
-        storyboard_path.write_text(json.dumps(storyboard.to_dict(), indent=2))
-        response_path.write_text(json.dumps(render_response, indent=2))
+        storyboard_data = storyboard.to_dict()
+        documents, blobs = _split_artifacts(self.config, {
+            'manifest.json': manifest,
+            'render_payload.json': render_payload,
+            'storyboard.json': storyboard_data,
+            'render_response.json': render_response,
+        })
+        # Blobs land first so a thin document never references a missing blob.
+        blob_stats = self._write_blobs(blobs) if blobs else None
+        sizes = {}
+        for filename, document in documents.items():
+            data = serialization.dumps(document, compact=self.config.compact_json)
+            (render_dir / filename).write_bytes(data)
+            sizes[filename] = len(data)
 
         signed_manifest_url = self._make_signed_url(storyboard.poi.id, render_id, 'manifest.json')
         signed_video_url = self._resolve_video_url(render_response, storyboard.poi.id, render_id)
@@ -81,8 +245,12 @@ class LocalRenderStorage:
             'locale': storyboard.poi.locale,
             'asset_count': len(storyboard.segments),
         }
+        if fingerprint:
+            metadata['fingerprint'] = fingerprint
+        if blob_stats is not None:
+            metadata['blobs'] = blob_stats
 
-        return StorageResult(
+        result = StorageResult(
             provider=self.config.provider,
             render_id=render_id,
             manifest_path=str(manifest_path),
@@ -93,19 +261,167 @@ class LocalRenderStorage:
             signed_video_url=signed_video_url,
             metadata=metadata,
         )
+        self.index.record(RenderRecord(
+            poi_id=storyboard.poi.id,
+            render_id=render_id,
+            created_at=time.time(),
+            fingerprint=indexed_fingerprint,
+            locales=_render_locales(storyboard_data),
+            sizes=sizes,
+            result=asdict(result),
+            blobs=sorted(blobs),
+        ))
+        return result
+
+    def load_artifact(self, poi_id: str, render_id: str, filename: str) -> Dict[str, Any]:
+        """Reads a stored JSON artifact, resolving blob references back into the full document."""
+
+        return self._load_artifact(self.output_dir / poi_id / render_id / filename)
+
+    def _load_artifact(self, path: Path, seen: Optional[set] = None) -> Dict[str, Any]:
+        def load(name: str) -> bytes:
+            if seen is not None:
+                seen.add(name)
+            return (self.output_dir / BLOB_DIRNAME / name).read_bytes()
+
+        return join_document(serialization.loads(path.read_bytes()), load)
+
+    def _write_blobs(self, blobs: Dict[str, Blob]) -> Dict[str, int]:
+        written = bytes_written = 0
+        for name, blob in blobs.items():
+            path = self.output_dir / BLOB_DIRNAME / name
+            if path.exists():
+                # Refresh the mtime so a concurrent sweep keeps a blob that is in use again.
+                os.utime(path)
+                continue
+            path.parent.mkdir(parents=True, exist_ok=True)
+            staging = path.with_name(f'{path.name}.{uuid.uuid4().hex[:8]}.tmp')
+            staging.write_bytes(blob.data)
+            staging.replace(path)
+            written += 1
+            bytes_written += len(blob.data)
+        return {'count': len(blobs), 'written': written, 'bytes_written': bytes_written}
+
+    def latest_render(self, poi_id: str) -> Optional[StorageResult]:
+        """The most recently stored render for ``poi_id``, answered from the index."""
+
+        index = self._existing_index()
+        record = index.latest(poi_id) if index is not None else None
+        return StorageResult(**record.result) if record is not None else None
+
+    def sweep_expired(
+        self,
+        *,
+        batch_size: int = DEFAULT_SWEEP_BATCH_SIZE,
+        now: Optional[float] = None,
+    ) -> List[RenderRecord]:
+        """Deletes up to ``batch_size`` renders older than ``retention_days``.
+
+        Oldest renders go first and each call is bounded, so a scheduler can run it
+        repeatedly until it returns an empty list. Returns the records removed.
+        """
+
+        index = self._existing_index()
+        if self.config.retention_days <= 0 or index is None:
+            return []
+        cutoff = (time.time() if now is None else now) - self.config.retention_days * 86400
+        expired = index.expired(cutoff, limit=batch_size)
+        for record in expired:
+            poi_dir = self.output_dir / record.poi_id
+            shutil.rmtree(poi_dir / record.render_id, ignore_errors=True)
+            try:
+                poi_dir.rmdir()
+            except OSError:
+                pass  # other renders of this POI remain
+        for name in index.remove(expired):
+            blob_path = self.output_dir / BLOB_DIRNAME / name
+            try:
+                if blob_path.stat().st_mtime < cutoff:
+                    blob_path.unlink()
+            except OSError:
+                pass
+        if expired:
+            logger.info('Swept %d expired renders (created before %.0f)', len(expired), cutoff)
+        return expired
+
+    def reindex(self) -> int:
+        """Records renders stored before the index existed; a one-off directory walk.
+
+        Their creation time is taken from the manifest's modification time. They were
+        stored without a fingerprint, so they are never reused by ``lookup_fingerprint``.
+        """
+
+        added = 0
+        for manifest_path in self.output_dir.glob('*/*/manifest.json'):
+            render_dir = manifest_path.parent
+            poi_id, render_id = render_dir.parent.name, render_dir.name
+            if poi_id == INDEX_DIRNAME or self.index.get(poi_id, render_id) is not None:
+                continue
+            blobs: set = set()
+            try:
+                storyboard_data = self._load_artifact(render_dir / 'storyboard.json', blobs)
+                for filename in ('manifest.json', 'render_payload.json'):
+                    self._load_artifact(render_dir / filename, blobs)
+                render_response = serialization.loads((render_dir / 'render_response.json').read_bytes())
+            except (OSError, ValueError):
+                continue
+            sizes = {path.name: path.stat().st_size for path in render_dir.iterdir() if path.is_file()}
+            result = StorageResult(
+                provider=self.config.provider,
+                render_id=render_id,
+                manifest_path=str(manifest_path),
+                payload_path=str(render_dir / 'render_payload.json'),
+                storyboard_path=str(render_dir / 'storyboard.json'),
+                response_path=str(render_dir / 'render_response.json'),
+                signed_manifest_url=self._make_signed_url(poi_id, render_id, 'manifest.json'),
+                signed_video_url=self._resolve_video_url(render_response, poi_id, render_id),
+                metadata={'retention_days': self.config.retention_days},
+            )
+            self.index.record(RenderRecord(
+                poi_id=poi_id,
+                render_id=render_id,
+                created_at=manifest_path.stat().st_mtime,
+                locales=_render_locales(storyboard_data),
+                sizes=sizes,
+                result=asdict(result),
+                blobs=sorted(blobs),
+            ))
+            added += 1
+        return added
+
+    def lookup_fingerprint(self, poi_id: str, fingerprint: str) -> Optional[StorageResult]:
+        """Returns the stored render with this fingerprint, if its artifacts still exist."""
+
+        index = self._existing_index()
+        record = index.find_fingerprint(poi_id, fingerprint) if index is not None else None
+        if record is None:
+            return None
+        result = StorageResult(**record.result)
+        if not Path(result.manifest_path).exists():
+            return None
+        return result
 
-    def _resolve_render_id(self, render_response: Dict[str, Any]) -> str:
-        for key in ('render_id', 'id', 'job_id'):
-            value = render_response.get(key)
-            if isinstance(value, str) and value:
-                return value
-        return f'render-{uuid.uuid4().hex[:12]}'
+    def sign_render_artifacts(
+        self,
+        poi_id: str,
+        render_id: str,
+        filenames: Iterable[str] = RENDER_ARTIFACTS,
+        *,
+        method: str = 'GET',
+    ) -> Dict[str, Optional[str]]:
+        """Signed URLs for several artifacts of one render, reusing cached signatures."""
 
-    def _make_signed_url(self, poi_id: str, render_id: str, filename: str) -> Optional[str]:
+        return {
+            filename: self._make_signed_url(poi_id, render_id, filename, method=method)
+            for filename in filenames
+        }
+
+    def _make_signed_url(self, poi_id: str, render_id: str, filename: str, *, method: str = 'GET') -> Optional[str]:
         if not self.config.base_url or not self.config.generate_signed_urls:
             return None
         base = self.config.base_url.rstrip('/')
-        return f'{base}/{poi_id}/{render_id}/{filename}?signature=demo'
+        key = (f'{poi_id}/{render_id}/{filename}', method, self.config.signed_url_ttl)
+        return self.signed_urls.get_or_sign(key, lambda: f'{base}/{key[0]}?signature=demo')
 
     def _resolve_video_url(
         self,
@@ -117,14 +433,15 @@ class LocalRenderStorage:
             value = render_response.get(key)
             if isinstance(value, str) and value:
                 return value
-        if self.config.base_url and self.config.generate_signed_urls:
-            base = self.config.base_url.rstrip('/')
-            return f'{base}/{poi_id}/{render_id}/render.mp4?signature=demo'
-        return None
+        return self._make_signed_url(poi_id, render_id, 'render.mp4')
 
 
 class GCSRenderStorage:
-    """Uploads render artifacts to Google Cloud Storage and returns signed URLs."""
+    """Uploads render artifacts to Google Cloud Storage and returns signed URLs.
+
+    With ``dedupe_blobs`` the large sub-documents are uploaded once under
+    ``<prefix>/.blobs/`` by content hash; blobs already known to exist are skipped.
+    """
 
     def __init__(self, config: StorageConfig) -> None:
         if config.provider != 'gcs':
@@ -145,6 +462,8 @@ class GCSRenderStorage:
         else:
             self.client = gcs_storage.Client()
         self.bucket = self.client.bucket(config.gcs_bucket)
+        self.signed_urls = _signed_url_cache(config)
+        self._known_blobs: set = set()
 
     def store(
         self,
@@ -153,25 +472,32 @@ class GCSRenderStorage:
         render_payload: Dict[str, Any],
         manifest: Dict[str, Any],
         render_response: Dict[str, Any],
+        fingerprint: Optional[str] = None,
     ) -> StorageResult:
-        render_id = self._resolve_render_id(render_response)
-        manifest_blob = self._upload_json(storyboard, render_id, 'manifest.json', manifest)
-        payload_blob = self._upload_json(storyboard, render_id, 'render_payload.json', render_payload)
-        storyboard_blob = self._upload_json(
-            storyboard,
-            render_id,
-            'storyboard.json',
-            storyboard.to_dict(),
-        )
-        response_blob = self._upload_json(storyboard, render_id, 'render_response.json', render_response)
+        render_id = _resolve_render_id(render_response, fingerprint)
+        documents, blobs = _split_artifacts(self.config, {
+            'manifest.json': manifest,
+            'render_payload.json': render_payload,
+            'storyboard.json': storyboard.to_dict(),
+            'render_response.json': render_response,
+        })
+        # Blobs land first so a thin document never references a missing blob.
+        blob_stats = self._upload_blobs(blobs) if blobs else None
+        uploads: Dict[str, Callable[[], Any]] = {
+            filename: partial(self._upload_json, storyboard, render_id, filename, document)
+            for filename, document in documents.items()
+        }
+        if self.config.copy_video_asset:
+            uploads['render.mp4'] = partial(self._copy_video_if_available, storyboard, render_id, render_response)
+
+        blobs, timings = self._run_uploads(uploads)
+        manifest_blob = blobs['manifest.json']
 
         signed_manifest_url = self._signed_url(manifest_blob)
         signed_video_url = self._resolve_video_url(render_response)
-
-        if self.config.copy_video_asset:
-            video_blob = self._copy_video_if_available(storyboard, render_id, render_response)
-            if video_blob is not None:
-                signed_video_url = self._signed_url(video_blob) or signed_video_url
+        video_blob = blobs.get('render.mp4')
+        if video_blob is not None:
+            signed_video_url = self._signed_url(video_blob) or signed_video_url
 
         metadata = {
             'retention_days': self.config.retention_days,
@@ -179,31 +505,126 @@ class GCSRenderStorage:
             'asset_count': len(storyboard.segments),
             'bucket': self.bucket.name,
             'object_prefix': self.config.gcs_prefix,
+            'upload_ms': timings,
         }
-
-        return StorageResult(
+        if video_blob is not None:
+            metadata['video_copied'] = True
+        if fingerprint:
+            metadata['fingerprint'] = fingerprint
+        if blob_stats is not None:
+            metadata['blobs'] = blob_stats
+
+        result = StorageResult(
             provider=self.config.provider,
             render_id=render_id,
             manifest_path=self._blob_uri(manifest_blob),
-            payload_path=self._blob_uri(payload_blob),
-            storyboard_path=self._blob_uri(storyboard_blob),
-            response_path=self._blob_uri(response_blob),
+            payload_path=self._blob_uri(blobs['render_payload.json']),
+            storyboard_path=self._blob_uri(blobs['storyboard.json']),
+            response_path=self._blob_uri(blobs['render_response.json']),
             signed_manifest_url=signed_manifest_url,
             signed_video_url=signed_video_url,
             metadata=metadata,
         )
+        indexed = serialization.dumps(asdict(result), compact=True)
+        if fingerprint and _render_succeeded(render_response):
+            index_blob = self.bucket.blob(self._fingerprint_path(storyboard.poi.id, fingerprint))
+            index_blob.upload_from_string(indexed, content_type='application/json')
+        self.bucket.blob(self._latest_path(storyboard.poi.id)).upload_from_string(
+            indexed,
+            content_type='application/json',
+        )
+        return result
 
-    def _resolve_render_id(self, render_response: Dict[str, Any]) -> str:
-        for key in ('render_id', 'id', 'job_id'):
-            value = render_response.get(key)
-            if isinstance(value, str) and value:
-                return value
-        return f'render-{uuid.uuid4().hex[:12]}'
+    def latest_render(self, poi_id: str) -> Optional[StorageResult]:
+        """The most recently stored render for ``poi_id``, from a per-POI pointer object."""
+
+        blob = self.bucket.blob(self._latest_path(poi_id))
+        if not blob.exists():
+            return None
+        try:
+            return StorageResult(**serialization.loads(blob.download_as_text()))
+        except ValueError:
+            return None
+
+    def lookup_fingerprint(self, poi_id: str, fingerprint: str) -> Optional[StorageResult]:
+        """Returns the stored render with this fingerprint, if one was indexed.
+
+        Signed URLs in the stored result (the manifest's, and the video's when it was
+        copied into the bucket) are re-issued because the indexed ones may have expired.
+        """
+
+        blob = self.bucket.blob(self._fingerprint_path(poi_id, fingerprint))
+        if not blob.exists():
+            return None
+        try:
+            result = StorageResult(**serialization.loads(blob.download_as_text()))
+        except ValueError:
+            return None
+        filenames = ['manifest.json', 'render.mp4'] if result.metadata.get('video_copied') else ['manifest.json']
+        signed = self.sign_render_artifacts(poi_id, result.render_id, filenames)
+        result.signed_manifest_url = signed['manifest.json']
+        if signed.get('render.mp4'):
+            result.signed_video_url = signed['render.mp4']
+        return result
+
+    def load_artifact(self, poi_id: str, render_id: str, filename: str) -> Dict[str, Any]:
+        """Downloads a stored JSON artifact, resolving blob references back into the full document."""
+
+        data = self.bucket.blob(self._prefixed(poi_id, render_id, filename)).download_as_bytes()
+        return join_document(
+            serialization.loads(data),
+            lambda name: self.bucket.blob(self._prefixed(BLOB_DIRNAME, name)).download_as_bytes(),
+        )
+
+    def _upload_blobs(self, blobs: Dict[str, Blob]) -> Dict[str, Any]:
+        uploads = {name: partial(self._upload_blob, blob) for name, blob in blobs.items()}
+        started = time.perf_counter()
+        written, _ = self._run_uploads(uploads)
+        return {
+            'count': len(blobs),
+            'written': sum(1 for uploaded in written.values() if uploaded),
+            'bytes_written': sum(len(blobs[name].data) for name, uploaded in written.items() if uploaded),
+            'upload_ms': round((time.perf_counter() - started) * 1000, 3),
+        }
+
+    def _upload_blob(self, blob: Blob) -> bool:
+        if blob.name in self._known_blobs:
+            return False
+        target = self.bucket.blob(self._prefixed(BLOB_DIRNAME, blob.name))
+        uploaded = not target.exists()
+        if uploaded:
+            content_type = 'application/zstd' if blob.compression == 'zstd' else 'application/json'
+            target.upload_from_string(blob.data, content_type=content_type)
+        self._known_blobs.add(blob.name)
+        return uploaded
+
+    def _latest_path(self, poi_id: str) -> str:
+        return self._prefixed(INDEX_DIRNAME, 'latest', f'{poi_id}.json')
+
+    def _fingerprint_path(self, poi_id: str, fingerprint: str) -> str:
+        return self._prefixed(INDEX_DIRNAME, 'fingerprints', poi_id, f'{fingerprint}.json')
 
     def _object_path(self, storyboard: Storyboard, render_id: str, filename: str) -> str:
+        return self._prefixed(storyboard.poi.id, render_id, filename)
+
+    def _prefixed(self, *parts: str) -> str:
         prefix = (self.config.gcs_prefix or '').strip('/')
-        parts = [part for part in (prefix, storyboard.poi.id, render_id, filename) if part]
-        return '/'.join(parts)
+        return '/'.join(part for part in (prefix, *parts) if part)
+
+    def _run_uploads(self, uploads: Dict[str, Callable[[], Any]]) -> Tuple[Dict[str, Any], Dict[str, float]]:
+        """Runs the uploads on a thread pool; returns blobs and wall time (ms) per artifact."""
+
+        def timed(name: str) -> Tuple[str, Any, float]:
+            started = time.perf_counter()
+            blob = uploads[name]()
+            return name, blob, round((time.perf_counter() - started) * 1000, 3)
+
+        workers = max(1, min(self.config.upload_workers, len(uploads)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='codex-upload') as executor:
+            finished = list(executor.map(timed, uploads))
+        blobs = {name: blob for name, blob, _ in finished}
+        timings = {name: elapsed for name, _, elapsed in finished}
+        return blobs, timings
 
     def _upload_json(
         self,
@@ -213,7 +634,10 @@ class GCSRenderStorage:
         payload: Dict[str, Any],
     ):
         blob = self.bucket.blob(self._object_path(storyboard, render_id, filename))
-        blob.upload_from_string(json.dumps(payload, indent=2), content_type='application/json')
+        blob.upload_from_string(
+            serialization.dumps(payload, compact=self.config.compact_json),
+            content_type='application/json',
+        )
         return blob
 
     def _copy_video_if_available(
@@ -227,18 +651,40 @@ class GCSRenderStorage:
             return None
         blob = self.bucket.blob(self._object_path(storyboard, render_id, 'render.mp4'))
         try:
-            payload = self._fetch_bytes(source_url)
-        except CreatomateCopyError:
+            self._stream_to_blob(source_url, blob)
+        except CreatomateCopyError as exc:
+            logger.warning('%s', exc)
             return None
-        blob.upload_from_string(payload, content_type='video/mp4')
         return blob
 
-    def _fetch_bytes(self, url: str) -> bytes:
+    def _stream_to_blob(self, url: str, blob) -> None:
+        """Copies ``url`` into ``blob`` through a resumable upload, one chunk in memory at a time.
+
+        The upload is only finalized after the whole source was read, so a failed copy
+        never leaves a truncated object behind.
+        """
+
+        chunk_size = self.config.upload_chunk_size
+        writer = None
+        finalized = False
         try:
-            with request.urlopen(url, timeout=30) as response:
-                return response.read()
-        except error.URLError as exc:  # pragma: no cover - exercised in integration
-            raise CreatomateCopyError(f'Failed to fetch render asset from {url}') from exc
+            with self._open_source(url) as source:
+                writer = blob.open('wb', chunk_size=chunk_size, content_type='video/mp4')
+                while True:
+                    chunk = source.read(chunk_size)
+                    if not chunk:
+                        break
+                    writer.write(chunk)
+            writer.close()
+            finalized = True
+        except Exception as exc:  # noqa: BLE001 - source, upload and finalize errors only cost the video
+            raise CreatomateCopyError(f'Failed to copy render asset from {url}') from exc
+        finally:
+            if writer is not None and not finalized:
+                _abandon_upload(writer)
+
+    def _open_source(self, url: str) -> BinaryIO:
+        return request.urlopen(url, timeout=30)
 
     def _resolve_video_url(self, render_response: Dict[str, Any]) -> Optional[str]:
         for key in ('download_url', 'result_url', 'url', 'video_url'):
@@ -247,21 +693,67 @@ class GCSRenderStorage:
                 return value
         return None
 
-    def _signed_url(self, blob) -> Optional[str]:
+    def sign_render_artifacts(
+        self,
+        poi_id: str,
+        render_id: str,
+        filenames: Iterable[str] = RENDER_ARTIFACTS,
+        *,
+        method: str = 'GET',
+    ) -> Dict[str, Optional[str]]:
+        """Signed URLs for several artifacts of one render.
+
+        Cached URLs are returned as is; the rest are signed concurrently, since each
+        signature may be a credential round trip (e.g. IAM ``signBlob``).
+        """
+
+        names = list(filenames)
+        blobs = [self.bucket.blob(self._prefixed(poi_id, render_id, name)) for name in names]
+        workers = max(1, min(self.config.upload_workers, len(blobs)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='codex-sign') as executor:
+            urls = list(executor.map(partial(self._signed_url, method=method), blobs))
+        return dict(zip(names, urls))
+
+    def _signed_url(self, blob, *, method: str = 'GET') -> Optional[str]:
         if not self.config.generate_signed_urls:
             return None
-        try:
-            return blob.generate_signed_url(
-                expiration=timedelta(seconds=self.config.signed_url_ttl),
-                method='GET',
-            )
-        except Exception:  # pragma: no cover - depends on credentials capabilities
-            return None
+        ttl = self.config.signed_url_ttl
+
+        def sign() -> Optional[str]:
+            try:
+                return blob.generate_signed_url(expiration=timedelta(seconds=ttl), method=method)
+            except Exception:  # pragma: no cover - depends on credentials capabilities
+                return None
+
+        return self.signed_urls.get_or_sign((blob.name, method, ttl), sign)
 
     def _blob_uri(self, blob) -> str:
         return f'gs://{self.bucket.name}/{blob.name}'
 
 
+def _resolve_render_id(render_response: Dict[str, Any], fingerprint: Optional[str] = None) -> str:
+    for key in ('render_id', 'id', 'job_id'):
+        value = render_response.get(key)
+        if isinstance(value, str) and value:
+            return value
+    # A fingerprint keeps ids stable across re-runs of the same render.
+    if fingerprint:
+        return f'render-{fingerprint[:12]}'
+    return f'render-{uuid.uuid4().hex[:12]}'
+
+
+def _abandon_upload(writer) -> None:
+    # close() would finalize a truncated object; terminate() cancels the resumable
+    # session instead; writers without it are simply dropped unfinalized.
+    terminate = getattr(writer, 'terminate', None)
+    if terminate is None:
+        return
+    try:
+        terminate()
+    except Exception as exc:  # noqa: BLE001 - the session expires on its own
+        logger.debug('Cancelling resumable upload failed: %s', exc)
+
+
 class CreatomateCopyError(RuntimeError):
     """Raised when a remote render asset cannot be copied into storage."""
 
@@ -280,5 +772,9 @@ __all__ = [
     'LocalRenderStorage',
     'GCSRenderStorage',
     'CreatomateCopyError',
+    'RENDER_ARTIFACTS',
+    'SignedURLCache',
+    'DEFAULT_SWEEP_BATCH_SIZE',
+    'DEDUPLICATED_ARTIFACTS',
     'create_storage',
 ]
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
-import json
-import urllib.error
-import urllib.request
 from dataclasses import dataclass
 from typing import Dict, Iterable, List, Optional, Protocol
 
+from .transport import (
+    AsyncHTTPTransport,
+    HTTPTransport,
+    TransportError,
+    bearer_headers,
+    get_async_transport,
+    get_transport,
+)
+
 
 class Summarizer(Protocol):
     """Summarizer interface for transforming asset captions into highlight copy."""
@@ -13,6 +19,12 @@ class Summarizer(Protocol):
     def summarize(self, captions: Iterable[str], locale: Optional[str] = None) -> str: ...
 
 
+class AsyncSummarizer(Protocol):
+    """Async summarizer interface."""
+
+    async def summarize(self, captions: Iterable[str], locale: Optional[str] = None) -> str: ...
+
+
 @dataclass
 class StaticSummarizer:
     """Simple stub summarizer used for offline demos."""
@@ -37,26 +49,51 @@ class ScreenAppSummarizer:
     endpoint: str
     api_key: str
     timeout_seconds: float = 5.0
+    transport: Optional[HTTPTransport] = None
 
     def summarize(self, captions: Iterable[str], locale: Optional[str] = None) -> str:
         payload: Dict[str, object] = {
             'captions': list(captions),
             'locale': locale or 'en',
         }
-        req = urllib.request.Request(
-            self.endpoint,
-            data=json.dumps(payload).encode('utf-8'),
-            headers={
-                'Content-Type': 'application/json',
-                'Authorization': f'Bearer {self.api_key}',
-            },
-        )
+        transport = self.transport or get_transport()
         try:
-            with urllib.request.urlopen(req, timeout=self.timeout_seconds) as response:
-                data = json.loads(response.read().decode('utf-8'))
-                return data.get('summary', '') or 'Codex summary unavailable.'
-        except urllib.error.URLError as error:
+            data = transport.post_json(
+                self.endpoint,
+                payload,
+                headers=bearer_headers(self.api_key),
+                timeout=self.timeout_seconds,
+            )
+        except TransportError as error:
             raise RuntimeError(f'Summarization request failed: {error}')
+        return data.get('summary', '') or 'Codex summary unavailable.'
+
+
+@dataclass
+class AsyncScreenAppSummarizer:
+    """Async variant of :class:`ScreenAppSummarizer`."""
+
+    endpoint: str
+    api_key: str
+    timeout_seconds: float = 5.0
+    transport: Optional[AsyncHTTPTransport] = None
+
+    async def summarize(self, captions: Iterable[str], locale: Optional[str] = None) -> str:
+        payload: Dict[str, object] = {
+            'captions': list(captions),
+            'locale': locale or 'en',
+        }
+        transport = self.transport or get_async_transport()
+        try:
+            data = await transport.post_json(
+                self.endpoint,
+                payload,
+                headers=bearer_headers(self.api_key),
+                timeout=self.timeout_seconds,
+            )
+        except TransportError as error:
+            raise RuntimeError(f'Summarization request failed: {error}')
+        return data.get('summary', '') or 'Codex summary unavailable.'
 
 
 def create_summarizer(provider: str | None, options: Dict[str, object] | None = None) -> Summarizer:
@@ -74,3 +111,19 @@ def create_summarizer(provider: str | None, options: Dict[str, object] | None =
         return ScreenAppSummarizer(endpoint=str(endpoint), api_key=str(api_key))
 
     raise ValueError(f'Unsupported summarizer provider: {provider}')
+
+
+def create_async_summarizer(provider: str | None, options: Dict[str, object] | None = None) -> AsyncSummarizer:
+    """Async counterpart of :func:`create_summarizer`."""
+
+    summarizer = create_summarizer(provider, options)
+    if isinstance(summarizer, ScreenAppSummarizer):
+        return AsyncScreenAppSummarizer(
+            endpoint=summarizer.endpoint,
+            api_key=summarizer.api_key,
+            timeout_seconds=summarizer.timeout_seconds,
+        )
+
+    from .async_support import to_async
+
+    return to_async(summarizer)
@@ -1,12 +1,20 @@
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 import os
-import urllib.error
-import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, Iterable, Iterator, List, MutableMapping, Optional, Protocol
+from typing import Dict, Iterable, Iterator, List, MutableMapping, Optional, Protocol, Set
+
+from .transport import (
+    AsyncHTTPTransport,
+    HTTPTransport,
+    TransportError,
+    bearer_headers,
+    get_async_transport,
+    get_transport,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -62,8 +70,20 @@ class StaticTranslator:
         return results
 
 
-class GPTTranslator:
-    """Calls a GPT-5 translation microservice to localise content."""
+class AsyncTranslator(Protocol):
+    """Async interface for translation providers."""
+
+    async def translate(
+        self,
+        items: Iterable[TranslationItem],
+        target_locale: str,
+        *,
+        source_locale: str,
+    ) -> Dict[str, str]: ...
+
+
+class _GPTTranslationClient:
+    """Configuration, request building and parsing shared by the sync and async GPT translators."""
 
     def __init__(
         self,
@@ -72,72 +92,67 @@ class GPTTranslator:
         *,
         timeout_seconds: float = 12.0,
         max_attempts: int = 2,
+        max_chunk_items: int = 40,
+        max_chunk_chars: int = 6000,
+        max_concurrency: int = 4,
     ) -> None:
         self.endpoint = endpoint.rstrip('/')
         self.api_key = api_key
         self.timeout_seconds = timeout_seconds
         self.max_attempts = max(1, max_attempts)
+        self.max_chunk_items = max(1, max_chunk_items)
+        self.max_chunk_chars = max(1, max_chunk_chars)
+        self.max_concurrency = max(1, max_concurrency)
 
-    def translate(
-        self,
-        items: Iterable[TranslationItem],
-        target_locale: str,
-        *,
-        source_locale: str,
-    ) -> Dict[str, str]:
-        payload_items = [
-            {'id': item.key, 'text': item.text}
-            for item in _iter_items(items)
-        ]
-        if not payload_items:
-            return {}
-
-        attempt = 0
-        while attempt < self.max_attempts:
-            attempt += 1
-            try:
-                data = self._call_service(payload_items, source_locale, target_locale)
-            except urllib.error.URLError as error:
-                logger.warning('Translation request failed (attempt %s/%s): %s', attempt, self.max_attempts, error)
-                if attempt >= self.max_attempts:
-                    break
-                continue
-
-            translations = self._parse_response(data)
-            if _is_complete_translation(payload_items, translations):
-                return translations
+    def _chunks(self, pending: List[MutableMapping[str, str]]) -> List[List[MutableMapping[str, str]]]:
+        return _chunk_payload_items(pending, self.max_chunk_items, self.max_chunk_chars)
 
-            logger.warning(
-                'Translation response missing entries (attempt %s/%s); retrying.',
-                attempt,
-                self.max_attempts,
-            )
-
-        return translations if 'translations' in locals() else {}
-
-    def _call_service(
+    def _request_payload(
         self,
         payload_items: List[MutableMapping[str, str]],
         source_locale: str,
         target_locale: str,
     ) -> Dict[str, object]:
-        request_payload = {
+        return {
             'source_locale': source_locale,
             'target_locale': target_locale,
             'items': payload_items,
         }
-        request = urllib.request.Request(
-            self.endpoint,
-            data=json.dumps(request_payload).encode('utf-8'),
-            headers={
-                'Content-Type': 'application/json',
-                'Authorization': f'Bearer {self.api_key}',
-            },
+
+    def _chunk_failed(self, chunk: List[MutableMapping[str, str]], attempt: int, error: TransportError) -> Dict[str, str]:
+        logger.warning(
+            'Translation request for %s items failed (attempt %s/%s): %s',
+            len(chunk),
+            attempt,
+            self.max_attempts,
+            error,
         )
+        return {}
+
+    def _accept_chunk(self, chunk: List[MutableMapping[str, str]], data: Dict[str, object]) -> Dict[str, str]:
+        requested = {entry['id'] for entry in chunk}
+        return {
+            key: text
+            for key, text in self._parse_response(data).items()
+            if key in requested and text
+        }
 
-        with urllib.request.urlopen(request, timeout=self.timeout_seconds) as response:
-            raw = response.read().decode('utf-8')
-        return json.loads(raw)
+    def _next_pending(
+        self,
+        pending: List[MutableMapping[str, str]],
+        translations: Dict[str, str],
+        attempt: int,
+    ) -> List[MutableMapping[str, str]]:
+        missing = _missing_translation_keys(pending, translations)
+        pending = [entry for entry in pending if entry['id'] in missing]
+        if pending and attempt < self.max_attempts:
+            logger.warning(
+                'Translation response missing %s entries (attempt %s/%s); retrying missing keys.',
+                len(pending),
+                attempt,
+                self.max_attempts,
+            )
+        return pending
 
     def _parse_response(self, data: Dict[str, object]) -> Dict[str, str]:
         translations_raw = data.get('translations', [])
@@ -153,12 +168,197 @@ class GPTTranslator:
         return results
 
 
-def _is_complete_translation(
+class GPTTranslator(_GPTTranslationClient):
+    """Calls a GPT-5 translation microservice to localise content.
+
+    Large item lists are split into chunks bounded by item count and total characters
+    and posted concurrently. Retries only resend keys still missing from the merged
+    result, so one dropped string never costs a full retranslation.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        api_key: str,
+        *,
+        timeout_seconds: float = 12.0,
+        max_attempts: int = 2,
+        max_chunk_items: int = 40,
+        max_chunk_chars: int = 6000,
+        max_concurrency: int = 4,
+        transport: Optional[HTTPTransport] = None,
+    ) -> None:
+        super().__init__(
+            endpoint,
+            api_key,
+            timeout_seconds=timeout_seconds,
+            max_attempts=max_attempts,
+            max_chunk_items=max_chunk_items,
+            max_chunk_chars=max_chunk_chars,
+            max_concurrency=max_concurrency,
+        )
+        self.transport = transport or get_transport()
+
+    def translate(
+        self,
+        items: Iterable[TranslationItem],
+        target_locale: str,
+        *,
+        source_locale: str,
+    ) -> Dict[str, str]:
+        pending = _payload_items(items)
+        translations: Dict[str, str] = {}
+        attempt = 0
+        while pending and attempt < self.max_attempts:
+            if attempt:
+                self.transport.pause(attempt)
+            attempt += 1
+            for chunk_translations in self._dispatch_chunks(self._chunks(pending), source_locale, target_locale, attempt):
+                translations.update(chunk_translations)
+            pending = self._next_pending(pending, translations, attempt)
+
+        return translations
+
+    def _dispatch_chunks(
+        self,
+        chunks: List[List[MutableMapping[str, str]]],
+        source_locale: str,
+        target_locale: str,
+        attempt: int,
+    ) -> List[Dict[str, str]]:
+        def run(chunk: List[MutableMapping[str, str]]) -> Dict[str, str]:
+            try:
+                data = self._call_service(chunk, source_locale, target_locale)
+            except TransportError as error:
+                return self._chunk_failed(chunk, attempt, error)
+            return self._accept_chunk(chunk, data)
+
+        workers = min(self.max_concurrency, len(chunks))
+        if workers <= 1:
+            return [run(chunk) for chunk in chunks]
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='codex-translate') as executor:
+            return list(executor.map(run, chunks))
+
+    def _call_service(
+        self,
+        payload_items: List[MutableMapping[str, str]],
+        source_locale: str,
+        target_locale: str,
+    ) -> Dict[str, object]:
+        # Retries are driven by translate() so only missing keys are resent.
+        return self.transport.post_json(
+            self.endpoint,
+            self._request_payload(payload_items, source_locale, target_locale),
+            headers=bearer_headers(self.api_key),
+            timeout=self.timeout_seconds,
+            max_attempts=1,
+        )
+
+
+class AsyncGPTTranslator(_GPTTranslationClient):
+    """Async GPT-5 translator with the same chunking and missing-key retries as :class:`GPTTranslator`.
+
+    Chunks are awaited concurrently, at most ``max_concurrency`` in flight, on the
+    running loop's shared transport unless one is given.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        api_key: str,
+        *,
+        timeout_seconds: float = 12.0,
+        max_attempts: int = 2,
+        max_chunk_items: int = 40,
+        max_chunk_chars: int = 6000,
+        max_concurrency: int = 4,
+        transport: Optional[AsyncHTTPTransport] = None,
+    ) -> None:
+        super().__init__(
+            endpoint,
+            api_key,
+            timeout_seconds=timeout_seconds,
+            max_attempts=max_attempts,
+            max_chunk_items=max_chunk_items,
+            max_chunk_chars=max_chunk_chars,
+            max_concurrency=max_concurrency,
+        )
+        self._transport = transport
+
+    @property
+    def transport(self) -> AsyncHTTPTransport:
+        return self._transport or get_async_transport()
+
+    async def translate(
+        self,
+        items: Iterable[TranslationItem],
+        target_locale: str,
+        *,
+        source_locale: str,
+    ) -> Dict[str, str]:
+        pending = _payload_items(items)
+        translations: Dict[str, str] = {}
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run(chunk: List[MutableMapping[str, str]], attempt: int) -> Dict[str, str]:
+            async with semaphore:
+                try:
+                    data = await self.transport.post_json(
+                        self.endpoint,
+                        self._request_payload(chunk, source_locale, target_locale),
+                        headers=bearer_headers(self.api_key),
+                        timeout=self.timeout_seconds,
+                        max_attempts=1,
+                    )
+                except TransportError as error:
+                    return self._chunk_failed(chunk, attempt, error)
+            return self._accept_chunk(chunk, data)
+
+        attempt = 0
+        while pending and attempt < self.max_attempts:
+            if attempt:
+                await self.transport.pause(attempt)
+            attempt += 1
+            results = await asyncio.gather(*(run(chunk, attempt) for chunk in self._chunks(pending)))
+            for chunk_translations in results:
+                translations.update(chunk_translations)
+            pending = self._next_pending(pending, translations, attempt)
+
+        return translations
+
+
+def _payload_items(items: Iterable[TranslationItem]) -> List[MutableMapping[str, str]]:
+    return [{'id': item.key, 'text': item.text} for item in _iter_items(items)]
+
+
+def _chunk_payload_items(
+    payload_items: List[MutableMapping[str, str]],
+    max_items: int,
+    max_chars: int,
+) -> List[List[MutableMapping[str, str]]]:
+    """Greedily packs items into request-sized chunks; oversized items travel alone."""
+
+    chunks: List[List[MutableMapping[str, str]]] = []
+    current: List[MutableMapping[str, str]] = []
+    current_chars = 0
+    for entry in payload_items:
+        size = len(entry['text'])
+        if current and (len(current) >= max_items or current_chars + size > max_chars):
+            chunks.append(current)
+            current = []
+            current_chars = 0
+        current.append(entry)
+        current_chars += size
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _missing_translation_keys(
     payload_items: List[MutableMapping[str, str]],
     translations: Dict[str, str],
-) -> bool:
-    expected_keys = {entry['id'] for entry in payload_items}
-    return expected_keys.issubset(translations.keys()) and all(translations.values())
+) -> Set[str]:
+    return {entry['id'] for entry in payload_items if not translations.get(entry['id'])}
 
 
 def create_translator(provider: Optional[str] = None, options: Optional[Dict[str, object]] = None) -> Translator:
@@ -175,22 +375,79 @@ def create_translator(provider: Optional[str] = None, options: Optional[Dict[str
         api_key = options.get('api_key') or os.environ.get('CODEX_TRANSLATION_API_KEY')
         timeout = float(options.get('timeout', os.environ.get('CODEX_TRANSLATION_TIMEOUT', 12.0)))
         attempts = int(options.get('max_attempts', os.environ.get('CODEX_TRANSLATION_MAX_ATTEMPTS', 2)))
+        chunk_items = int(options.get('max_chunk_items', os.environ.get('CODEX_TRANSLATION_CHUNK_ITEMS', 40)))
+        chunk_chars = int(options.get('max_chunk_chars', os.environ.get('CODEX_TRANSLATION_CHUNK_CHARS', 6000)))
+        concurrency = int(options.get('max_concurrency', os.environ.get('CODEX_TRANSLATION_CONCURRENCY', 4)))
 
         if endpoint and api_key:
-            return GPTTranslator(
+            translator = GPTTranslator(
                 endpoint=str(endpoint),
                 api_key=str(api_key),
                 timeout_seconds=float(timeout),
                 max_attempts=int(attempts),
+                max_chunk_items=chunk_items,
+                max_chunk_chars=chunk_chars,
+                max_concurrency=concurrency,
             )
+            return _with_cache(translator, options)
 
     return StaticTranslator()
 
 
+def _with_cache(translator: Translator, options: Dict[str, object]) -> Translator:
+    """Fronts the translator with the persistent cache when a cache path is configured.
+
+    Only service-backed translators are cached so static placeholders never leak into
+    a cache later shared with a real GPT translator.
+    """
+
+    cache_path = options.get('cache_path') or os.environ.get('CODEX_TRANSLATION_CACHE_PATH')
+    if not cache_path:
+        return translator
+
+    from .translation_cache import CachedTranslator, SQLiteTranslationCache
+
+    ttl = options.get('cache_ttl', os.environ.get('CODEX_TRANSLATION_CACHE_TTL'))
+    max_entries = options.get('cache_max_entries', os.environ.get('CODEX_TRANSLATION_CACHE_MAX_ENTRIES'))
+    cache = SQLiteTranslationCache(
+        str(cache_path),
+        ttl_seconds=float(ttl) if ttl not in (None, '') else None,
+        max_entries=int(max_entries) if max_entries not in (None, '') else None,
+    )
+    return CachedTranslator(translator, cache)
+
+
+def create_async_translator(provider: Optional[str] = None, options: Optional[Dict[str, object]] = None) -> AsyncTranslator:
+    """Async counterpart of :func:`create_translator`.
+
+    A plain GPT translator becomes an :class:`AsyncGPTTranslator`; cached and static
+    translators are wrapped to run on the default executor so cache reads stay off the loop.
+    """
+
+    translator = create_translator(provider, options)
+    if isinstance(translator, GPTTranslator):
+        return AsyncGPTTranslator(
+            translator.endpoint,
+            translator.api_key,
+            timeout_seconds=translator.timeout_seconds,
+            max_attempts=translator.max_attempts,
+            max_chunk_items=translator.max_chunk_items,
+            max_chunk_chars=translator.max_chunk_chars,
+            max_concurrency=translator.max_concurrency,
+        )
+
+    from .async_support import to_async
+
+    return to_async(translator)
+
+
 __all__ = [
     'Translator',
     'TranslationItem',
     'StaticTranslator',
     'GPTTranslator',
+    'AsyncTranslator',
+    'AsyncGPTTranslator',
     'create_translator',
+    'create_async_translator',
 ]
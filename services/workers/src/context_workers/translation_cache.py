@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from .translation import TranslationItem, Translator, _iter_items
+
+logger = logging.getLogger(__name__)
+
+_SQLITE_MAX_PARAMS = 500
+
+_SCHEMA = (
+    '''
+    CREATE TABLE IF NOT EXISTS translations (
+        source_locale TEXT NOT NULL,
+        target_locale TEXT NOT NULL,
+        text_hash TEXT NOT NULL,
+        translation TEXT NOT NULL,
+        created_at REAL NOT NULL,
+        accessed_at REAL NOT NULL,
+        PRIMARY KEY (source_locale, target_locale, text_hash)
+    )
+    ''',
+    'CREATE INDEX IF NOT EXISTS translations_accessed_at ON translations (accessed_at)',
+    'CREATE INDEX IF NOT EXISTS translations_created_at ON translations (created_at)',
+)
+
+
+def text_digest(text: str) -> str:
+    """Content address used as the cache key for a source string."""
+
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class SQLiteTranslationCache:
+    """Content-addressed translation store keyed by (source, target, sha256(text)).
+
+    Entries older than ``ttl_seconds`` are ignored and purged; when ``max_entries`` is
+    exceeded the least recently read rows are evicted. Pass ``':memory:'`` for a
+    process-local cache.
+    """
+
+    def __init__(
+        self,
+        path: str | Path = ':memory:',
+        *,
+        ttl_seconds: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = str(path)
+        self.ttl_seconds = ttl_seconds if ttl_seconds and ttl_seconds > 0 else None
+        self.max_entries = max_entries if max_entries and max_entries > 0 else None
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+        if self.path != ':memory:':
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        for statement in _SCHEMA:
+            self._conn.execute(statement)
+
+    def get_many(
+        self,
+        source_locale: str,
+        target_locale: str,
+        digests: Iterable[str],
+    ) -> Dict[str, str]:
+        """Returns cached translations for the given digests and refreshes their recency."""
+
+        wanted = list(dict.fromkeys(digests))
+        if not wanted:
+            return {}
+
+        now = self.clock()
+        cutoff = now - self.ttl_seconds if self.ttl_seconds else None
+        found: Dict[str, str] = {}
+
+        with self._lock:
+            for start in range(0, len(wanted), _SQLITE_MAX_PARAMS):
+                chunk = wanted[start:start + _SQLITE_MAX_PARAMS]
+                placeholders = ','.join('?' for _ in chunk)
+                query = (
+                    'SELECT text_hash, translation FROM translations '
+                    f'WHERE source_locale = ? AND target_locale = ? AND text_hash IN ({placeholders})'
+                )
+                params: List[object] = [source_locale, target_locale, *chunk]
+                if cutoff is not None:
+                    query += ' AND created_at >= ?'
+                    params.append(cutoff)
+                found.update(self._conn.execute(query, params).fetchall())
+
+            if found:
+                self._conn.executemany(
+                    'UPDATE translations SET accessed_at = ? '
+                    'WHERE source_locale = ? AND target_locale = ? AND text_hash = ?',
+                    [(now, source_locale, target_locale, digest) for digest in found],
+                )
+            self.hits += len(found)
+            self.misses += len(wanted) - len(found)
+        return found
+
+    def put_many(
+        self,
+        source_locale: str,
+        target_locale: str,
+        entries: Dict[str, str],
+    ) -> None:
+        """Stores ``{digest: translation}`` pairs, then applies TTL and size eviction."""
+
+        now = self.clock()
+        rows = [
+            (source_locale, target_locale, digest, translation, now, now)
+            for digest, translation in entries.items()
+            if translation
+        ]
+        if not rows:
+            return
+
+        with self._lock:
+            self._conn.execute('BEGIN')
+            try:
+                self._conn.executemany(
+                    'INSERT OR REPLACE INTO translations '
+                    '(source_locale, target_locale, text_hash, translation, created_at, accessed_at) '
+                    'VALUES (?, ?, ?, ?, ?, ?)',
+                    rows,
+                )
+                self._evict_locked(now)
+                self._conn.execute('COMMIT')
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+
+    def _evict_locked(self, now: float) -> None:
+        if self.ttl_seconds:
+            cursor = self._conn.execute(
+                'DELETE FROM translations WHERE created_at < ?',
+                (now - self.ttl_seconds,),
+            )
+            self.evictions += max(cursor.rowcount, 0)
+
+        if self.max_entries:
+            (count,) = self._conn.execute('SELECT COUNT(*) FROM translations').fetchone()
+            excess = count - self.max_entries
+            if excess > 0:
+                cursor = self._conn.execute(
+                    'DELETE FROM translations WHERE rowid IN '
+                    '(SELECT rowid FROM translations ORDER BY accessed_at ASC LIMIT ?)',
+                    (excess,),
+                )
+                self.evictions += max(cursor.rowcount, 0)
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute('SELECT COUNT(*) FROM translations').fetchone()
+        return int(count)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self),
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class CachedTranslator:
+    """Wraps any ``Translator`` and only forwards cache misses, in a single request.
+
+    Repeated strings (beat titles, rationale templates) are sent once per miss batch
+    even when several keys share the same text.
+    """
+
+    def __init__(self, translator: Translator, cache: SQLiteTranslationCache) -> None:
+        self.translator = translator
+        self.cache = cache
+
+    def translate(
+        self,
+        items: Iterable[TranslationItem],
+        target_locale: str,
+        *,
+        source_locale: str,
+    ) -> Dict[str, str]:
+        keyed: List[Tuple[TranslationItem, str]] = [
+            (item, text_digest(item.text)) for item in _iter_items(items)
+        ]
+        if not keyed:
+            return {}
+
+        cached = self.cache.get_many(source_locale, target_locale, (digest for _, digest in keyed))
+
+        results: Dict[str, str] = {}
+        misses: Dict[str, List[TranslationItem]] = {}
+        for item, digest in keyed:
+            if digest in cached:
+                results[item.key] = cached[digest]
+            else:
+                misses.setdefault(digest, []).append(item)
+
+        if not misses:
+            return results
+
+        representatives = [group[0] for group in misses.values()]
+        translated = self.translator.translate(
+            representatives,
+            target_locale,
+            source_locale=source_locale,
+        ) or {}
+
+        fresh: Dict[str, str] = {}
+        for digest, group in misses.items():
+            text = translated.get(group[0].key)
+            if not text:
+                continue
+            fresh[digest] = text
+            for item in group:
+                results[item.key] = text
+
+        try:
+            self.cache.put_many(source_locale, target_locale, fresh)
+        except sqlite3.Error as error:
+            logger.warning('Failed to persist translations to cache: %s', error)
+        return results
+
+
+__all__ = [
+    'SQLiteTranslationCache',
+    'CachedTranslator',
+    'text_digest',
+]
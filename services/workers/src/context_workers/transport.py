@@ -0,0 +1,479 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import logging
+import os
+import random
+import threading
+import time
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+
+from . import serialization
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+class TransportError(RuntimeError):
+    """Raised when an HTTP call fails after exhausting its retry budget."""
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        url: str | None = None,
+        status: int | None = None,
+        body: str | None = None,
+    ) -> None:
+        super().__init__(message)
+        self.url = url
+        self.status = status
+        self.body = body
+
+
+@dataclass
+class HostMetrics:
+    """Running latency and outcome counters for one host."""
+
+    requests: int = 0
+    failures: int = 0
+    retries: int = 0
+    total_latency_ms: float = 0.0
+    max_latency_ms: float = 0.0
+
+    def as_dict(self) -> Dict[str, float]:
+        average = self.total_latency_ms / self.requests if self.requests else 0.0
+        return {
+            'requests': self.requests,
+            'failures': self.failures,
+            'retries': self.retries,
+            'avg_latency_ms': round(average, 3),
+            'max_latency_ms': round(self.max_latency_ms, 3),
+        }
+
+
+@dataclass
+class TransportMetrics:
+    """Thread-safe per-host call metrics shared by every provider."""
+
+    hosts: Dict[str, HostMetrics] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, host: str, latency_ms: float, *, failed: bool, retried: bool) -> None:
+        with self._lock:
+            metrics = self.hosts.setdefault(host, HostMetrics())
+            metrics.requests += 1
+            metrics.failures += int(failed)
+            metrics.retries += int(retried)
+            metrics.total_latency_ms += latency_ms
+            metrics.max_latency_ms = max(metrics.max_latency_ms, latency_ms)
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {host: metrics.as_dict() for host, metrics in self.hosts.items()}
+
+
+def _resolve_http2(http2: Optional[bool]) -> bool:
+    h2_available = importlib.util.find_spec('h2') is not None
+    if http2 is None:
+        return h2_available
+    if http2 and not h2_available:
+        logger.warning('HTTP/2 requested but the h2 package is not installed; using HTTP/1.1.')
+        return False
+    return http2
+
+
+class _RetryingTransport:
+    """Retry policy, backoff and metrics shared by the sync and async transports."""
+
+    def __init__(
+        self,
+        *,
+        max_attempts: int,
+        backoff_base: float,
+        backoff_max: float,
+        retry_statuses: Iterable[int],
+    ) -> None:
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = frozenset(retry_statuses)
+        self.metrics = TransportMetrics()
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter exponential delay before retry number ``attempt`` (1-based)."""
+
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** max(0, attempt - 1)))
+        return random.uniform(0, ceiling)
+
+    def _prepare(
+        self,
+        json_body: Any,
+        content: bytes | None,
+        headers: Optional[Dict[str, str]],
+        timeout: Optional[float],
+        max_attempts: Optional[int],
+    ) -> Tuple[bytes | None, Optional[Dict[str, str]], Any, int]:
+        if json_body is not None:
+            content = serialization.dumps(json_body, compact=True)
+            headers = {'Content-Type': 'application/json', **(headers or {})}
+        resolved_timeout = timeout if timeout is not None else httpx.USE_CLIENT_DEFAULT
+        return content, headers, resolved_timeout, max(1, max_attempts or self.max_attempts)
+
+    def _on_error(
+        self,
+        method: str,
+        url: str,
+        error: httpx.HTTPError,
+        *,
+        attempt: int,
+        attempts: int,
+        started: float,
+    ) -> None:
+        """Records a failed exchange; raises once the retry budget is spent."""
+
+        retrying = attempt < attempts
+        self.metrics.record(_host(url), _elapsed_ms(started), failed=True, retried=retrying)
+        logger.warning('%s %s failed (attempt %s/%s): %s', method, url, attempt, attempts, error)
+        if not retrying:
+            raise TransportError(f'{method} {url} failed: {error}', url=url) from error
+
+    def _should_retry(
+        self,
+        method: str,
+        url: str,
+        response: httpx.Response,
+        *,
+        attempt: int,
+        attempts: int,
+        started: float,
+    ) -> bool:
+        """Records a completed exchange; raises on non-retryable or final HTTP errors."""
+
+        latency_ms = _elapsed_ms(started)
+        failed = response.status_code >= 400
+        retrying = failed and response.status_code in self.retry_statuses and attempt < attempts
+        self.metrics.record(_host(url), latency_ms, failed=failed, retried=retrying)
+        logger.debug('%s %s -> %s in %.1fms', method, url, response.status_code, latency_ms)
+
+        if retrying:
+            logger.warning(
+                '%s %s returned %s (attempt %s/%s); retrying.',
+                method,
+                url,
+                response.status_code,
+                attempt,
+                attempts,
+            )
+            return True
+        if failed:
+            raise TransportError(
+                f'{method} {url} returned HTTP {response.status_code}',
+                url=url,
+                status=response.status_code,
+                body=response.text,
+            )
+        return False
+
+
+class HTTPTransport(_RetryingTransport):
+    """Pooled keep-alive HTTP client with retry, jittered backoff and latency metrics.
+
+    A single instance is shared by the GPT-backed providers, the preference client and
+    the Creatomate renderer so repeated calls reuse TCP/TLS connections per host.
+    HTTP/2 is negotiated when the optional ``h2`` package is installed.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections: int = 32,
+        max_keepalive_connections: int = 16,
+        keepalive_expiry: float = 30.0,
+        http2: Optional[bool] = None,
+        max_attempts: int = 2,
+        backoff_base: float = 0.25,
+        backoff_max: float = 4.0,
+        retry_statuses: Iterable[int] = RETRYABLE_STATUSES,
+        client: Optional[httpx.Client] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        super().__init__(
+            max_attempts=max_attempts,
+            backoff_base=backoff_base,
+            backoff_max=backoff_max,
+            retry_statuses=retry_statuses,
+        )
+        self.http2 = _resolve_http2(http2)
+        self._sleep = sleep
+        self._client = client or httpx.Client(
+            http2=self.http2,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+        )
+
+    def pause(self, attempt: int) -> None:
+        """Sleeps for the jittered backoff; used by callers that retry at a higher level."""
+
+        self._sleep(self.backoff(attempt))
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        json_body: Any = None,
+        content: bytes | None = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+    ) -> httpx.Response:
+        """Sends a request, retrying connection failures and retryable statuses."""
+
+        content, headers, timeout_value, attempts = self._prepare(json_body, content, headers, timeout, max_attempts)
+        attempt = 0
+        while True:
+            attempt += 1
+            started = time.perf_counter()
+            try:
+                response = self._client.request(method, url, content=content, headers=headers, timeout=timeout_value)
+            except httpx.HTTPError as error:
+                self._on_error(method, url, error, attempt=attempt, attempts=attempts, started=started)
+                self.pause(attempt)
+                continue
+            if self._should_retry(method, url, response, attempt=attempt, attempts=attempts, started=started):
+                self.pause(attempt)
+                continue
+            return response
+
+    def post_json(
+        self,
+        url: str,
+        payload: Any,
+        *,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+    ) -> Any:
+        """POSTs a JSON document and decodes the JSON response."""
+
+        response = self.request(
+            'POST',
+            url,
+            json_body=payload,
+            headers=headers,
+            timeout=timeout,
+            max_attempts=max_attempts,
+        )
+        return _decode_json(response, url)
+
+    def get_json(
+        self,
+        url: str,
+        *,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+    ) -> Any:
+        response = self.request('GET', url, headers=headers, timeout=timeout, max_attempts=max_attempts)
+        return _decode_json(response, url)
+
+    def close(self) -> None:
+        self._client.close()
+
+
+class AsyncHTTPTransport(_RetryingTransport):
+    """``asyncio`` counterpart of :class:`HTTPTransport` backed by ``httpx.AsyncClient``.
+
+    The underlying connection pool is bound to the event loop it is first used on.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections: int = 64,
+        max_keepalive_connections: int = 32,
+        keepalive_expiry: float = 30.0,
+        http2: Optional[bool] = None,
+        max_attempts: int = 2,
+        backoff_base: float = 0.25,
+        backoff_max: float = 4.0,
+        retry_statuses: Iterable[int] = RETRYABLE_STATUSES,
+        client: Optional[httpx.AsyncClient] = None,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        super().__init__(
+            max_attempts=max_attempts,
+            backoff_base=backoff_base,
+            backoff_max=backoff_max,
+            retry_statuses=retry_statuses,
+        )
+        self.http2 = _resolve_http2(http2)
+        self._sleep = sleep
+        self._client = client or httpx.AsyncClient(
+            http2=self.http2,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+        )
+
+    async def pause(self, attempt: int) -> None:
+        await self._sleep(self.backoff(attempt))
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        json_body: Any = None,
+        content: bytes | None = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+    ) -> httpx.Response:
+        content, headers, timeout_value, attempts = self._prepare(json_body, content, headers, timeout, max_attempts)
+        attempt = 0
+        while True:
+            attempt += 1
+            started = time.perf_counter()
+            try:
+                response = await self._client.request(
+                    method,
+                    url,
+                    content=content,
+                    headers=headers,
+                    timeout=timeout_value,
+                )
+            except httpx.HTTPError as error:
+                self._on_error(method, url, error, attempt=attempt, attempts=attempts, started=started)
+                await self.pause(attempt)
+                continue
+            if self._should_retry(method, url, response, attempt=attempt, attempts=attempts, started=started):
+                await self.pause(attempt)
+                continue
+            return response
+
+    async def post_json(
+        self,
+        url: str,
+        payload: Any,
+        *,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+    ) -> Any:
+        response = await self.request(
+            'POST',
+            url,
+            json_body=payload,
+            headers=headers,
+            timeout=timeout,
+            max_attempts=max_attempts,
+        )
+        return _decode_json(response, url)
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+def _host(url: str) -> str:
+    return urlsplit(url).netloc or url
+
+
+def _elapsed_ms(started: float) -> float:
+    return (time.perf_counter() - started) * 1000
+
+
+def _decode_json(response: httpx.Response, url: str) -> Any:
+    try:
+        return serialization.loads(response.content)
+    except ValueError as error:
+        raise TransportError(
+            f'Invalid JSON from {url}',
+            url=url,
+            status=response.status_code,
+            body=response.text,
+        ) from error
+
+
+def bearer_headers(api_key: str) -> Dict[str, str]:
+    return {'Authorization': f'Bearer {api_key}'}
+
+
+_default_transport: Optional[HTTPTransport] = None
+_default_lock = threading.Lock()
+
+
+def get_transport() -> HTTPTransport:
+    """Returns the process-wide transport, creating it from ``CODEX_HTTP_*`` env vars."""
+
+    global _default_transport
+    with _default_lock:
+        if _default_transport is None:
+            http2_env = os.environ.get('CODEX_HTTP2')
+            _default_transport = HTTPTransport(
+                max_connections=int(os.environ.get('CODEX_HTTP_MAX_CONNECTIONS', 32)),
+                max_attempts=int(os.environ.get('CODEX_HTTP_MAX_ATTEMPTS', 2)),
+                http2=None if http2_env is None else http2_env.lower() in {'1', 'true', 'yes'},
+            )
+        return _default_transport
+
+
+_async_transports: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncHTTPTransport]' = weakref.WeakKeyDictionary()
+
+
+def get_async_transport() -> AsyncHTTPTransport:
+    """Returns the async transport for the running event loop, creating it on first use."""
+
+    loop = asyncio.get_running_loop()
+    transport = _async_transports.get(loop)
+    if transport is None:
+        transport = create_async_transport()
+        _async_transports[loop] = transport
+    return transport
+
+
+def create_async_transport() -> AsyncHTTPTransport:
+    """Builds a new async transport from ``CODEX_HTTP_*`` env vars; the caller owns and closes it."""
+
+    http2_env = os.environ.get('CODEX_HTTP2')
+    return AsyncHTTPTransport(
+        max_connections=int(os.environ.get('CODEX_HTTP_MAX_CONNECTIONS', 64)),
+        max_attempts=int(os.environ.get('CODEX_HTTP_MAX_ATTEMPTS', 2)),
+        http2=None if http2_env is None else http2_env.lower() in {'1', 'true', 'yes'},
+    )
+
+
+def set_transport(transport: Optional[HTTPTransport]) -> Optional[HTTPTransport]:
+    """Replaces the process-wide transport (e.g. for tests); returns the previous one."""
+
+    global _default_transport
+    with _default_lock:
+        previous = _default_transport
+        _default_transport = transport
+        return previous
+
+
+__all__ = [
+    'AsyncHTTPTransport',
+    'HTTPTransport',
+    'TransportError',
+    'TransportMetrics',
+    'bearer_headers',
+    'create_async_transport',
+    'get_async_transport',
+    'get_transport',
+    'set_transport',
+]
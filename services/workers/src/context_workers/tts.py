@@ -3,11 +3,18 @@ from __future__ import annotations
 import json
 import logging
 import os
-import urllib.error
-import urllib.request
 from dataclasses import dataclass, field
 from typing import Dict, Iterable, Optional, Protocol
 
+from .transport import (
+    AsyncHTTPTransport,
+    HTTPTransport,
+    TransportError,
+    bearer_headers,
+    get_async_transport,
+    get_transport,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -42,6 +49,19 @@ class TTSSynthesizer(Protocol):
     ) -> Optional[TTSSynthesis]: ...
 
 
+class AsyncTTSSynthesizer(Protocol):
+    """Async interface for text-to-speech providers."""
+
+    async def synthesize(
+        self,
+        items: Iterable[TTSRequestItem],
+        *,
+        locale: str,
+        base_locale: str,
+        poi_id: str,
+    ) -> Optional[TTSSynthesis]: ...
+
+
 class StaticTTSSynthesizer:
     """Fallback synthesizer when no TTS service is configured."""
 
@@ -56,8 +76,8 @@ class StaticTTSSynthesizer:
         return None
 
 
-class GPTTTSSynthesizer:
-    """Calls a GPT-5 TTS microservice to generate narration audio."""
+class _GPTTTSClient:
+    """Request building and response parsing shared by the sync and async GPT synthesizers."""
 
     def __init__(
         self,
@@ -76,14 +96,14 @@ class GPTTTSSynthesizer:
         self.default_voice = default_voice
         self.voice_overrides = {k.lower(): v for k, v in (voice_overrides or {}).items()}
 
-    def synthesize(
+    def _build_request(
         self,
         items: Iterable[TTSRequestItem],
         *,
         locale: str,
         base_locale: str,
         poi_id: str,
-    ) -> Optional[TTSSynthesis]:
+    ) -> Optional[Dict[str, object]]:
         payload_items = [
             {'id': item.id, 'text': item.text}
             for item in items
@@ -93,7 +113,7 @@ class GPTTTSSynthesizer:
             return None
 
         voice = self._select_voice(locale)
-        request_payload = {
+        request_payload: Dict[str, object] = {
             'poi_id': poi_id,
             'locale': locale,
             'base_locale': base_locale,
@@ -101,34 +121,7 @@ class GPTTTSSynthesizer:
         }
         if voice:
             request_payload['voice'] = voice
-
-        attempt = 0
-        while attempt < self.max_attempts:
-            attempt += 1
-            try:
-                response_data = self._call_service(request_payload)
-                return self._parse_response(locale, response_data, fallback_voice=voice)
-            except urllib.error.URLError as error:
-                logger.warning(
-                    'TTS request failed (attempt %s/%s): %s',
-                    attempt,
-                    self.max_attempts,
-                    error,
-                )
-        return None
-
-    def _call_service(self, payload: Dict[str, object]) -> Dict[str, object]:
-        request = urllib.request.Request(
-            self.endpoint,
-            data=json.dumps(payload).encode('utf-8'),
-            headers={
-                'Content-Type': 'application/json',
-                'Authorization': f'Bearer {self.api_key}',
-            },
-        )
-        with urllib.request.urlopen(request, timeout=self.timeout_seconds) as response:
-            raw = response.read().decode('utf-8')
-        return json.loads(raw)
+        return request_payload
 
     def _parse_response(
         self,
@@ -164,6 +157,113 @@ class GPTTTSSynthesizer:
         return self.default_voice
 
 
+class GPTTTSSynthesizer(_GPTTTSClient):
+    """Calls a GPT-5 TTS microservice to generate narration audio."""
+
+    def __init__(
+        self,
+        endpoint: str,
+        api_key: str,
+        *,
+        timeout_seconds: float = 15.0,
+        max_attempts: int = 2,
+        default_voice: Optional[str] = None,
+        voice_overrides: Optional[Dict[str, str]] = None,
+        transport: Optional[HTTPTransport] = None,
+    ) -> None:
+        super().__init__(
+            endpoint,
+            api_key,
+            timeout_seconds=timeout_seconds,
+            max_attempts=max_attempts,
+            default_voice=default_voice,
+            voice_overrides=voice_overrides,
+        )
+        self.transport = transport or get_transport()
+
+    def synthesize(
+        self,
+        items: Iterable[TTSRequestItem],
+        *,
+        locale: str,
+        base_locale: str,
+        poi_id: str,
+    ) -> Optional[TTSSynthesis]:
+        request_payload = self._build_request(items, locale=locale, base_locale=base_locale, poi_id=poi_id)
+        if request_payload is None:
+            return None
+
+        try:
+            response_data = self._call_service(request_payload)
+        except TransportError as error:
+            logger.warning('TTS request failed after %s attempts: %s', self.max_attempts, error)
+            return None
+        return self._parse_response(locale, response_data, fallback_voice=request_payload.get('voice'))
+
+    def _call_service(self, payload: Dict[str, object]) -> Dict[str, object]:
+        return self.transport.post_json(
+            self.endpoint,
+            payload,
+            headers=bearer_headers(self.api_key),
+            timeout=self.timeout_seconds,
+            max_attempts=self.max_attempts,
+        )
+
+
+class AsyncGPTTTSSynthesizer(_GPTTTSClient):
+    """Async GPT-5 TTS client; uses the running loop's shared transport unless one is given."""
+
+    def __init__(
+        self,
+        endpoint: str,
+        api_key: str,
+        *,
+        timeout_seconds: float = 15.0,
+        max_attempts: int = 2,
+        default_voice: Optional[str] = None,
+        voice_overrides: Optional[Dict[str, str]] = None,
+        transport: Optional[AsyncHTTPTransport] = None,
+    ) -> None:
+        super().__init__(
+            endpoint,
+            api_key,
+            timeout_seconds=timeout_seconds,
+            max_attempts=max_attempts,
+            default_voice=default_voice,
+            voice_overrides=voice_overrides,
+        )
+        self._transport = transport
+
+    @property
+    def transport(self) -> AsyncHTTPTransport:
+        return self._transport or get_async_transport()
+
+    async def synthesize(
+        self,
+        items: Iterable[TTSRequestItem],
+        *,
+        locale: str,
+        base_locale: str,
+        poi_id: str,
+    ) -> Optional[TTSSynthesis]:
+        request_payload = self._build_request(items, locale=locale, base_locale=base_locale, poi_id=poi_id)
+        if request_payload is None:
+            return None
+
+        try:
+            response_data = await self.transport.post_json(
+                self.endpoint,
+                request_payload,
+                headers=bearer_headers(self.api_key),
+                timeout=self.timeout_seconds,
+                max_attempts=self.max_attempts,
+            )
+        except TransportError as error:
+            logger.warning('TTS request failed after %s attempts: %s', self.max_attempts, error)
+            return None
+        return self._parse_response(locale, response_data, fallback_voice=request_payload.get('voice'))
+
+
 def _load_voice_overrides(options: Dict[str, object]) -> Dict[str, str]:
     overrides: Dict[str, str] = {}
     provided = options.get('voice_overrides')
@@ -218,11 +318,38 @@ def create_tts_synthesizer(
     return StaticTTSSynthesizer()
 
 
+def create_async_tts_synthesizer(
+    provider: Optional[str] = None,
+    options: Optional[Dict[str, object]] = None,
+) -> Optional[AsyncTTSSynthesizer]:
+    """Async counterpart of :func:`create_tts_synthesizer`."""
+
+    synthesizer = create_tts_synthesizer(provider, options)
+    if synthesizer is None:
+        return None
+    if isinstance(synthesizer, GPTTTSSynthesizer):
+        return AsyncGPTTTSSynthesizer(
+            synthesizer.endpoint,
+            synthesizer.api_key,
+            timeout_seconds=synthesizer.timeout_seconds,
+            max_attempts=synthesizer.max_attempts,
+            default_voice=synthesizer.default_voice,
+            voice_overrides=synthesizer.voice_overrides,
+        )
+
+    from .async_support import to_async
+
+    return to_async(synthesizer)
+
+
 __all__ = [
     'TTSRequestItem',
     'TTSSynthesis',
     'TTSSynthesizer',
     'StaticTTSSynthesizer',
     'GPTTTSSynthesizer',
+    'AsyncTTSSynthesizer',
+    'AsyncGPTTTSSynthesizer',
     'create_tts_synthesizer',
+    'create_async_tts_synthesizer',
 ]
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+import hashlib
 import json
 from dataclasses import asdict, dataclass, field
-from typing import Any, Dict, Iterable, List, Optional
-from urllib import error, request
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 from .models import Asset, HighlightFrame, HighlightNarrative
+from .transport import HTTPTransport, TransportError, bearer_headers, get_transport
 
 
 class CreatomateError(RuntimeError):
@@ -63,60 +64,135 @@ class StoryboardSegment:
     metrics: Dict[str, Any]
     subtitles: Dict[str, str] = field(default_factory=dict)
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Every field assignment bumps the version, which retires the cached serialization.
+        object.__setattr__(self, name, value)
+        object.__setattr__(self, '_version', getattr(self, '_version', 0) + 1)
+
 
 @dataclass
 class Storyboard:
+    """Storyboard with a cached serialized view.
+
+    ``to_dict()`` builds the POI, narrative and per-segment sections once and returns
+    plain copies of them, so the manifest, storage and CLI output skip the dataclass
+    conversion and callers may mutate what they get. Assigning a segment field, or
+    ``poi``/``narrative``, refreshes the affected section automatically; in-place edits
+    of a segment's frame, the POI or the narrative still need ``invalidate``.
+    """
+
     poi: PoiContext
     narrative: HighlightNarrative
     segments: List[StoryboardSegment]
+    _view: Dict[str, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name in ('poi', 'narrative') and '_view' in self.__dict__:
+            self._view.pop(name, None)
 
     def to_dict(self) -> Dict[str, Any]:
+        view = self._view
+        poi = view.get('poi')
+        if poi is None:
+            poi = view['poi'] = self._poi_dict()
+        narrative = view.get('narrative')
+        if narrative is None:
+            narrative = view['narrative'] = self._narrative_dict()
+
+        # Keyed by identity so reordered or replaced segments never reuse a stale entry.
+        cached: Dict[int, Tuple[StoryboardSegment, int, Dict[str, Any]]] = view.setdefault('segments', {})
+        segments: List[Dict[str, Any]] = []
+        live: Dict[int, Tuple[StoryboardSegment, int, Dict[str, Any]]] = {}
+        for segment in self.segments:
+            entry = cached.get(id(segment))
+            version = getattr(segment, '_version', 0)
+            if entry is None or entry[0] is not segment or entry[1] != version:
+                entry = (segment, version, _segment_dict(segment))
+            live[id(segment)] = entry
+            segments.append(_plain_copy(entry[2]))
+        view['segments'] = live
+
+        return {'poi': _plain_copy(poi), 'narrative': _plain_copy(narrative), 'segments': segments}
+
+    def invalidate(self, *parts: Union[str, StoryboardSegment]) -> None:
+        """Drops cached sections: ``'poi'``, ``'narrative'`` or specific segments.
+
+        Called without arguments it drops the whole view.
+        """
+
+        if not parts:
+            self._view.clear()
+            return
+        for part in parts:
+            if isinstance(part, StoryboardSegment):
+                self._view.get('segments', {}).pop(id(part), None)
+            else:
+                self._view.pop(part, None)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Copies and pickles start without the cache; a deep copy is usually mutated next.
+        state = self.__dict__.copy()
+        state['_view'] = {}
+        return state
+
+    def _poi_dict(self) -> Dict[str, Any]:
         return {
-            'poi': {
-                'id': self.poi.id,
-                'name': self.poi.name,
-                'locale': self.poi.locale,
-                'distance': self.poi.distance,
-                'hours': self.poi.hours,
-                'tags': self.poi.tags,
-                'metadata': self.poi.metadata,
+            'id': self.poi.id,
+            'name': self.poi.name,
+            'locale': self.poi.locale,
+            'distance': self.poi.distance,
+            'hours': self.poi.hours,
+            'tags': self.poi.tags,
+            'metadata': self.poi.metadata,
+        }
+
+    def _narrative_dict(self) -> Dict[str, Any]:
+        return {
+            'summary': self.narrative.summary,
+            'language': self.narrative.language,
+            'asset_ids': list(self.narrative.asset_ids),
+            'rationale': list(self.narrative.rationale),
+            'codexierge_locales': list(self.narrative.codexierge.keys()),
+            'narrations': {
+                locale: asdict(narration)
+                for locale, narration in self.narrative.narrations.items()
             },
-            'narrative': {
-                'summary': self.narrative.summary,
-                'language': self.narrative.language,
-                'asset_ids': list(self.narrative.asset_ids),
-                'rationale': list(self.narrative.rationale),
-                'codexierge_locales': list(self.narrative.codexierge.keys()),
-                'narrations': {
-                    locale: asdict(narration)
-                    for locale, narration in self.narrative.narrations.items()
-                },
-                'translations': self.narrative.translations,
-                'accessibility': {
-                    locale: asdict(assets)
-                    for locale, assets in self.narrative.accessibility.items()
-                },
+            'translations': self.narrative.translations,
+            'accessibility': {
+                locale: asdict(assets)
+                for locale, assets in self.narrative.accessibility.items()
             },
-            'segments': [
-                {
-                    'asset_id': segment.asset_id,
-                    'asset_url': segment.asset_url,
-                    'source': segment.source,
-                    'tags': segment.tags,
-                    'duration': segment.duration,
-                    'caption': segment.caption,
-                    'script_title': segment.script_title,
-                    'script_content': segment.script_content,
-                    'frame': asdict(segment.frame) if segment.frame else None,
-                    'rationale': segment.rationale,
-                    'metrics': segment.metrics,
-                    'subtitles': segment.subtitles,
-                }
-                for segment in self.segments
-            ],
         }
 
 
+def _plain_copy(value: Any) -> Any:
+    """Copies nested dicts and lists (the only containers in a serialized view)."""
+
+    if isinstance(value, dict):
+        return {key: _plain_copy(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_plain_copy(item) for item in value]
+    return value
+
+
+def _segment_dict(segment: StoryboardSegment) -> Dict[str, Any]:
+    return {
+        'asset_id': segment.asset_id,
+        'asset_url': segment.asset_url,
+        'source': segment.source,
+        'tags': segment.tags,
+        'duration': segment.duration,
+        'caption': segment.caption,
+        'script_title': segment.script_title,
+        'script_content': segment.script_content,
+        'frame': asdict(segment.frame) if segment.frame else None,
+        'rationale': segment.rationale,
+        'metrics': segment.metrics,
+        'subtitles': segment.subtitles,
+    }
+
+
 class CreatomateRenderer:
     """Builds Creatomate render payloads from highlight narratives."""
 
@@ -127,11 +203,13 @@ class CreatomateRenderer:
         *,
         base_url: str = 'https://api.creatomate.com/v2',
         timeout: float = 30.0,
+        transport: Optional[HTTPTransport] = None,
     ) -> None:
         self.config = config
         self.api_key = api_key
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
+        self.transport = transport or get_transport()
 
     def build_storyboard(
         self,
@@ -236,11 +314,12 @@ class CreatomateRenderer:
     def create_manifest(self, storyboard: Storyboard, render_payload: Dict[str, Any]) -> Dict[str, Any]:
         """Produces a machine-readable manifest for downstream analytics."""
 
+        serialized = storyboard.to_dict()
         return {
             'provider': 'creatomate',
-            'poi': storyboard.to_dict()['poi'],
-            'narrative': storyboard.to_dict()['narrative'],
-            'segments': storyboard.to_dict()['segments'],
+            'poi': serialized['poi'],
+            'narrative': serialized['narrative'],
+            'segments': serialized['segments'],
             'render_payload': render_payload,
             'accessibility': {
                 'locales': list(storyboard.narrative.accessibility.keys()) or [storyboard.narrative.language],
@@ -265,6 +344,16 @@ class CreatomateRenderer:
             'provenance': storyboard.narrative.provenance,
         }
 
+    def fingerprint(self, payload: Dict[str, Any], *, locales: Optional[Iterable[str]] = None) -> str:
+        """Canonical hash of a render payload plus this renderer's config.
+
+        Key order and whitespace do not change the hash, so byte-identical renders of the
+        same storyboard share a fingerprint across runs. ``locales`` (the set the render is
+        localized into) join the hash without touching the payload sent to Creatomate.
+        """
+
+        return render_fingerprint(payload, self.config, locales=locales)
+
     def render(self, payload: Dict[str, Any], *, execute: bool = False) -> Dict[str, Any]:
         """Posts the payload to Creatomate when execute=True; otherwise returns a dry-run stub."""
 
@@ -275,25 +364,62 @@ class CreatomateRenderer:
             raise CreatomateError('Creatomate API key is required when execute=True')
 
         endpoint = f'{self.base_url}/renders'
-        body = json.dumps(payload).encode('utf-8')
 
-        req = request.Request(endpoint, data=body, method='POST')
-        req.add_header('Content-Type', 'application/json')
-        req.add_header('Authorization', f'Bearer {self.api_key.strip()}')
+        try:
+            # Render submissions are not idempotent, so they are never retried.
+            return self.transport.post_json(
+                endpoint,
+                payload,
+                headers=bearer_headers(self.api_key.strip()),
+                timeout=self.timeout,
+                max_attempts=1,
+            )
+        except TransportError as exc:
+            raise _creatomate_error(exc) from exc
+
+    def fetch_render(self, render_id: str) -> Dict[str, Any]:
+        """Reads the current state of a submitted render (safe to retry)."""
+
+        if not self.api_key:
+            raise CreatomateError('Creatomate API key is required to poll renders')
 
         try:
-            with request.urlopen(req, timeout=self.timeout) as response:
-                data = response.read().decode('utf-8')
-                return json.loads(data)
-        except error.HTTPError as exc:
-            details = exc.read().decode('utf-8') if exc.fp else None
-            raise CreatomateError(
-                f'Creatomate API error ({exc.code}): {details or exc.reason}',
-                status=exc.code,
-                details=details,
-            ) from exc
-        except error.URLError as exc:
-            raise CreatomateError('Failed to reach Creatomate API', details=str(exc)) from exc
+            return self.transport.get_json(
+                f'{self.base_url}/renders/{render_id}',
+                headers=bearer_headers(self.api_key.strip()),
+                timeout=self.timeout,
+            )
+        except TransportError as exc:
+            raise _creatomate_error(exc) from exc
+
+
+def render_fingerprint(
+    payload: Dict[str, Any],
+    config: CreatomateRenderConfig,
+    *,
+    locales: Optional[Iterable[str]] = None,
+) -> str:
+    document: Dict[str, Any] = {'payload': payload, 'config': asdict(config)}
+    if locales:
+        document['locales'] = sorted(set(locales))
+    canonical = json.dumps(
+        document,
+        sort_keys=True,
+        separators=(',', ':'),
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def _creatomate_error(exc: TransportError) -> CreatomateError:
+    if exc.status is not None and exc.status >= 400:
+        return CreatomateError(
+            f'Creatomate API error ({exc.status}): {exc.body or exc}',
+            status=exc.status,
+            details=exc.body,
+        )
+    return CreatomateError('Failed to reach Creatomate API', details=str(exc))
 
 
 __all__ = [
@@ -303,4 +429,5 @@ __all__ = [
     'PoiContext',
     'Storyboard',
     'StoryboardSegment',
+    'render_fingerprint',
 ]
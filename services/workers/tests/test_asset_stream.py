@@ -0,0 +1,62 @@
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+
+from context_workers.asset_stream import iter_asset_records, iter_assets
+from context_workers.cli import main
+
+FIXTURE = Path(__file__).resolve().parents[1] / 'fixtures' / 'sample_assets.json'
+
+
+def fixture_records():
+    return json.loads(FIXTURE.read_text())
+
+
+@pytest.mark.parametrize('use_mmap', [False, True])
+@pytest.mark.parametrize('chunk_size', [1, 7, 1 << 16])
+def test_streams_json_array_and_ndjson_across_chunk_boundaries(tmp_path: Path, use_mmap, chunk_size):
+    records = fixture_records()
+    ndjson = tmp_path / 'assets.ndjson'
+    ndjson.write_text('\n'.join(json.dumps(record) for record in records) + '\n\n')
+
+    assert list(iter_asset_records(FIXTURE, use_mmap=use_mmap, chunk_size=chunk_size)) == records
+    assert list(iter_asset_records(ndjson, use_mmap=use_mmap, chunk_size=chunk_size)) == records
+
+
+def test_streams_compressed_inputs(tmp_path: Path):
+    records = fixture_records()
+    gz_path = tmp_path / 'assets.json.gz'
+    gz_path.write_bytes(gzip.compress(FIXTURE.read_bytes()))
+    assert [asset.id for asset in iter_assets(gz_path, use_mmap=True)] == [record['id'] for record in records]
+
+    zstandard = pytest.importorskip('zstandard')
+    zst_path = tmp_path / 'assets.ndjson.zst'
+    payload = '\n'.join(json.dumps(record) for record in records).encode()
+    zst_path.write_bytes(zstandard.ZstdCompressor().compress(payload))
+    assert [asset.id for asset in iter_assets(zst_path)] == [record['id'] for record in records]
+
+
+def test_stream_is_lazy_and_rejects_truncated_arrays(tmp_path: Path):
+    truncated = tmp_path / 'truncated.json'
+    truncated.write_text('[{"id": "a", "source": "x", "url": "u"}, {"id": "b", "sou')
+
+    stream = iter_assets(truncated, chunk_size=8)
+    assert next(stream).id == 'a'
+    with pytest.raises(ValueError):
+        next(stream)
+
+    empty = tmp_path / 'empty.json'
+    empty.write_text('')
+    assert list(iter_assets(empty, use_mmap=True)) == []
+
+
+def test_cli_accepts_gzipped_ndjson_input(tmp_path: Path, capsys):
+    ndjson = tmp_path / 'assets.ndjson.gz'
+    ndjson.write_bytes(gzip.compress('\n'.join(json.dumps(record) for record in fixture_records()).encode()))
+
+    main(['demo', '--input', str(ndjson), '--frame-sample-size', '2', '--top-k', '2', '--mmap-input'])
+    payload = json.loads(capsys.readouterr().out)
+    assert len(payload['decisions']) == len(fixture_records())
+    assert len(payload['narrative']['frames']) == 2
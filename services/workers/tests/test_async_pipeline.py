@@ -0,0 +1,163 @@
+import asyncio
+import copy
+import json
+import time
+from pathlib import Path
+
+import httpx
+
+from context_workers.accessibility import StaticAccessibilityGenerator
+from context_workers.async_pipeline import AsyncPipelineProviders, run_pipeline_async
+from context_workers.async_support import AsyncProviderAdapter, AsyncRunner, SyncProviderAdapter, to_async, to_sync
+from context_workers.cli import load_assets
+from context_workers.localization import generate_accessibility_assets, generate_voiceovers_and_subtitles
+from context_workers.narrative import StaticScriptGenerator
+from context_workers.scene_labelling import KeywordSceneLabeler
+from context_workers.summarization import StaticSummarizer
+from context_workers.translation import AsyncGPTTranslator, StaticTranslator, TranslationItem
+from context_workers.transport import AsyncHTTPTransport
+from context_workers.video_assembly import CreatomateRenderConfig, CreatomateRenderer, PoiContext
+
+FIXTURE = Path(__file__).resolve().parents[1] / 'fixtures' / 'sample_assets.json'
+
+
+def static_providers():
+    return AsyncPipelineProviders(
+        summarizer=to_async(StaticSummarizer()),
+        script_generator=to_async(StaticScriptGenerator()),
+        translator=to_async(StaticTranslator()),
+        tts_generator=None,
+        accessibility_generator=to_async(StaticAccessibilityGenerator()),
+        labeler=KeywordSceneLabeler({'celebration': ['fans', 'goal']}),
+        renderer=CreatomateRenderer(CreatomateRenderConfig(template_id='tmpl-123')),
+    )
+
+
+def test_adapters_wrap_and_unwrap_providers():
+    translator = StaticTranslator()
+    async_translator = to_async(translator)
+    assert isinstance(async_translator, AsyncProviderAdapter)
+    assert to_async(async_translator) is async_translator
+    assert to_sync(async_translator) is translator
+
+    items = [TranslationItem('greeting', 'Hello')]
+    result = asyncio.run(async_translator.translate(items, 'fr', source_locale='en'))
+    assert result == {'greeting': '[fr] Hello'}
+
+    class NativeAsyncTranslator:
+        async def translate(self, items, target_locale, *, source_locale):
+            await asyncio.sleep(0)
+            return {item.key: item.text.upper() for item in items}
+
+    runner = AsyncRunner()
+    try:
+        sync_translator = to_sync(NativeAsyncTranslator(), runner=runner)
+        assert isinstance(sync_translator, SyncProviderAdapter)
+        assert sync_translator.translate(items, 'fr', source_locale='en') == {'greeting': 'HELLO'}
+
+        async def from_running_loop():
+            return sync_translator.translate(items, 'fr', source_locale='en')
+
+        # The runner owns its own loop, so sync calls still work inside a running loop.
+        assert asyncio.run(from_running_loop()) == {'greeting': 'HELLO'}
+    finally:
+        runner.close()
+
+
+def test_async_gpt_translator_retries_only_missing_keys():
+    requests = []
+
+    def handler(request):
+        body = json.loads(request.content)
+        requests.append([entry['id'] for entry in body['items']])
+        translated = [
+            {'id': entry['id'], 'text': f"fr:{entry['text']}"}
+            for entry in body['items']
+            if len(requests) > 2 or entry['id'] != 'b'
+        ]
+        return httpx.Response(200, json={'translations': translated})
+
+    async def scenario():
+        async def no_sleep(seconds):
+            return None
+
+        transport = AsyncHTTPTransport(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)), sleep=no_sleep)
+        translator = AsyncGPTTranslator(
+            'https://gpt.example.com/translate',
+            'key',
+            max_chunk_items=2,
+            max_attempts=2,
+            transport=transport,
+        )
+        items = [TranslationItem(key, key * 3) for key in ('a', 'b', 'c')]
+        try:
+            return await translator.translate(items, 'fr', source_locale='en')
+        finally:
+            await transport.aclose()
+
+    result = asyncio.run(scenario())
+    assert result == {'a': 'fr:aaa', 'b': 'fr:bbb', 'c': 'fr:ccc'}
+    assert sorted(requests[:2]) == [['a', 'b'], ['c']]
+    assert requests[2:] == [['b']]
+
+
+def test_run_pipeline_async_matches_sync_localization():
+    providers = static_providers()
+    poi = PoiContext(id='poi-felix', name='Felix Rooftop')
+    result = asyncio.run(
+        run_pipeline_async(load_assets(FIXTURE), providers=providers, poi=poi, locales=['en', 'es', 'fr'], frame_sample_size=2)
+    )
+
+    sync_storyboard = copy.deepcopy(result.storyboard)
+    expected = generate_voiceovers_and_subtitles(
+        sync_storyboard,
+        ['en', 'es', 'fr'],
+        audio_prefix=None,
+        translator=StaticTranslator(),
+    )
+    expected_access = generate_accessibility_assets(
+        sync_storyboard,
+        ['en', 'es', 'fr'],
+        generator=StaticAccessibilityGenerator(),
+    )
+
+    assert list(result.narrations) == ['en', 'es', 'fr']
+    assert {locale: narration.subtitles for locale, narration in result.narrations.items()} == {
+        locale: narration.subtitles for locale, narration in expected.items()
+    }
+    assert result.accessibility == expected_access
+    assert result.decisions
+
+
+def test_run_pipeline_async_overlaps_locale_provider_io():
+    delay = 0.05
+
+    class SlowTranslator:
+        async def translate(self, items, target_locale, *, source_locale):
+            await asyncio.sleep(delay)
+            return {item.key: f'[{target_locale}] {item.text}' for item in items}
+
+    class SlowAccessibility:
+        async def generate(self, items, *, target_locale):
+            await asyncio.sleep(delay)
+            return {}
+
+    providers = static_providers()
+    providers.translator = SlowTranslator()
+    providers.accessibility_generator = SlowAccessibility()
+
+    started = time.perf_counter()
+    result = asyncio.run(
+        run_pipeline_async(
+            load_assets(FIXTURE),
+            providers=providers,
+            poi=PoiContext(id='poi-1', name='POI'),
+            locales=['en', 'es', 'fr', 'de'],
+        )
+    )
+    elapsed = time.perf_counter() - started
+
+    assert result.poi_id == 'poi-1'
+    assert result.accessibility['fr'].captions
+    # 4 locales x (translate + accessibility) sequentially would take ~0.4s.
+    assert elapsed < 6 * delay
@@ -97,3 +97,240 @@ def test_cli_remotion_media_dir_overrides(tmp_path: Path, monkeypatch, capsys):
     payload = json.loads(capsys.readouterr().out)
     media_urls = [seg['mediaUrl'] for seg in payload['remotionProps']['segments']]
     assert all(url.startswith('static://') for url in media_urls)
+
+
+def test_cli_batch_reuses_providers_and_emits_json_lines(tmp_path: Path, monkeypatch, capsys):
+    import context_workers.cli as cli
+
+    monkeypatch.chdir(Path(__file__).resolve().parents[1])
+    fixture = Path('fixtures/sample_assets.json').resolve()
+    manifest_path = tmp_path / 'pois.jsonl'
+    manifest_path.write_text('\n'.join([
+        json.dumps({'id': 'poi-mercado', 'name': 'Mercado', 'tags': ['food'], 'input': str(fixture), 'asset_filter': {'tags': ['mercado']}}),
+        json.dumps({'id': 'poi-liberty', 'name': 'Liberty', 'tags': 'soccer,fans', 'input': str(fixture), 'asset_filter': {'ids': ['asset-2']}}),
+        json.dumps({'id': 'poi-empty', 'input': str(fixture), 'asset_filter': {'sources': ['youtube']}}),
+        json.dumps({'name': 'No id', 'input': str(fixture)}),
+        json.dumps({'id': 'poi-mercado', 'input': str(fixture)}),
+    ]))
+
+    calls = {'translator': 0}
+    original_create_translator = cli.create_translator
+
+    def counting_create_translator(*args, **kwargs):
+        calls['translator'] += 1
+        return original_create_translator(*args, **kwargs)
+
+    monkeypatch.setattr(cli, 'create_translator', counting_create_translator)
+
+    main([
+        'batch',
+        '--manifest', str(manifest_path),
+        '--frame-sample-size', '2',
+        '--storage-output-dir', str(tmp_path / 'renders'),
+        '--voiceover-locales', 'en,es',
+    ])
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines() if line.strip()]
+
+    assert calls['translator'] == 1
+    assert [line['poi_id'] for line in lines] == ['poi-mercado', 'poi-liberty', 'poi-empty', None, 'poi-mercado']
+    assert lines[0]['status'] == 'ok'
+    assert lines[0]['storyboard']['narrative']['asset_ids'] == ['asset-1']
+    assert lines[1]['render_payload']['metadata']['poi_id'] == 'poi-liberty'
+    assert lines[1]['storyboard']['poi']['tags'] == ['soccer', 'fans']
+    assert (tmp_path / 'renders' / 'poi-liberty').exists()
+    assert lines[2]['status'] == 'error'
+    assert 'At least one asset' in lines[2]['error']
+    assert lines[3] == {'poi_id': None, 'entry': 4, 'status': 'error', 'error': 'Batch entry has no "id"'}
+    assert lines[4]['status'] == 'error' and lines[4]['entry'] == 5
+    assert not list((tmp_path / 'renders').glob('poi-demo*'))
+
+
+
+def test_cli_batch_streams_input_like_single_poi_runs(tmp_path: Path, monkeypatch, capsys):
+    import context_workers.cli as cli
+
+    fixture = (Path(__file__).resolve().parents[1] / 'fixtures' / 'sample_assets.json').resolve()
+    manifest_path = tmp_path / 'pois.jsonl'
+    manifest_path.write_text('\n'.join([
+        json.dumps({'id': 'poi-a', 'input': str(fixture)}),
+        json.dumps({'id': 'poi-b', 'input': str(fixture), 'asset_filter': {'ids': ['asset-2']}}),
+    ]))
+
+    opened = []
+    original_iter_assets = cli.iter_assets
+
+    def recording_iter_assets(path, **kwargs):
+        opened.append((path, kwargs))
+        return original_iter_assets(path, **kwargs)
+
+    monkeypatch.setattr(cli, 'iter_assets', recording_iter_assets)
+
+    main([
+        'batch',
+        '--manifest', str(manifest_path),
+        '--frame-sample-size', '2',
+        '--storage-output-dir', str(tmp_path / 'renders'),
+        '--mmap-input',
+        '--top-k', '2',
+    ])
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines() if line.strip()]
+
+    assert opened == [(fixture, {'use_mmap': True, 'compact': True})]
+    assert [line['status'] for line in lines] == ['ok', 'ok']
+    assert len(lines[0]['storyboard']['segments']) == 2
+    assert lines[1]['storyboard']['narrative']['asset_ids'] == ['asset-2']
+
+
+def test_cli_render_skips_identical_executed_render(tmp_path: Path, monkeypatch, capsys):
+    from context_workers.video_assembly import CreatomateRenderer
+
+    monkeypatch.chdir(Path(__file__).resolve().parents[1])
+    submissions = []
+
+    def fake_render(self, payload, *, execute=False):
+        submissions.append(payload)
+        return {'id': f'cm-{len(submissions)}', 'status': 'succeeded', 'url': 'https://cdn.creatomate.test/cm.mp4'}
+
+    monkeypatch.setattr(CreatomateRenderer, 'render', fake_render)
+    argv = [
+        'render',
+        '--input', 'fixtures/sample_assets.json',
+        '--poi-id', 'poi-felix',
+        '--creatomate-template-id', 'tmpl-123',
+        '--creatomate-api-key', 'key',
+        '--creatomate-execute',
+        '--storage-output-dir', str(tmp_path / 'renders'),
+    ]
+
+    main(argv)
+    first = json.loads(capsys.readouterr().out)
+    main(argv)
+    second = json.loads(capsys.readouterr().out)
+
+    assert len(submissions) == 1
+    assert second['render_response']['status'] == 'reused'
+    assert second['render_response']['fingerprint'] == first['storage']['metadata']['fingerprint']
+    assert second['storage']['render_id'] == first['storage']['render_id'] == 'cm-1'
+
+    assert second['storyboard']['narrative']['narrations'] == first['storyboard']['narrative']['narrations']
+
+    main([*argv, '--creatomate-clip-duration', '3'])
+    capsys.readouterr()
+    main([*argv, '--force-render'])
+    capsys.readouterr()
+    assert len(submissions) == 3
+
+    # Another locale set stores different narrations, so it is a different render.
+    main([*argv, '--voiceover-locales', 'en,fr'])
+    assert json.loads(capsys.readouterr().out)['render_response']['status'] == 'succeeded'
+    assert len(submissions) == 4
+    assert submissions[-1] == submissions[0]  # the locale set only changes the fingerprint
+
+
+def test_cli_render_does_not_reuse_unfinished_renders(tmp_path: Path, monkeypatch, capsys):
+    from context_workers.video_assembly import CreatomateRenderer
+
+    monkeypatch.chdir(Path(__file__).resolve().parents[1])
+    submissions = []
+
+    def fake_render(self, payload, *, execute=False):
+        submissions.append(payload)
+        return {'id': f'cm-{len(submissions)}', 'status': 'failed', 'error_message': 'template error'}
+
+    monkeypatch.setattr(CreatomateRenderer, 'render', fake_render)
+    argv = [
+        'render',
+        '--input', 'fixtures/sample_assets.json',
+        '--poi-id', 'poi-felix',
+        '--creatomate-template-id', 'tmpl-123',
+        '--creatomate-api-key', 'key',
+        '--creatomate-execute',
+        '--storage-output-dir', str(tmp_path / 'renders'),
+    ]
+
+    main(argv)
+    main(argv)
+    capsys.readouterr()
+    assert len(submissions) == 2
+
+def build_localization_storyboard():
+    from context_workers.models import Asset, HighlightFrame, HighlightNarrative, NarrativeScript, ScriptBeat
+    from context_workers.video_assembly import CreatomateRenderConfig, CreatomateRenderer, PoiContext
+
+    narrative = HighlightNarrative(
+        asset_ids=['asset-1', 'asset-2'],
+        summary='Electric energy on the Hudson.',
+        frames=[
+            HighlightFrame(image_url='https://cdn.example.com/1.jpg', caption='Opening whistle vibes'),
+            HighlightFrame(image_url='https://cdn.example.com/2.jpg', caption='Halftime fireworks'),
+        ],
+        rationale=['Pre-match rally.', 'Halftime show.'],
+        language='en',
+        script=NarrativeScript(beats=[
+            ScriptBeat(id='b1', title='Kickoff', content='Fans gather ahead of kickoff.'),
+            ScriptBeat(id='b2', title='Halftime', content='Crowd surges toward the fan fest.'),
+        ]),
+    )
+    assets = [
+        Asset(id='asset-1', source='instagram', url='https://social.example.com/1.mp4', caption='Drums'),
+        Asset(id='asset-2', source='tiktok', url='https://social.example.com/2.mp4', caption='Fireworks'),
+    ]
+    renderer = CreatomateRenderer(CreatomateRenderConfig(template_id='tmpl-123'))
+    return renderer.build_storyboard(narrative, assets, PoiContext(id='poi-felix', name='Felix Rooftop'))
+
+
+def test_generate_voiceovers_runs_locales_concurrently_and_merges_in_order():
+    import threading
+    import time
+
+    from context_workers.cli import generate_voiceovers_and_subtitles
+    from context_workers.tts import TTSSynthesis
+
+    lock = threading.Lock()
+    state = {'active': 0, 'peak': 0}
+
+    class SlowTranslator:
+        def translate(self, items, target_locale, *, source_locale):
+            with lock:
+                state['active'] += 1
+                state['peak'] = max(state['peak'], state['active'])
+            time.sleep(0.05)
+            with lock:
+                state['active'] -= 1
+            return {item.key: f'{target_locale}:{item.text}' for item in items}
+
+    class RecordingTTS:
+        def synthesize(self, items, *, locale, base_locale, poi_id):
+            return TTSSynthesis(locale=locale, audio_url=f'https://cdn/{poi_id}-{locale}.mp3', voice=f'voice-{locale}')
+
+    storyboard = build_localization_storyboard()
+    narrations = generate_voiceovers_and_subtitles(
+        storyboard,
+        ['en', 'fr', 'es', 'de', 'fr'],
+        audio_prefix=None,
+        translator=SlowTranslator(),
+        tts_generator=RecordingTTS(),
+        max_workers=4,
+    )
+
+    assert list(narrations) == ['en', 'fr', 'es', 'de']
+    assert state['peak'] > 1
+    assert narrations['de'].audio_url == 'https://cdn/poi-felix-de.mp3'
+    assert storyboard.segments[0].subtitles['fr'] == 'fr:Fans gather ahead of kickoff.'
+    assert storyboard.segments[1].frame.subtitles['es'] == 'es:Crowd surges toward the fan fest.'
+    assert storyboard.segments[0].subtitles['en'] == 'Fans gather ahead of kickoff.'
+    timings = storyboard.narrative.provenance['localization_timings']
+    assert set(timings) == {'en', 'fr', 'es', 'de'}
+    assert timings['fr']['translation_ms'] >= 40
+
+
+def test_cli_demo_top_k_keeps_decision_log(monkeypatch, capsys):
+    monkeypatch.chdir(Path(__file__).resolve().parents[1])
+    fixture = Path('fixtures/sample_assets.json')
+    main(['demo', '--input', str(fixture), '--frame-sample-size', '2', '--top-k', '2'])
+    payload = json.loads(capsys.readouterr().out)
+
+    all_assets = json.loads(fixture.read_text())
+    assert len(payload['decisions']) == len(all_assets)
+    assert len(payload['narrative']['frames']) == 2
+    assert len(payload['remotionProps']['segments']) == 2
@@ -0,0 +1,78 @@
+import random
+
+import pytest
+
+pytest.importorskip('numpy')
+
+from context_workers.columnar import AssetTable, filter_assets_columnar, rank_assets_columnar
+from context_workers.filtering import filter_assets, rank_assets
+from context_workers.models import Asset, FilterRules
+
+
+def random_assets(count: int, seed: int = 7):
+    rng = random.Random(seed)
+    labels = ['explicit', 'Violence', 'spam', 'sports', 'EXPLICIT']
+    languages = [None, '', 'en', 'es', 'fr']
+    assets = []
+    for index in range(count):
+        assets.append(
+            Asset(
+                id=f'asset-{index}',
+                source='instagram',
+                url=f'https://example.com/{index}.jpg',
+                language=rng.choice(languages),
+                is_flagged=rng.random() < 0.1,
+                moderation_labels=rng.sample(labels, rng.randint(0, 2)),
+                metrics={
+                    'views': rng.randint(0, 1000),
+                    # Small ranges force score ties so ordering stability is exercised.
+                    'likes': rng.randint(0, 10),
+                    'comments': rng.randint(0, 5),
+                    'shares': rng.randint(0, 3),
+                },
+                extra={'timestamp_score': rng.choice([0, 0.5, 1])} if rng.random() < 0.8 else {},
+            )
+        )
+    return assets
+
+
+@pytest.mark.parametrize(
+    'rules',
+    [
+        FilterRules(),
+        FilterRules(min_engagement=5, locale_whitelist=['en', 'es']),
+        FilterRules(banned_labels=['SPAM'], min_engagement=0, locale_whitelist=['de']),
+    ],
+)
+def test_columnar_filter_and_rank_match_scalar_path(rules):
+    assets = random_assets(500)
+
+    expected_survivors, expected_decisions = filter_assets(assets, rules)
+    survivors, decisions = filter_assets_columnar(assets, rules)
+
+    assert decisions == expected_decisions
+    assert [asset.id for asset in survivors] == [asset.id for asset in expected_survivors]
+    assert [asset.id for asset in rank_assets_columnar(survivors)] == [asset.id for asset in rank_assets(expected_survivors)]
+
+
+def test_asset_table_interns_labels_and_handles_empty_input():
+    table = AssetTable.from_assets(
+        [
+            Asset(id='a', source='x', url='u', moderation_labels=['Explicit', 'spam']),
+            Asset(id='b', source='x', url='u'),
+        ]
+    )
+    assert table.label_vocabulary == {'explicit': 0, 'spam': 1}
+    assert table.label_ids.tolist() == [[0, 1], [-1, -1]]
+
+    assert filter_assets_columnar([]) == ([], [])
+    assert rank_assets_columnar([]) == []
+
+
+def test_columnar_top_k_matches_stable_ranking():
+    from context_workers.columnar import top_k_assets_columnar
+
+    assets = random_assets(300, seed=11)
+    ranked_ids = [asset.id for asset in rank_assets(assets)]
+    for k in (1, 3, 17, 300, 500):
+        assert [asset.id for asset in top_k_assets_columnar(assets, k)] == ranked_ids[:k]
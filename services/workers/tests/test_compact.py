@@ -0,0 +1,56 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from context_workers.compact import CompactAsset, compact_assets, expand_assets
+from context_workers.filtering import asset_score, filter_assets, rank_assets, select_top_assets
+from context_workers.models import FilterRules
+from context_workers.cli import load_assets
+
+FIXTURE = Path(__file__).resolve().parents[1] / 'fixtures' / 'sample_assets.json'
+
+
+def test_compact_assets_round_trip_and_intern_repeated_strings():
+    assets = load_assets(FIXTURE)
+    compact = list(compact_assets(assets))
+
+    assert expand_assets(compact) == assets
+    assert not hasattr(compact[0], '__dict__')
+    assert isinstance(compact[0].tags, tuple)
+
+    records = [json.loads(json.dumps({'id': str(index), 'source': 'insta' + 'gram', 'url': 'u'})) for index in range(2)]
+    first, second = (CompactAsset.from_record(record) for record in records)
+    assert first.source is second.source
+
+
+def test_compact_assets_filter_and_rank_like_assets():
+    assets = load_assets(FIXTURE)
+    compact = list(compact_assets(assets))
+
+    survivors, decisions = filter_assets(assets, FilterRules())
+    compact_survivors, compact_decisions = filter_assets(compact, FilterRules())
+    assert compact_decisions == decisions
+    assert [asset.id for asset in rank_assets(compact_survivors)] == [asset.id for asset in rank_assets(survivors)]
+
+    top, _ = select_top_assets(iter(compact), 2, FilterRules())
+    assert [asset.to_asset() for asset in top] == rank_assets(survivors)[:2]
+
+
+def test_compact_extra_is_read_only_and_scored_once():
+    record = {'id': 'a', 'source': 'x', 'url': 'u', 'extra': {'timestamp_score': 0.5}}
+    asset = CompactAsset.from_record(record)
+    assert asset._extra is record['extra']
+    assert asset.timestamp_score == 0.5
+    assert asset_score(asset) == 0.15
+    with pytest.raises(TypeError):
+        asset.extra['timestamp_score'] = 0.9
+
+    asset.extra = {'timestamp_score': 0.9}
+    assert asset.timestamp_score == 0.9
+    assert asset.to_asset().extra == {'timestamp_score': 0.9}
+
+    bare = CompactAsset(id='b', source='x', url='u')
+    assert bare._extra is None
+    assert bare.extra == {}
+    assert CompactAsset(id='c', source='x', url='u', extra='{"timestamp_score": 1}').timestamp_score == 1.0
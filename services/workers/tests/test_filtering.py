@@ -33,3 +33,28 @@ def test_filtering_blocks_moderation_and_low_engagement():
 
     ranked = rank_assets(survivors)
     assert ranked[0].id == 'safe'
+
+
+def test_top_k_streams_and_matches_full_ranking_with_ties():
+    from context_workers.filtering import select_top_assets, top_k_assets
+
+    assets = [
+        Asset(
+            id=f'asset-{index}',
+            source='instagram',
+            url=f'https://example.com/{index}.jpg',
+            metrics={'likes': 10 + index % 4, 'comments': 0, 'shares': 0},
+            extra={'timestamp_score': 0},
+            is_flagged=index % 7 == 0,
+        )
+        for index in range(40)
+    ]
+
+    ranked = rank_assets(assets)
+    assert [asset.id for asset in top_k_assets(iter(assets), 5)] == [asset.id for asset in ranked[:5]]
+    assert top_k_assets(assets, 0) == []
+
+    top, decisions = select_top_assets(iter(assets), 3, FilterRules())
+    survivors, expected_decisions = filter_assets(assets, FilterRules())
+    assert decisions == expected_decisions
+    assert [asset.id for asset in top] == [asset.id for asset in rank_assets(survivors)[:3]]
@@ -0,0 +1,138 @@
+import asyncio
+import json
+from pathlib import Path
+
+from context_workers.accessibility import AccessibilityFields
+from context_workers.async_support import to_async
+from context_workers.cli import load_assets
+from context_workers.extraction import build_highlight_narrative
+from context_workers.localization import (
+    PreviousLocalization,
+    generate_accessibility_assets,
+    generate_voiceovers_and_subtitles,
+    localize_storyboard_async,
+)
+from context_workers.models import ExtractionConfig
+from context_workers.tts import TTSSynthesis
+from context_workers.video_assembly import CreatomateRenderConfig, CreatomateRenderer, PoiContext
+
+FIXTURE = Path(__file__).resolve().parents[1] / 'fixtures' / 'sample_assets.json'
+
+
+class RecordingTranslator:
+    def __init__(self):
+        self.requested = []
+
+    def translate(self, items, target_locale, *, source_locale):
+        items = list(items)
+        self.requested.extend((target_locale, item.key) for item in items)
+        return {item.key: f'<{target_locale}> {item.text}' for item in items}
+
+
+class RecordingTTS:
+    def __init__(self):
+        self.calls = []
+
+    def synthesize(self, items, *, locale, base_locale, poi_id):
+        self.calls.append(locale)
+        return TTSSynthesis(locale=locale, audio_url=f'https://tts.example.com/{locale}-{len(self.calls)}.mp3', voice='nova')
+
+
+class RecordingAccessibility:
+    def __init__(self):
+        self.requested = []
+
+    def generate(self, items, *, target_locale):
+        items = list(items)
+        self.requested.extend((target_locale, item.id) for item in items)
+        return {
+            item.id: AccessibilityFields(
+                caption=f'<{target_locale}> {item.caption}',
+                audio_description=f'<{target_locale}> {item.clip_summary}',
+                haptic_cue='pulse',
+                alt_text=f'<{target_locale}> {item.clip_title}',
+            )
+            for item in items
+        }
+
+
+def build_storyboard():
+    assets = load_assets(FIXTURE)
+    narrative = build_highlight_narrative(assets, ExtractionConfig(frame_sample_size=3))
+    renderer = CreatomateRenderer(CreatomateRenderConfig(template_id='tmpl-123'))
+    return renderer.build_storyboard(narrative, assets, PoiContext(id='poi-felix', name='Felix Rooftop'))
+
+
+def localize(storyboard, previous=None):
+    translator, tts, accessibility = RecordingTranslator(), RecordingTTS(), RecordingAccessibility()
+    generate_voiceovers_and_subtitles(
+        storyboard,
+        ['es', 'fr'],
+        audio_prefix=None,
+        translator=translator,
+        tts_generator=tts,
+        previous=previous,
+    )
+    generate_accessibility_assets(storyboard, ['es', 'fr'], generator=accessibility, previous=previous)
+    return translator, tts, accessibility
+
+
+def stored(storyboard):
+    return PreviousLocalization(json.loads(json.dumps(storyboard.to_dict())))
+
+
+def test_incremental_localization_only_requests_changed_keys():
+    first = build_storyboard()
+    localize(first)
+    previous = stored(first)
+
+    unchanged = build_storyboard()
+    translator, tts, accessibility = localize(unchanged, previous)
+    assert translator.requested == [] and tts.calls == [] and accessibility.requested == []
+    assert unchanged.narrative.translations == first.narrative.translations
+    assert unchanged.narrative.narrations['fr'].audio_url == first.narrative.narrations['fr'].audio_url
+    assert unchanged.narrative.accessibility == first.narrative.accessibility
+    assert unchanged.narrative.provenance['localization_reuse']['fr']['tts'] == 'reused'
+
+    changed = build_storyboard()
+    segment = changed.segments[0]
+    segment.script_content = 'A new chant takes over the stands.'
+    changed.invalidate(segment)
+    translator, tts, accessibility = localize(changed, previous)
+
+    # The fixture narrative is Spanish, so only French goes through the translator.
+    assert translator.requested == [('fr', f'segment.{segment.asset_id}.script')]
+    assert changed.narrative.translations['fr'][f'segment.{segment.asset_id}.script'] == '<fr> A new chant takes over the stands.'
+    assert sorted(tts.calls) == ['es', 'fr']
+    assert sorted(accessibility.requested) == [('es', segment.asset_id), ('fr', segment.asset_id)]
+    reuse = changed.narrative.provenance['localization_reuse']['fr']
+    assert reuse['translations_requested'] == 1
+    assert reuse['accessibility_reused'] == len(changed.segments) - 1
+
+    full = build_storyboard()
+    full.segments[0].script_content = segment.script_content
+    full.invalidate(full.segments[0])
+    localize(full)
+    assert changed.narrative.translations == full.narrative.translations
+    assert changed.narrative.accessibility == full.narrative.accessibility
+
+
+def test_async_localization_reuses_previous_render():
+    first = build_storyboard()
+    localize(first)
+    translator, tts, accessibility = RecordingTranslator(), RecordingTTS(), RecordingAccessibility()
+
+    storyboard = build_storyboard()
+    asyncio.run(localize_storyboard_async(
+        storyboard,
+        ['es', 'fr'],
+        audio_prefix=None,
+        translator=to_async(translator),
+        accessibility_generator=to_async(accessibility),
+        tts_generator=to_async(tts),
+        previous=stored(first),
+    ))
+
+    assert translator.requested == [] and tts.calls == [] and accessibility.requested == []
+    assert storyboard.narrative.translations == first.narrative.translations
+    assert storyboard.narrative.accessibility == first.narrative.accessibility
@@ -1,6 +1,9 @@
 import json
 
+import httpx
+
 from context_workers.preferences import detect_preferences
+from context_workers.transport import HTTPTransport
 
 
 def test_detect_preferences_language_and_accessibility(monkeypatch):
@@ -43,25 +46,12 @@ def test_detect_preferences_uses_gpt_service(monkeypatch):
 
     captured: dict = {}
 
-    class DummyResponse:
-        def __init__(self, payload: dict):
-            self._payload = payload
-
-        def read(self) -> bytes:
-            return json.dumps(self._payload).encode('utf-8')
-
-        def __enter__(self):  # pragma: no cover - context manager boilerplate
-            return self
-
-        def __exit__(self, exc_type, exc, tb):  # pragma: no cover
-            return False
-
-    def fake_urlopen(request, timeout):
-        captured['timeout'] = timeout
-        captured['url'] = request.full_url
+    def handler(request: httpx.Request) -> httpx.Response:
+        captured['timeout'] = request.extensions.get('timeout')
+        captured['url'] = str(request.url)
         captured['headers'] = dict(request.headers)
-        captured['payload'] = json.loads(request.data.decode('utf-8'))
-        return DummyResponse({
+        captured['payload'] = json.loads(request.content.decode('utf-8'))
+        return httpx.Response(200, json={
             'primary_locale': 'fr',
             'secondary_locales': ['en'],
             'needs_captions': True,
@@ -71,15 +61,96 @@ def test_detect_preferences_uses_gpt_service(monkeypatch):
             'notes': ['GPT preference synthesis'],
         })
 
-    monkeypatch.setattr('urllib.request.urlopen', fake_urlopen)
+    transport = HTTPTransport(client=httpx.Client(transport=httpx.MockTransport(handler)))
+    monkeypatch.setattr('context_workers.transport._default_transport', transport)
 
     profile = {'conversation_history': ['Bonjour! Merci pour les sous-titres.']}
     result = detect_preferences(profile)
 
-    assert captured['url'] == endpoint
-    assert captured['headers']['Authorization'] == 'Bearer test-key'
+    assert captured['url'].rstrip('/') == endpoint
+    assert captured['headers']['authorization'] == 'Bearer test-key'
     assert captured['payload']['profile'] == profile
     assert result.primary_locale == 'fr'
     assert result.secondary_locales == ['en']
     assert result.needs_haptics is True
     assert 'GPT preference synthesis' in result.notes
+
+
+def _reference_scan(texts):
+    import re
+    from collections import Counter
+
+    from context_workers.preferences import ACCESSIBILITY_PATTERNS, LANGUAGE_KEYWORDS
+
+    counts = Counter()
+    for text in texts:
+        for locale, patterns in LANGUAGE_KEYWORDS.items():
+            matches = sum(1 for pattern in patterns if re.search(pattern, text))
+            if matches:
+                counts[locale] += matches
+    flags = {
+        key: any(re.search(pattern, text) for text in texts for pattern in patterns)
+        for key, patterns in ACCESSIBILITY_PATTERNS.items()
+    }
+    return counts, flags
+
+
+def test_preference_matcher_matches_per_text_search():
+    import random
+
+    from context_workers.preferences import PreferenceMatcher
+
+    words = ['hola', 'hi', 'merci', 'parlons', 'français', 'thanks', '¡vamos', 'estas', 'closed', 'caption',
+             'blind', 'haptic', 'motion', 'sickness', 'the', 'match', 'gate', 'please']
+    rng = random.Random(3)
+    matcher = PreferenceMatcher()
+    for _ in range(200):
+        texts = [' '.join(rng.choice(words) for _ in range(rng.randint(0, 8))) for _ in range(rng.randint(0, 6))]
+        counts, flags = matcher.scan(texts)
+        expected_counts, expected_flags = _reference_scan(texts)
+        assert list(counts.items()) == list(expected_counts.items())
+        assert flags == expected_flags
+
+
+def test_preference_tracker_matches_full_heuristic_turn_by_turn():
+    from context_workers.preferences import PreferenceTracker, _detect_preferences_heuristic
+
+    turns = [
+        {'role': 'user', 'content': 'Hi! Thanks for the tickets.'},
+        {'role': 'assistant', 'content': 'Happy to help.'},
+        'Hola, ¿estás ahí? Gracias.',
+        {'role': 'user', 'content': 'Necesito subtítulos, please.'},
+        {'role': 'user'},
+        'Gracias otra vez, hola!',
+    ]
+    base = {'settings': {'preferred_locale': 'en-US'}, 'signals': [{'type': 'note', 'value': 'reduced motion'}]}
+    tracker = PreferenceTracker()
+    for count in range(len(turns) + 1):
+        profile = dict(base, conversation_history=turns[:count])
+        # Persist and restore between turns as a session store would.
+        tracker = PreferenceTracker.from_dict(json.loads(json.dumps(tracker.to_dict())))
+        assert tracker.update(profile) == _detect_preferences_heuristic(profile)
+    assert tracker.turns_seen == len(turns)
+
+
+def test_preference_tracker_window_and_decay_favor_recent_turns():
+    from context_workers.preferences import PreferenceTracker
+
+    history = ['Merci, bonjour!'] * 3 + ['Thanks, please add captions.']
+    windowed = PreferenceTracker(window=1)
+    result = windowed.update({'conversation_history': history})
+    assert result.primary_locale == 'en'
+    assert result.needs_captions is True
+    assert len(windowed.to_dict()['recent']) == 1
+
+    result = windowed.update({'conversation_history': history + ['Bonjour, merci.']})
+    assert result.primary_locale == 'fr'
+    assert result.needs_captions is False
+
+    decayed = PreferenceTracker(decay=0.1)
+    assert decayed.update({'conversation_history': history}).primary_locale == 'en'
+    assert PreferenceTracker().update({'conversation_history': history}).primary_locale == 'fr'
+
+    # A shorter history starts a new session.
+    assert decayed.update({'conversation_history': ['Hola, gracias']}).primary_locale == 'es'
+    assert decayed.turns_seen == 1
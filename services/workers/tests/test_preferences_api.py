@@ -7,7 +7,7 @@ def test_preferences_endpoint_success(monkeypatch):
     monkeypatch.setenv('CODEX_PREFERENCES_ENDPOINT', 'https://preferences.codex.test')
     monkeypatch.setenv('CODEX_PREFERENCES_API_KEY', 'fake-key')
 
-    async def fake_call(payload):
+    async def fake_call(payload, transport=None):
         assert payload['profile']['conversation_history'][0] == 'Bonjour'
         return {
             'primary_locale': 'fr',
@@ -38,3 +38,247 @@ def test_preferences_endpoint_missing_env(monkeypatch):
     response = client.post('/preferences', json={'profile': {}})
     assert response.status_code == 500
     assert response.json()['detail'].startswith('Preference service missing')
+
+
+def _fresh_resolver(monkeypatch, **kwargs):
+    from context_workers.api.preferences_service import PreferenceResolver
+
+    resolver = PreferenceResolver(**kwargs)
+    monkeypatch.setattr('context_workers.api.preferences_service._resolver', resolver)
+    return resolver
+
+
+def test_preferences_resolver_coalesces_and_caches(monkeypatch):
+    import asyncio
+
+    monkeypatch.setenv('CODEX_PREFERENCES_ENDPOINT', 'https://preferences.codex.test')
+    calls = []
+
+    async def slow_call(payload, transport=None):
+        calls.append(payload)
+        await asyncio.sleep(0.05)
+        return {'primary_locale': 'es', 'secondary_locales': ['en']}
+
+    monkeypatch.setattr('context_workers.api.preferences_service._call_gpt_service', slow_call)
+    resolver = _fresh_resolver(monkeypatch)
+
+    async def burst():
+        profiles = [{'settings': {'a': 1, 'b': 2}}, {'settings': {'b': 2, 'a': 1}}] * 5
+        return await asyncio.gather(*(resolver.resolve(profile) for profile in profiles))
+
+    results = asyncio.run(burst())
+    assert len(calls) == 1
+    assert {result.primary_locale for result in results} == {'es'}
+
+    client = TestClient(app)
+    response = client.post('/preferences', json={'profile': {'settings': {'b': 2, 'a': 1}}})
+    assert response.json()['primary_locale'] == 'es'
+    assert len(calls) == 1
+    assert resolver.cache.hits == 1
+
+
+def test_preferences_cache_expires_and_evicts():
+    from context_workers.api.preferences_service import PreferenceCache
+    from context_workers.preferences import PreferenceResult
+
+    now = [0.0]
+    cache = PreferenceCache(max_entries=2, ttl_seconds=10, clock=lambda: now[0])
+    for key in ('a', 'b', 'c'):
+        cache.set(key, PreferenceResult(primary_locale=key))
+    assert cache.get('a') is None
+    assert cache.get('b').primary_locale == 'b'
+    now[0] = 11
+    assert cache.get('c') is None
+    assert len(cache) == 1
+
+
+def test_preferences_fall_back_to_heuristic(monkeypatch):
+    import asyncio
+
+    from fastapi import HTTPException
+
+    monkeypatch.setenv('CODEX_PREFERENCES_ENDPOINT', 'https://preferences.codex.test')
+    profile = {'conversation_history': ['Bonjour, merci !']}
+
+    async def hanging_call(payload, transport=None):
+        await asyncio.sleep(5)
+
+    monkeypatch.setattr('context_workers.api.preferences_service._call_gpt_service', hanging_call)
+    resolver = _fresh_resolver(monkeypatch, latency_budget=0.01)
+    assert asyncio.run(resolver.resolve(profile)).primary_locale == 'fr'
+
+    async def failing_call(payload, transport=None):
+        raise HTTPException(status_code=502, detail='GPT preference endpoint returned an error')
+
+    monkeypatch.setattr('context_workers.api.preferences_service._call_gpt_service', failing_call)
+    resolver = _fresh_resolver(monkeypatch, fallback_on_error=True)
+    client = TestClient(app)
+    response = client.post('/preferences', json={'profile': profile})
+    assert response.status_code == 200
+    assert response.json()['primary_locale'] == 'fr'
+    assert len(resolver.cache) == 0
+
+
+def test_preferences_failure_after_every_waiter_fell_back_is_retrieved(monkeypatch):
+    import asyncio
+    import gc
+
+    from fastapi import HTTPException
+
+    monkeypatch.setenv('CODEX_PREFERENCES_ENDPOINT', 'https://preferences.codex.test')
+
+    async def late_failing_call(payload, transport=None):
+        await asyncio.sleep(0.02)
+        raise HTTPException(status_code=502, detail='GPT preference endpoint returned an error')
+
+    monkeypatch.setattr('context_workers.api.preferences_service._call_gpt_service', late_failing_call)
+    resolver = _fresh_resolver(monkeypatch, latency_budget=0.001)
+    unhandled = []
+
+    async def scenario():
+        asyncio.get_running_loop().set_exception_handler(lambda loop, context: unhandled.append(context))
+        result = await resolver.resolve({'conversation_history': ['Bonjour, merci !']})
+        await asyncio.sleep(0.05)
+        gc.collect()
+        return result
+
+    assert asyncio.run(scenario()).primary_locale == 'fr'
+    assert resolver._inflight == {}
+    assert unhandled == []
+
+
+def test_preferences_lifespan_owns_upstream_client(monkeypatch):
+    import httpx
+
+    from context_workers.api import preferences_service
+
+    monkeypatch.setenv('CODEX_PREFERENCES_ENDPOINT', 'https://preferences.codex.test')
+    monkeypatch.setenv('CODEX_PREFERENCES_API_KEY', 'fake-key')
+    monkeypatch.setattr(preferences_service, '_resolver', None)
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers['authorization'])
+        return httpx.Response(200, json={'primary_locale': 'pt'})
+
+    real_create = preferences_service.create_async_transport
+
+    def create_mock_transport():
+        transport = real_create()
+        transport._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return transport
+
+    monkeypatch.setattr(preferences_service, 'create_async_transport', create_mock_transport)
+
+    with TestClient(app) as client:
+        transport = preferences_service.get_preference_resolver().transport
+        assert transport is not None
+        for _ in range(2):
+            assert client.post('/preferences', json={'profile': {'id': 'u1'}}).json()['primary_locale'] == 'pt'
+    assert seen == ['Bearer fake-key']
+    assert transport._client.is_closed
+    assert preferences_service._resolver is None
+
+
+def test_preferences_batch_streams_ndjson_with_per_item_errors(monkeypatch):
+    import asyncio
+    import json
+
+    from fastapi import HTTPException
+
+    from context_workers.api.preferences_service import profile_cache_key
+    from context_workers.preferences import PreferenceResult
+
+    monkeypatch.setenv('CODEX_PREFERENCES_ENDPOINT', 'https://preferences.codex.test')
+    active = [0]
+    peak = [0]
+    calls = []
+
+    async def fake_call(payload, transport=None):
+        calls.append(payload)
+        active[0] += 1
+        peak[0] = max(peak[0], active[0])
+        await asyncio.sleep(0.01)
+        active[0] -= 1
+        locale = payload['profile']['locale']
+        if locale == 'xx':
+            raise HTTPException(status_code=502, detail='GPT preference endpoint returned an error')
+        return {'primary_locale': locale}
+
+    monkeypatch.setattr('context_workers.api.preferences_service._call_gpt_service', fake_call)
+    resolver = _fresh_resolver(monkeypatch, batch_concurrency=3)
+    cached_key = profile_cache_key({'locale': 'de'}, 'https://preferences.codex.test')
+    resolver.cache.set(cached_key, PreferenceResult(primary_locale='de'))
+    locales = ['fr', 'es', 'xx', 'fr', 'de', 'pt', 'it', 'ja']
+    profiles = [{'locale': locale} for locale in locales]
+
+    client = TestClient(app)
+    response = client.post('/preferences:batch', json={'profiles': profiles})
+    assert response.status_code == 200
+    assert response.headers['content-type'].startswith('application/x-ndjson')
+    items = [json.loads(line) for line in response.text.splitlines()]
+    assert sorted(item['index'] for item in items) == list(range(len(locales)))
+    by_index = {item['index']: item for item in items}
+    assert by_index[2]['error'] == {'status': 502, 'detail': 'GPT preference endpoint returned an error'}
+    for index, locale in enumerate(locales):
+        if locale != 'xx':
+            assert by_index[index]['result']['primary_locale'] == locale
+    assert peak[0] <= 3
+    assert len(calls) == 6
+
+
+def test_preferences_batch_bounds_upstream_calls_past_the_latency_budget(monkeypatch):
+    import asyncio
+
+    monkeypatch.setenv('CODEX_PREFERENCES_ENDPOINT', 'https://preferences.codex.test')
+    active = [0]
+    peak = [0]
+    calls = []
+
+    async def slow_call(payload, transport=None):
+        calls.append(payload)
+        active[0] += 1
+        peak[0] = max(peak[0], active[0])
+        await asyncio.sleep(0.03)
+        active[0] -= 1
+        return {'primary_locale': payload['profile']['locale']}
+
+    monkeypatch.setattr('context_workers.api.preferences_service._call_gpt_service', slow_call)
+    resolver = _fresh_resolver(monkeypatch, latency_budget=0.005, batch_concurrency=2)
+    profiles = [{'locale': locale} for locale in ('fr', 'es', 'pt', 'it', 'ja', 'de')]
+
+    async def run():
+        items = [item async for item in resolver.resolve_batch(profiles)]
+        while resolver._inflight:
+            await asyncio.sleep(0.01)
+        return items
+
+    items = asyncio.run(run())
+    assert len(items) == len(profiles)
+    assert len(calls) == len(profiles)
+    assert peak[0] <= 2
+    assert len(resolver.cache) == len(profiles)
+
+
+def test_preferences_resolver_uses_its_own_transport(monkeypatch):
+    import asyncio
+
+    import httpx
+
+    from context_workers.api.preferences_service import PreferenceResolver
+    from context_workers.transport import AsyncHTTPTransport
+
+    monkeypatch.setenv('CODEX_PREFERENCES_ENDPOINT', 'https://preferences.codex.test')
+    monkeypatch.setenv('CODEX_PREFERENCES_API_KEY', 'fake-key')
+    seen = []
+
+    def handler(request):
+        seen.append(str(request.url))
+        return httpx.Response(200, json={'primary_locale': 'it'})
+
+    transport = AsyncHTTPTransport(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    # Not the process-wide resolver: its transport must still be used.
+    resolver = PreferenceResolver(transport=transport)
+    _fresh_resolver(monkeypatch)
+    assert asyncio.run(resolver.resolve({'id': 'u2'})).primary_locale == 'it'
+    assert seen == ['https://preferences.codex.test']
@@ -0,0 +1,174 @@
+import json
+import threading
+
+import httpx
+
+from context_workers.render_jobs import RateLimiter, RenderJobQueue, RenderWorkerPool
+from context_workers.storage import LocalRenderStorage, StorageConfig
+from context_workers.transport import HTTPTransport
+from context_workers.video_assembly import CreatomateRenderConfig, CreatomateRenderer
+from test_storage import build_storyboard_and_payload
+
+
+class StubCreatomate:
+    """Stands in for the Creatomate API: renders finish after ``polls_until_done`` GETs."""
+
+    def __init__(self, polls_until_done=1, reject=False):
+        self.polls_until_done = polls_until_done
+        self.reject = reject
+        self.renders = {}
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def handler(self, request):
+        if request.method == 'POST':
+            with self._lock:
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+            try:
+                if self.reject:
+                    return httpx.Response(400, text='invalid template')
+                with self._lock:
+                    render_id = f'cm-{len(self.renders) + 1}'
+                    self.renders[render_id] = 0
+                return httpx.Response(202, json=[{'id': render_id, 'status': 'planned'}])
+            finally:
+                with self._lock:
+                    self.active -= 1
+        render_id = request.url.path.rsplit('/', 1)[-1]
+        if render_id not in self.renders:
+            return httpx.Response(404, text='render not found')
+        self.renders[render_id] += 1
+        if self.renders[render_id] >= self.polls_until_done:
+            return httpx.Response(200, json={'id': render_id, 'status': 'succeeded', 'url': f'https://cdn.creatomate.test/{render_id}.mp4'})
+        return httpx.Response(200, json={'id': render_id, 'status': 'rendering'})
+
+
+def build_pool(tmp_path, stub, clock=None, **kwargs):
+    transport = HTTPTransport(client=httpx.Client(transport=httpx.MockTransport(stub.handler)), sleep=lambda _: None)
+    renderer = CreatomateRenderer(CreatomateRenderConfig(template_id='tmpl-123'), api_key='key', transport=transport)
+    storage = LocalRenderStorage(StorageConfig(output_dir=tmp_path / 'renders'))
+    queue = RenderJobQueue(tmp_path / 'jobs.sqlite', **({'clock': clock} if clock else {}))
+    return RenderWorkerPool(queue, renderer, storage=storage, poll_interval=0, sleep=lambda _: None, **kwargs)
+
+
+def test_worker_pool_submits_polls_and_stores_completed_renders(tmp_path):
+    stub = StubCreatomate(polls_until_done=2)
+    pool = build_pool(tmp_path, stub, workers=2)
+    storyboard, render_payload, manifest, _ = build_storyboard_and_payload()
+    for index in range(3):
+        pool.enqueue(storyboard, render_payload, manifest, fingerprint=f'fp-{index}')
+
+    jobs = pool.run_until_complete(timeout=5)
+
+    assert [job.state for job in jobs] == ['succeeded'] * 3
+    assert sorted(job.render_id for job in jobs) == ['cm-1', 'cm-2', 'cm-3']
+    assert stub.peak <= 2
+    for job in jobs:
+        assert job.storage['render_id'] == job.render_id
+        assert job.storage['metadata']['fingerprint'] == job.fingerprint
+        assert job.storage['signed_video_url'] == f'https://cdn.creatomate.test/{job.render_id}.mp4'
+        stored = tmp_path / 'renders' / 'poi-felix' / job.render_id / 'render_response.json'
+        assert json.loads(stored.read_text())['status'] == 'succeeded'
+
+    reopened = RenderJobQueue(tmp_path / 'jobs.sqlite')
+    assert reopened.pending_count() == 0
+    assert reopened.get(jobs[0].id).storage['provider'] == 'local'
+
+
+def test_webhook_completes_rendering_job_and_rejections_fail(tmp_path):
+    stub = StubCreatomate(polls_until_done=99)
+    pool = build_pool(tmp_path, stub)
+    storyboard, render_payload, manifest, _ = build_storyboard_and_payload()
+    job = pool.enqueue(storyboard, render_payload, manifest)
+
+    (submitted,) = pool.submit_pending()
+    assert submitted.state == 'rendering'
+    assert pool.ingest_webhook({'id': 'unknown', 'status': 'succeeded'}) is None
+
+    done = pool.ingest_webhook({'id': submitted.render_id, 'status': 'succeeded', 'url': 'https://cdn/x.mp4'})
+    assert done.state == 'succeeded'
+    assert pool.queue.get(job.id).storage['render_id'] == submitted.render_id
+
+    stub.reject = True
+    failed = pool.enqueue(storyboard, render_payload, manifest)
+    pool.submit_pending()
+    record = pool.queue.get(failed.id)
+    assert record.state == 'failed'
+    assert 'invalid template' in record.error
+
+
+def test_only_polls_count_against_max_polls(tmp_path):
+    now = [1000.0]
+    stub = StubCreatomate(polls_until_done=99)
+    pool = build_pool(tmp_path, stub, clock=lambda: now[0], max_polls=2)
+    storyboard, render_payload, manifest, _ = build_storyboard_and_payload()
+    pool.enqueue(storyboard, render_payload, manifest)
+
+    (submitted,) = pool.submit_pending()
+    assert submitted.polls == 0
+    for _ in range(3):
+        progress = pool.ingest_webhook({'id': submitted.render_id, 'status': 'rendering'})
+        assert progress.state == 'rendering'
+        assert progress.polls == 0
+
+    now[0] += pool.poll_interval
+    (polled,) = pool.poll()
+    assert polled.state == 'rendering'
+    assert polled.polls == 1
+    now[0] += pool.poll_interval
+    (polled,) = pool.poll()
+    assert polled.state == 'failed'
+    assert 'after 2 polls' in polled.error
+
+
+def test_stuck_submissions_are_reclaimed_and_unfinished_renders_give_up(tmp_path):
+    now = [1000.0]
+    stub = StubCreatomate(polls_until_done=99)
+    pool = build_pool(tmp_path, stub, clock=lambda: now[0], submit_lease=60, max_polls=3)
+    storyboard, render_payload, manifest, _ = build_storyboard_and_payload()
+    stuck = pool.enqueue(storyboard, render_payload, manifest)
+    pool.queue.claim(1)  # a worker crashed after claiming the job
+
+    assert pool.queue.recover_interrupted(older_than=60) == 0
+    now[0] += 61
+    other = pool.enqueue(storyboard, render_payload, manifest)
+
+    (finished,) = pool.run_until_complete([stuck.id], timeout=5)
+    assert finished.id == stuck.id
+    assert finished.state == 'failed'
+    assert 'after 3 polls' in finished.error
+    assert pool.queue.get(other.id).state == 'failed'
+
+    lost = pool.enqueue(storyboard, render_payload, manifest)
+    pool.queue.update(lost, state='rendering', render_id='cm-missing', next_poll_at=0)
+    assert [job.id for job in pool.run_until_complete(timeout=5)] == [lost.id]
+    assert 'unknown to Creatomate' in pool.queue.get(lost.id).error
+
+
+def test_unexpected_submission_errors_fail_the_job(tmp_path):
+    pool = build_pool(tmp_path, StubCreatomate())
+    storyboard, render_payload, manifest, _ = build_storyboard_and_payload()
+    job = pool.enqueue(storyboard, render_payload, manifest)
+
+    def explode(payload, execute):
+        raise ValueError('bad payload')
+
+    pool.renderer.render = explode
+    (failed,) = pool.run_until_complete(timeout=5)
+    assert failed.id == job.id and failed.state == 'failed'
+    assert 'bad payload' in failed.error
+
+
+def test_rate_limiter_spaces_submissions():
+    now = [0.0]
+    waits = []
+
+    def sleep(seconds):
+        waits.append(seconds)
+
+    limiter = RateLimiter(4, clock=lambda: now[0], sleep=sleep)
+    for _ in range(3):
+        limiter.acquire()
+    assert waits == [0.25, 0.5]
@@ -27,3 +27,58 @@ def test_keyword_scene_labeller_falls_back_to_default():
     labeler = KeywordSceneLabeler({'food': ['tapas']}, default_label='general')
     [labelled] = apply_scene_labels([asset], labeler)
     assert labelled.scenes == ['general']
+
+
+def test_compiled_labeller_matches_keyword_labeller():
+    import random
+
+    from context_workers.scene_labelling import CompiledKeywordSceneLabeler
+
+    keyword_map = {
+        'fans': ['fan', 'Fans'],
+        'stadium': ['fans stand', 'stadium'],
+        'food': ['tapa', 'tapas bar', 'Mercado'],
+        'transit': ['path', 'ferry'],
+        'empty': [],
+        'night': ['night', 'nigh'],
+    }
+    words = ['fan', 'fans', 'stand', 'tapas', 'bar', 'mercado', 'ferry', 'party', 'brunch', 'night', 'metro', 'TAPA', 'celebrating', '']
+    rng = random.Random(3)
+    reference = KeywordSceneLabeler(keyword_map, default_label='misc')
+    compiled = CompiledKeywordSceneLabeler(keyword_map, default_label='misc')
+
+    for index in range(500):
+        asset = Asset(
+            id=str(index),
+            source='instagram',
+            url='https://example.com/x.jpg',
+            caption=' '.join(rng.choice(words) for _ in range(rng.randint(0, 6))) or None,
+            tags=rng.sample(['Fans', 'ferry', 'path', 'worldcup', 'tapas bar'], rng.randint(0, 2)),
+        )
+        assert compiled.label(asset) == reference.label(asset), asset.caption
+
+
+def test_parallel_labelling_preserves_order_and_matches_serial():
+    from context_workers.scene_labelling import apply_scene_labels_parallel, label_batch
+
+    keyword_map = {'transit': ['ferry', 'metro'], 'celebration': ['fans'], 'food': ['tapas']}
+    captions = ['Ferry at dawn', 'Fans on the metro', 'Quiet street', 'Tapas and fans', None]
+
+    def make_assets():
+        return [
+            Asset(id=str(index), source='x', url='u', caption=captions[index % len(captions)])
+            for index in range(53)
+        ]
+
+    labeler = KeywordSceneLabeler(keyword_map)
+    expected = [asset.scenes for asset in apply_scene_labels(make_assets(), labeler)]
+
+    for use_threads in (True, False):
+        labelled = apply_scene_labels_parallel(make_assets(), labeler, workers=2, chunk_size=10, use_threads=use_threads)
+        assert [asset.id for asset in labelled] == [str(index) for index in range(53)]
+        assert [asset.scenes for asset in labelled] == expected
+
+    batch = label_batch(make_assets()[:3], labeler)
+    assert batch.vocabulary == ('transit', 'celebration', 'general')
+    assert batch.ids.tolist() == [0, 1, 0, 2]
+    assert batch.labels_at(1) == ['celebration', 'transit']
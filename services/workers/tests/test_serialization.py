@@ -0,0 +1,48 @@
+import json
+
+import pytest
+
+from context_workers import serialization
+from context_workers.serialization import JSON_BACKENDS, create_serializer, get_serializer, set_serializer
+
+
+def available_backends():
+    names = []
+    for name in JSON_BACKENDS:
+        try:
+            create_serializer(name)
+        except RuntimeError:
+            continue
+        names.append(name)
+    return names
+
+
+@pytest.mark.parametrize('name', available_backends())
+def test_backends_round_trip_in_pretty_and_compact_modes(name):
+    serializer = create_serializer(name)
+    document = {'poi': {'name': 'Café Felix', 'tags': ['fans']}, 'score': 1.5, 'ok': True, 'none': None}
+
+    pretty = serializer.dumps(document)
+    compact = serializer.dumps(document, compact=True)
+
+    assert isinstance(pretty, bytes)
+    assert json.loads(pretty) == json.loads(compact) == document
+    assert b'\n  "poi"' in pretty
+    assert b' ' not in compact.replace(b'Caf\xc3\xa9 Felix', b'')
+    assert 'Café' in serializer.dumps_text(document, compact=True)
+    assert serializer.loads(compact) == serializer.loads(compact.decode('utf-8')) == document
+    with pytest.raises(ValueError):
+        serializer.loads(b'{"broken":')
+
+
+def test_serializer_selection_follows_env_and_override(monkeypatch):
+    monkeypatch.setenv('CODEX_JSON_BACKEND', 'json')
+    previous = set_serializer(None)
+    try:
+        assert get_serializer().name == 'json'
+        set_serializer('json')
+        assert serialization.dumps({'a': 1}, compact=True) == b'{"a":1}'
+        with pytest.raises(ValueError):
+            create_serializer('yaml')
+    finally:
+        set_serializer(previous)
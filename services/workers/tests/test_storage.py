@@ -1,10 +1,14 @@
+import io
 import json
 import sys
 import types
+from pathlib import Path
+
+import pytest
 
 from context_workers.models import Asset, HighlightFrame, HighlightNarrative, NarrativeScript, ScriptBeat
 from context_workers.video_assembly import CreatomateRenderConfig, CreatomateRenderer, PoiContext
-from context_workers.storage import StorageConfig, LocalRenderStorage, create_storage
+from context_workers.storage import RENDER_ARTIFACTS, SignedURLCache, StorageConfig, LocalRenderStorage, create_storage
 
 
 def build_storyboard_and_payload():
@@ -91,13 +95,56 @@ def install_fake_gcs(monkeypatch):
         def upload_from_string(self, data, content_type=None):
             self.bucket.uploads[self.name] = {'data': data, 'content_type': content_type}
 
+        def open(self, mode, chunk_size=None, content_type=None):
+            assert mode == 'wb'
+            return FakeWriter(self, chunk_size, content_type)
+
+        def exists(self):
+            return self.name in self.bucket.uploads
+
+        def download_as_text(self):
+            return self.bucket.uploads[self.name]['data']
+
+        def download_as_bytes(self):
+            data = self.bucket.uploads[self.name]['data']
+            return data.encode('utf-8') if isinstance(data, str) else data
+
         def generate_signed_url(self, expiration, method='GET'):
+            self.bucket.signatures.append((self.name, method))
             return f'https://signed/{self.name}?ttl={int(expiration.total_seconds())}'
 
+    class FakeWriter:
+        def __init__(self, blob, chunk_size, content_type):
+            self.blob = blob
+            self.chunk_size = chunk_size
+            self.content_type = content_type
+            self.parts = []
+
+        def write(self, data):
+            assert len(data) <= self.chunk_size
+            if self.blob.bucket.fail_on == 'write':
+                raise RuntimeError('503 upload chunk rejected')
+            self.parts.append(bytes(data))
+
+        def terminate(self):
+            self.blob.bucket.terminated.append(self.blob.name)
+
+        def close(self):
+            if self.blob.bucket.fail_on == 'close':
+                raise RuntimeError('410 resumable session expired')
+            self.blob.bucket.uploads[self.blob.name] = {
+                'data': b''.join(self.parts),
+                'content_type': self.content_type,
+                'chunks': len(self.parts),
+            }
+
     class FakeBucket:
         def __init__(self, name):
             self.name = name
             self.uploads = uploads.setdefault(name, {})
+            self.signatures = []
+            self.terminated = []
+            self.fail_on = None
 
         def blob(self, name):
             return FakeBlob(self, name)
@@ -160,7 +207,7 @@ def test_gcs_storage_optionally_copies_video(monkeypatch):
         copy_video_asset=True,
     )
     storage = create_storage(config)
-    monkeypatch.setattr(storage, '_fetch_bytes', lambda url: b'video-bytes')
+    monkeypatch.setattr(storage, '_open_source', lambda url: io.BytesIO(b'video-bytes'))
 
     result = storage.store(
         storyboard=storyboard,
@@ -173,3 +220,346 @@ def test_gcs_storage_optionally_copies_video(monkeypatch):
     video_key = f"world-cup/poi-felix/{result.render_id}/render.mp4"
     assert bucket_uploads[video_key]['content_type'] == 'video/mp4'
     assert result.signed_video_url.endswith(f'{video_key}?ttl=3600') or result.signed_video_url == render_response['download_url']
+
+
+def test_local_storage_indexes_renders_by_fingerprint(tmp_path):
+    storyboard, render_payload, manifest, _ = build_storyboard_and_payload()
+    storage = LocalRenderStorage(StorageConfig(output_dir=tmp_path / 'renders'))
+    render_response = {'status': 'succeeded', 'url': 'https://cdn.creatomate.test/a.mp4'}
+
+    assert storage.lookup_fingerprint('poi-felix', 'f' * 64) is None
+    assert storage.latest_render('poi-felix') is None
+    assert not (tmp_path / 'renders' / '.index').exists()
+    result = storage.store(
+        storyboard=storyboard,
+        render_payload=render_payload,
+        manifest=manifest,
+        render_response=render_response,
+        fingerprint='f' * 64,
+    )
+
+    assert result.render_id == 'render-ffffffffffff'
+    assert storage.lookup_fingerprint('poi-felix', 'f' * 64) == result
+    assert storage.index.find_fingerprint('poi-felix', 'f' * 64).render_id == result.render_id
+    assert not (tmp_path / 'renders' / '.index' / 'fingerprints').exists()
+    assert storage.lookup_fingerprint('poi-other', 'f' * 64) is None
+    (tmp_path / 'renders' / 'poi-felix' / result.render_id / 'manifest.json').unlink()
+    assert storage.lookup_fingerprint('poi-felix', 'f' * 64) is None
+
+
+def test_gcs_storage_indexes_renders_by_fingerprint(monkeypatch):
+    install_fake_gcs(monkeypatch)
+    storyboard, render_payload, manifest, render_response = build_storyboard_and_payload()
+    storage = create_storage(StorageConfig(provider='gcs', gcs_bucket='codex-reels-demo', gcs_prefix='world-cup'))
+
+    assert storage.lookup_fingerprint('poi-felix', 'abc') is None
+    storage.store(
+        storyboard=storyboard,
+        render_payload=render_payload,
+        manifest=manifest,
+        render_response=render_response,
+        fingerprint='abc',
+    )
+    # A dry run (or any unfinished render) is stored but never reused.
+    assert storage.lookup_fingerprint('poi-felix', 'abc') is None
+
+    result = storage.store(
+        storyboard=storyboard,
+        render_payload=render_payload,
+        manifest=manifest,
+        render_response={**render_response, 'status': 'succeeded'},
+        fingerprint='abc',
+    )
+    found = storage.lookup_fingerprint('poi-felix', 'abc')
+    assert found.render_id == result.render_id == 'render-test'
+    assert found.metadata['fingerprint'] == 'abc'
+    assert found.signed_manifest_url == result.signed_manifest_url
+
+
+def test_gcs_fingerprint_lookup_resigns_copied_video(monkeypatch):
+    install_fake_gcs(monkeypatch)
+    storyboard, render_payload, manifest, _ = build_storyboard_and_payload()
+    config = StorageConfig(provider='gcs', gcs_bucket='codex-reels-demo', gcs_prefix='world-cup', copy_video_asset=True)
+    storage = create_storage(config)
+    now = [1000.0]
+    storage.signed_urls.clock = lambda: now[0]
+    monkeypatch.setattr(storage, '_open_source', lambda url: io.BytesIO(b'video-bytes'))
+    render_response = {'id': 'render-cm', 'status': 'succeeded', 'url': 'https://cdn.creatomate.test/cm.mp4'}
+    storage.store(
+        storyboard=storyboard,
+        render_payload=render_payload,
+        manifest=manifest,
+        render_response=render_response,
+        fingerprint='abc',
+    )
+    signed_before = len(storage.bucket.signatures)
+
+    now[0] += config.signed_url_ttl + 1  # the indexed URLs have expired
+    found = storage.lookup_fingerprint('poi-felix', 'abc')
+
+    video_key = 'world-cup/poi-felix/render-cm/render.mp4'
+    assert found.signed_video_url == f'https://signed/{video_key}?ttl=3600'
+    assert sorted(storage.bucket.signatures[signed_before:]) == [
+        ('world-cup/poi-felix/render-cm/manifest.json', 'GET'),
+        (video_key, 'GET'),
+    ]
+
+
+def test_local_storage_compact_json_mode(tmp_path):
+    storyboard, render_payload, manifest, render_response = build_storyboard_and_payload()
+    storage = LocalRenderStorage(StorageConfig(output_dir=tmp_path / 'renders', compact_json=True))
+
+    result = storage.store(
+        storyboard=storyboard,
+        render_payload=render_payload,
+        manifest=manifest,
+        render_response=render_response,
+    )
+
+    text = (tmp_path / 'renders' / 'poi-felix' / result.render_id / 'storyboard.json').read_text()
+    assert '\n' not in text
+    assert json.loads(text) == json.loads(json.dumps(storyboard.to_dict()))
+
+
+def test_gcs_storage_uploads_concurrently_and_streams_video_in_chunks(monkeypatch):
+    import threading
+
+    uploads = install_fake_gcs(monkeypatch)
+    storyboard, render_payload, manifest, _ = build_storyboard_and_payload()
+    render_response = {'id': 'render-big', 'status': 'succeeded', 'url': 'https://cdn.creatomate.test/big.mp4'}
+    storage = create_storage(StorageConfig(
+        provider='gcs',
+        gcs_bucket='codex-reels-demo',
+        copy_video_asset=True,
+        upload_chunk_size=256 * 1024,
+    ))
+    video = bytes(range(256)) * 4096 + b'tail'
+    monkeypatch.setattr(storage, '_open_source', lambda url: io.BytesIO(video))
+    threads = set()
+    original_upload_json = storage._upload_json
+
+    def recording_upload_json(*args):
+        threads.add(threading.current_thread().name)
+        return original_upload_json(*args)
+
+    monkeypatch.setattr(storage, '_upload_json', recording_upload_json)
+
+    result = storage.store(
+        storyboard=storyboard,
+        render_payload=render_payload,
+        manifest=manifest,
+        render_response=render_response,
+    )
+
+    video_upload = uploads['codex-reels-demo']['renders/poi-felix/render-big/render.mp4']
+    assert video_upload['data'] == video
+    assert video_upload['chunks'] == 5
+    assert all(name.startswith('codex-upload') for name in threads)
+    assert set(result.metadata['upload_ms']) == {
+        'manifest.json', 'render_payload.json', 'storyboard.json', 'render_response.json', 'render.mp4',
+    }
+    assert result.signed_video_url.endswith('render-big/render.mp4?ttl=3600')
+
+
+def test_gcs_storage_keeps_source_url_when_video_copy_fails(monkeypatch):
+    uploads = install_fake_gcs(monkeypatch)
+    storyboard, render_payload, manifest, _ = build_storyboard_and_payload()
+    render_response = {'id': 'render-broken', 'url': 'https://cdn.creatomate.test/broken.mp4'}
+    storage = create_storage(StorageConfig(provider='gcs', gcs_bucket='codex-reels-demo', copy_video_asset=True))
+
+    class BrokenSource(io.BytesIO):
+        def read(self, size=-1):
+            raise OSError('connection reset')
+
+    monkeypatch.setattr(storage, '_open_source', lambda url: BrokenSource())
+    result = storage.store(
+        storyboard=storyboard,
+        render_payload=render_payload,
+        manifest=manifest,
+        render_response=render_response,
+    )
+
+    assert 'renders/poi-felix/render-broken/render.mp4' not in uploads['codex-reels-demo']
+    assert result.signed_video_url == render_response['url']
+
+
+@pytest.mark.parametrize('fail_on', ['write', 'close'])
+def test_gcs_storage_skips_video_when_the_upload_fails(monkeypatch, fail_on):
+    uploads = install_fake_gcs(monkeypatch)
+    storyboard, render_payload, manifest, _ = build_storyboard_and_payload()
+    render_response = {'id': 'render-upload', 'url': 'https://cdn.creatomate.test/upload.mp4'}
+    storage = create_storage(StorageConfig(provider='gcs', gcs_bucket='codex-reels-demo', copy_video_asset=True))
+    storage.bucket.fail_on = fail_on
+    monkeypatch.setattr(storage, '_open_source', lambda url: io.BytesIO(b'video-bytes'))
+
+    result = storage.store(
+        storyboard=storyboard,
+        render_payload=render_payload,
+        manifest=manifest,
+        render_response=render_response,
+    )
+
+    video_key = 'renders/poi-felix/render-upload/render.mp4'
+    assert video_key not in uploads['codex-reels-demo']
+    assert storage.bucket.terminated == [video_key]
+    assert result.signed_video_url == render_response['url']
+    assert 'renders/poi-felix/render-upload/manifest.json' in uploads['codex-reels-demo']
+
+
+def test_signed_url_cache_reuses_until_margin_before_expiry():
+    now = [1000.0]
+    cache = SignedURLCache(margin=60, max_entries=2, clock=lambda: now[0])
+    signed = []
+
+    def sign():
+        signed.append(now[0])
+        return f'url-{len(signed)}'
+
+    key = ('poi/render/manifest.json', 'GET', 600)
+    assert cache.get_or_sign(key, sign) == 'url-1'
+    now[0] += 539
+    assert cache.get_or_sign(key, sign) == 'url-1'
+    now[0] += 1
+    assert cache.get_or_sign(key, sign) == 'url-2'
+    assert cache.get_or_sign(('other', 'GET', 600), lambda: None) is None
+    cache.get_or_sign(('b', 'GET', 600), sign)
+    cache.get_or_sign(('c', 'GET', 600), sign)
+    assert len(cache) == 2 and cache.get(key) is None
+
+
+def test_gcs_storage_batch_signs_render_artifacts_once(monkeypatch):
+    install_fake_gcs(monkeypatch)
+    storyboard, render_payload, manifest, render_response = build_storyboard_and_payload()
+    storage = create_storage(StorageConfig(provider='gcs', gcs_bucket='codex-reels-demo', gcs_prefix='world-cup'))
+    result = storage.store(
+        storyboard=storyboard,
+        render_payload=render_payload,
+        manifest=manifest,
+        render_response=render_response,
+    )
+    signatures = storage.bucket.signatures
+    signed_by_store = len(signatures)
+
+    urls = storage.sign_render_artifacts('poi-felix', result.render_id)
+    assert list(urls) == list(RENDER_ARTIFACTS)
+    assert urls['manifest.json'] == result.signed_manifest_url
+    assert urls['render.mp4'] == 'https://signed/world-cup/poi-felix/render-test/render.mp4?ttl=3600'
+    assert len(signatures) == signed_by_store + len(RENDER_ARTIFACTS) - 1
+
+    assert storage.sign_render_artifacts('poi-felix', result.render_id) == urls
+    assert len(signatures) == signed_by_store + len(RENDER_ARTIFACTS) - 1
+    storage.sign_render_artifacts('poi-felix', result.render_id, ['render.mp4'], method='PUT')
+    assert signatures[-1] == ('world-cup/poi-felix/render-test/render.mp4', 'PUT')
+
+
+def test_local_storage_batch_signs_render_artifacts(tmp_path):
+    storage = LocalRenderStorage(StorageConfig(output_dir=tmp_path, base_url='https://cdn.example.com/reels/'))
+
+    urls = storage.sign_render_artifacts('poi-felix', 'render-1', ['manifest.json', 'render.mp4'])
+    assert urls == {
+        'manifest.json': 'https://cdn.example.com/reels/poi-felix/render-1/manifest.json?signature=demo',
+        'render.mp4': 'https://cdn.example.com/reels/poi-felix/render-1/render.mp4?signature=demo',
+    }
+    storage.sign_render_artifacts('poi-felix', 'render-1', ['manifest.json'])
+    assert storage.signed_urls.hits == 1
+
+
+def test_local_storage_indexes_renders_and_sweeps_expired_in_batches(tmp_path):
+    storyboard, render_payload, manifest, render_response = build_storyboard_and_payload()
+    storage = LocalRenderStorage(StorageConfig(output_dir=tmp_path, retention_days=1))
+    for render_id in ('render-a', 'render-b', 'render-c'):
+        storage.store(
+            storyboard=storyboard,
+            render_payload=render_payload,
+            manifest=manifest,
+            render_response={**render_response, 'id': render_id},
+            fingerprint=f'fp-{render_id}',
+        )
+
+    record = storage.index.latest('poi-felix')
+    assert record.render_id == 'render-c'
+    assert record.sizes['storyboard.json'] == (tmp_path / 'poi-felix' / 'render-c' / 'storyboard.json').stat().st_size
+    assert storage.latest_render('poi-felix').manifest_path.endswith('render-c/manifest.json')
+    assert storage.latest_render('poi-unknown') is None
+    assert storage.sweep_expired() == []
+
+    later = record.created_at + 86400 + 1
+    first = storage.sweep_expired(batch_size=2, now=later)
+    assert [swept.render_id for swept in first] == ['render-a', 'render-b']
+    assert not (tmp_path / 'poi-felix' / 'render-a').exists()
+    assert storage.lookup_fingerprint('poi-felix', 'fp-render-a') is None
+    assert len(storage.sweep_expired(batch_size=2, now=later)) == 1
+    assert not (tmp_path / 'poi-felix').exists()
+    assert len(storage.index) == 0
+
+
+def test_local_storage_reindexes_renders_stored_before_the_index(tmp_path):
+    storyboard, render_payload, manifest, render_response = build_storyboard_and_payload()
+    storage = LocalRenderStorage(StorageConfig(output_dir=tmp_path))
+    storage.store(storyboard=storyboard, render_payload=render_payload, manifest=manifest, render_response=render_response)
+    storage.index.close()
+    (tmp_path / '.index' / 'renders.sqlite').unlink()
+    for sidecar in (tmp_path / '.index').glob('renders.sqlite-*'):
+        sidecar.unlink()
+
+    fresh = LocalRenderStorage(StorageConfig(output_dir=tmp_path))
+    assert fresh.latest_render('poi-felix') is None
+    assert fresh.reindex() == 1
+    assert fresh.reindex() == 0
+    assert fresh.latest_render('poi-felix').render_id == 'render-test'
+
+
+def store_twice(storage):
+    storyboard, render_payload, manifest, render_response = build_storyboard_and_payload()
+    results = [
+        storage.store(
+            storyboard=storyboard,
+            render_payload=render_payload,
+            manifest=manifest,
+            render_response={**render_response, 'id': render_id},
+        )
+        for render_id in ('render-1', 'render-2')
+    ]
+    return results, storyboard
+
+
+def test_local_storage_dedupes_large_sub_documents_into_blobs(tmp_path):
+    storage = LocalRenderStorage(StorageConfig(output_dir=tmp_path, dedupe_blobs=True, blob_min_bytes=64))
+    (first, second), storyboard = store_twice(storage)
+
+    assert first.metadata['blobs']['written'] == first.metadata['blobs']['count'] > 0
+    assert second.metadata['blobs']['written'] == 0
+    thin = json.loads(Path(second.storyboard_path).read_text())
+    assert '$blob' in json.dumps(thin)
+    assert storage.load_artifact('poi-felix', 'render-2', 'storyboard.json') == storyboard.to_dict()
+
+    blob_dir = tmp_path / '.blobs'
+    assert any(blob_dir.rglob('*.json'))
+    later = storage.index.latest('poi-felix').created_at + 8 * 86400
+    storage.sweep_expired(batch_size=1, now=later)
+    assert any(blob_dir.rglob('*.json'))
+    storage.sweep_expired(batch_size=1, now=later)
+    assert not any(blob_dir.rglob('*.json'))
+
+
+def test_gcs_storage_uploads_each_blob_once_with_zstd(monkeypatch):
+    pytest.importorskip('zstandard')
+    uploads = install_fake_gcs(monkeypatch)
+    config = StorageConfig(
+        provider='gcs',
+        gcs_bucket='codex-reels-demo',
+        gcs_prefix='world-cup',
+        dedupe_blobs=True,
+        blob_compression='zstd',
+        blob_min_bytes=64,
+    )
+    (first, second), storyboard = store_twice(create_storage(config))
+
+    bucket = uploads['codex-reels-demo']
+    blob_names = [name for name in bucket if name.startswith('world-cup/.blobs/')]
+    assert len(blob_names) == first.metadata['blobs']['count']
+    assert all(name.endswith('.json.zst') for name in blob_names)
+    assert second.metadata['blobs']['written'] == 0
+
+    fresh = create_storage(config)
+    assert fresh.load_artifact('poi-felix', 'render-2', 'storyboard.json') == storyboard.to_dict()
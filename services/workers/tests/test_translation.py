@@ -0,0 +1,127 @@
+from context_workers.translation import GPTTranslator, TranslationItem, create_translator
+from context_workers.transport import HTTPTransport
+from context_workers.translation_cache import CachedTranslator, SQLiteTranslationCache
+
+
+class RecordingTranslator:
+    def __init__(self):
+        self.requests = []
+
+    def translate(self, items, target_locale, *, source_locale):
+        items = list(items)
+        self.requests.append([item.key for item in items])
+        return {item.key: f'{target_locale}:{item.text}' for item in items}
+
+
+def test_cached_translator_only_sends_misses(tmp_path):
+    cache = SQLiteTranslationCache(tmp_path / 'translations.sqlite')
+    inner = RecordingTranslator()
+    translator = CachedTranslator(inner, cache)
+
+    first = translator.translate(
+        [
+            TranslationItem('script.beat-1.title', 'Arrival'),
+            TranslationItem('segment.a.title', 'Arrival'),
+            TranslationItem('narrative.summary', 'Fans everywhere'),
+            TranslationItem('empty', ''),
+        ],
+        'fr',
+        source_locale='en',
+    )
+    assert first == {
+        'script.beat-1.title': 'fr:Arrival',
+        'segment.a.title': 'fr:Arrival',
+        'narrative.summary': 'fr:Fans everywhere',
+    }
+    assert inner.requests == [['script.beat-1.title', 'narrative.summary']]
+
+    second = CachedTranslator(inner, SQLiteTranslationCache(tmp_path / 'translations.sqlite')).translate(
+        [TranslationItem('segment.b.title', 'Arrival'), TranslationItem('segment.b.script', 'New clip')],
+        'fr',
+        source_locale='en',
+    )
+    assert second == {'segment.b.title': 'fr:Arrival', 'segment.b.script': 'fr:New clip'}
+    assert inner.requests[-1] == ['segment.b.script']
+    assert cache.stats()['entries'] == 3
+
+
+def test_translation_cache_ttl_and_size_eviction():
+    now = {'value': 1000.0}
+    cache = SQLiteTranslationCache(ttl_seconds=60, max_entries=2, clock=lambda: now['value'])
+
+    cache.put_many('en', 'es', {'a': 'uno', 'b': 'dos'})
+    now['value'] += 10
+    assert cache.get_many('en', 'es', ['a']) == {'a': 'uno'}
+    now['value'] += 10
+    cache.put_many('en', 'es', {'c': 'tres'})
+    assert len(cache) == 2
+    assert cache.get_many('en', 'es', ['a', 'b', 'c']) == {'a': 'uno', 'c': 'tres'}
+
+    now['value'] += 45
+    assert cache.get_many('en', 'es', ['a', 'c']) == {'c': 'tres'}
+    assert cache.hits == 4
+    assert cache.misses == 2
+    assert cache.evictions >= 1
+
+
+def test_create_translator_wraps_gpt_translator_with_cache(tmp_path):
+    translator = create_translator('gpt', {
+        'endpoint': 'https://translate.example.com',
+        'api_key': 'key',
+        'cache_path': str(tmp_path / 'cache.sqlite'),
+        'cache_ttl': 3600,
+    })
+    assert isinstance(translator, CachedTranslator)
+    assert isinstance(translator.translator, GPTTranslator)
+    assert translator.cache.ttl_seconds == 3600
+
+    static = create_translator('static', {'cache_path': str(tmp_path / 'cache.sqlite')})
+    assert not isinstance(static, CachedTranslator)
+
+
+def test_gpt_translator_chunks_requests_and_retries_only_missing_keys(monkeypatch):
+    import threading
+
+    translator = GPTTranslator(
+        'https://translate.example.com',
+        'key',
+        max_attempts=3,
+        max_chunk_items=2,
+        max_chunk_chars=50,
+        max_concurrency=3,
+        transport=HTTPTransport(sleep=lambda seconds: None),
+    )
+    lock = threading.Lock()
+    calls = []
+
+    def fake_call_service(payload_items, source_locale, target_locale):
+        ids = [entry['id'] for entry in payload_items]
+        with lock:
+            calls.append(ids)
+            first_attempt = len(calls) <= 3
+        translations = [
+            {'id': entry['id'], 'text': f"{target_locale}:{entry['text']}"}
+            for entry in payload_items
+            if not (first_attempt and entry['id'] == 'k3')
+        ]
+        return {'translations': translations}
+
+    monkeypatch.setattr(translator, '_call_service', fake_call_service)
+
+    items = [
+        TranslationItem('k1', 'short'),
+        TranslationItem('k2', 'short'),
+        TranslationItem('k3', 'short'),
+        TranslationItem('k4', 'x' * 60),
+        TranslationItem('k5', ''),
+    ]
+    result = translator.translate(items, 'es', source_locale='en')
+
+    assert result == {
+        'k1': 'es:short',
+        'k2': 'es:short',
+        'k3': 'es:short',
+        'k4': 'es:' + 'x' * 60,
+    }
+    assert sorted(calls[:3]) == [['k1', 'k2'], ['k3'], ['k4']]
+    assert calls[3:] == [['k3']]
@@ -0,0 +1,77 @@
+import httpx
+import pytest
+
+from context_workers.transport import HTTPTransport, TransportError
+from context_workers.tts import GPTTTSSynthesizer, TTSRequestItem
+from context_workers.video_assembly import CreatomateError, CreatomateRenderConfig, CreatomateRenderer
+
+
+def mock_transport(handler, **kwargs):
+    delays = []
+    transport = HTTPTransport(
+        client=httpx.Client(transport=httpx.MockTransport(handler)),
+        sleep=delays.append,
+        **kwargs,
+    )
+    return transport, delays
+
+
+def test_transport_retries_retryable_status_with_backoff_and_records_metrics():
+    responses = iter([httpx.Response(503, text='busy'), httpx.Response(200, json={'ok': True})])
+    transport, delays = mock_transport(lambda request: next(responses), max_attempts=3, backoff_base=0.5)
+
+    assert transport.post_json('https://gpt.example.com/translate', {'items': []}) == {'ok': True}
+    assert len(delays) == 1 and 0 <= delays[0] <= 0.5
+    metrics = transport.metrics.snapshot()['gpt.example.com']
+    assert metrics['requests'] == 2
+    assert metrics['failures'] == 1
+    assert metrics['retries'] == 1
+
+
+def test_transport_does_not_retry_client_errors():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(400, text='bad payload')
+
+    transport, delays = mock_transport(handler, max_attempts=3)
+    with pytest.raises(TransportError) as excinfo:
+        transport.post_json('https://gpt.example.com/tts', {})
+    assert excinfo.value.status == 400
+    assert excinfo.value.body == 'bad payload'
+    assert len(calls) == 1 and delays == []
+
+
+def test_tts_synthesizer_uses_shared_transport():
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers['authorization'])
+        if len(seen) == 1:
+            raise httpx.ConnectError('reset', request=request)
+        return httpx.Response(200, json={'audio_url': 'https://cdn/fr.mp3', 'segments': [{'id': 'a', 'text': 'Bonjour'}]})
+
+    transport, _ = mock_transport(handler)
+    synthesizer = GPTTTSSynthesizer('https://tts.example.com', 'key', max_attempts=2, transport=transport)
+    synthesis = synthesizer.synthesize([TTSRequestItem('a', 'Hello')], locale='fr', base_locale='en', poi_id='poi')
+
+    assert synthesis.audio_url == 'https://cdn/fr.mp3'
+    assert synthesis.segments == {'a': 'Bonjour'}
+    assert seen == ['Bearer key', 'Bearer key']
+
+
+def test_creatomate_render_maps_http_errors_without_retrying():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(500, text='template missing')
+
+    transport, _ = mock_transport(handler, max_attempts=3)
+    renderer = CreatomateRenderer(CreatomateRenderConfig(template_id='tmpl'), api_key='key', transport=transport)
+    with pytest.raises(CreatomateError) as excinfo:
+        renderer.render({'template_id': 'tmpl'}, execute=True)
+    assert excinfo.value.status == 500
+    assert excinfo.value.details == 'template missing'
+    assert len(calls) == 1
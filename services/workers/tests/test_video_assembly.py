@@ -117,3 +117,73 @@ def test_manifest_includes_segments_and_provenance():
     assert manifest['narrative']['summary'] == narrative.summary
     assert manifest['segments'][0]['asset_id'] == 'asset-1'
     assert manifest['provenance']['script_generator'] == 'static'
+
+
+def test_render_fingerprint_is_canonical_and_config_sensitive():
+    from context_workers.video_assembly import render_fingerprint
+
+    config = CreatomateRenderConfig(template_id='tmpl-123')
+    payload = {'template_id': 'tmpl-123', 'modifications': [{'name': 'poi_name', 'text': 'Felix'}]}
+    reordered = {'modifications': [{'text': 'Felix', 'name': 'poi_name'}], 'template_id': 'tmpl-123'}
+
+    assert render_fingerprint(payload, config) == render_fingerprint(reordered, config)
+    assert render_fingerprint(payload, config) != render_fingerprint(payload, CreatomateRenderConfig(template_id='tmpl-123', transition_ms=250))
+    assert CreatomateRenderer(config).fingerprint(payload) == render_fingerprint(payload, config)
+    localized = render_fingerprint(payload, config, locales=['fr', 'en'])
+    assert localized == render_fingerprint(payload, config, locales=['en', 'fr', 'en'])
+    assert localized != render_fingerprint(payload, config, locales=['en'])
+    assert localized != render_fingerprint(payload, config)
+
+
+def test_storyboard_view_is_cached_and_invalidated_per_section():
+    import copy
+
+    renderer = CreatomateRenderer(CreatomateRenderConfig(template_id='tmpl-123'))
+    storyboard = renderer.build_storyboard(build_sample_narrative(), build_assets(), PoiContext(id='poi-felix', name='Felix'))
+
+    first = storyboard.to_dict()
+    cached_segment = storyboard._view['segments'][id(storyboard.segments[1])][2]
+    second = storyboard.to_dict()
+    assert second == first
+    assert second['segments'][1] is not first['segments'][1]
+    assert storyboard._view['segments'][id(storyboard.segments[1])][2] is cached_segment
+    manifest = renderer.create_manifest(storyboard, renderer.build_render_payload(storyboard))
+    assert manifest['segments'][0] == first['segments'][0]
+
+    segment = storyboard.segments[0]
+    segment.frame.caption = 'Updated frame caption'
+    storyboard.invalidate(segment)
+    third = storyboard.to_dict()
+    assert third['segments'][0]['frame']['caption'] == 'Updated frame caption'
+    assert storyboard._view['segments'][id(storyboard.segments[1])][2] is cached_segment
+
+    clone = copy.deepcopy(storyboard)
+    clone.segments[1].asset_url = 'static://assets/clip2.mp4'
+    assert clone.to_dict()['segments'][1]['asset_url'] == 'static://assets/clip2.mp4'
+    assert storyboard.to_dict()['segments'][1]['asset_url'] == 'https://social.example.com/clip2.mp4'
+
+
+def test_storyboard_view_tracks_mutations_without_invalidate():
+    renderer = CreatomateRenderer(CreatomateRenderConfig(template_id='tmpl-123'))
+    storyboard = renderer.build_storyboard(build_sample_narrative(), build_assets(), PoiContext(id='poi-felix', name='Felix'))
+    payload = renderer.build_render_payload(storyboard)
+    before = storyboard.to_dict()
+
+    # Callers may edit what they get back without touching the cache.
+    before['segments'][0]['tags'].append('leaked')
+    before['segments'][0]['caption'] = 'leaked'
+    assert 'leaked' not in storyboard.to_dict()['segments'][0]['tags']
+
+    segment = storyboard.segments[0]
+    segment.caption = 'Updated caption'
+    segment.subtitles['fr'] = 'Sous-titre'
+    segment.tags.append('night')
+    storyboard.poi = PoiContext(id='poi-felix', name='Felix Rooftop')
+    after = storyboard.to_dict()
+
+    assert after['segments'][0]['caption'] == 'Updated caption'
+    assert after['segments'][0]['subtitles'] == {'fr': 'Sous-titre'}
+    assert after['segments'][0]['tags'][-1] == 'night'
+    assert after['poi']['name'] == 'Felix Rooftop'
+    assert renderer.create_manifest(storyboard, payload)['segments'][0]['caption'] == 'Updated caption'
+    assert renderer.build_render_payload(storyboard) != payload